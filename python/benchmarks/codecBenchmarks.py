@@ -0,0 +1,156 @@
+"""Micro-benchmarks of the message framing and command serialization hot paths.
+
+Run from the benchmarks directory:
+    python codecBenchmarks.py [-o results.json] [--quick]
+
+Results are written as JSON so that runs can be compared across commits.  Throughput is reported in terms of unencoded payload bytes.  Allocations are reported as the peak memory allocated while processing a single frame (or buffer of frames), divided by the number of frames.
+"""
+import sys, os
+sys.path.append('../')
+sys.path.append('../mesh/generic')
+import argparse, json, platform, random, struct, subprocess, time, tracemalloc
+from mesh.generic.slipMsg import SLIPMsg
+from mesh.generic.hdlcMsg import HDLCMsg
+from mesh.generic.slipMsg_li1 import SLIPmsg_Li1
+from mesh.generic.cobsMsg import COBSMsg, COBS_END
+from mesh.generic.msgParser import MsgParser
+from mesh.generic.command import Command
+from mesh.generic.cmds import NodeCmds
+from mesh.generic.deserialize import deserialize
+
+payloadSizes = [16, 64, 256, 1024, 4096]
+escDensities = [0.0, 0.1, 0.5] # fraction of payload bytes that are reserved by the framing protocol
+framesPerBuffer = [1, 8, 32]
+maxMsgLength = 2*max(payloadSizes)
+
+codecs = {'SLIP': lambda: SLIPMsg(maxMsgLength), 'HDLC': lambda: HDLCMsg(maxMsgLength), 'SLIP_Li1': lambda: SLIPmsg_Li1(maxMsgLength), 'COBS': lambda: COBSMsg(maxMsgLength)}
+
+def reservedBytes(codec):
+    """Returns list of bytes that must be escaped by provided codec."""
+    if isinstance(codec, COBSMsg):
+        return [COBS_END]
+    return list(codec.escTable.keys())
+
+def createPayload(size, escDensity, reserved, rand):
+    """Create random payload with requested density of reserved bytes."""
+    reservedValues = set(ord(byte) for byte in reserved)
+    plainValues = [value for value in range(256) if value not in reservedValues]
+    payload = bytearray(size)
+    for i in range(size):
+        if rand.random() < escDensity:
+            payload[i] = ord(rand.choice(reserved))
+        else:
+            payload[i] = rand.choice(plainValues)
+    return bytes(payload)
+
+def timeOp(op, minTime):
+    """Time provided operation, repeating until minimum time is reached.
+
+    Returns:
+        Best time per call of op in seconds.
+    """
+    numCalls = 1
+    while True:
+        start = time.perf_counter()
+        for i in range(numCalls):
+            op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= minTime:
+            break
+        numCalls *= 2
+
+    # Take best of repeated runs
+    best = elapsed / numCalls
+    for i in range(2):
+        start = time.perf_counter()
+        for j in range(numCalls):
+            op()
+        best = min(best, (time.perf_counter() - start) / numCalls)
+    return best
+
+def measureAlloc(op):
+    """Returns peak bytes allocated by a single call of op."""
+    op() # warm up any caches
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    op()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - baseline
+
+def runBenchmark(results, name, op, payloadBytes, numFrames, minTime, params):
+    opTime = timeOp(op, minTime)
+    result = {'benchmark': name}
+    result.update(params)
+    result['mbPerSec'] = payloadBytes / opTime / 1e6
+    result['framesPerSec'] = numFrames / opTime
+    result['allocBytesPerFrame'] = measureAlloc(op) / numFrames
+    results.append(result)
+    print("{:<14} {:<40} {:>10.2f} MB/s {:>12.0f} frames/s {:>10.0f} B/frame".format(name, str(params), result['mbPerSec'], result['framesPerSec'], result['allocBytesPerFrame']))
+
+def benchmarkCodecs(results, minTime, rand):
+    for codecName, createCodec in codecs.items():
+        for size in payloadSizes:
+            for escDensity in escDensities:
+                codec = createCodec()
+                payload = createPayload(size, escDensity, reservedBytes(codec), rand)
+                codec.encodeMsg(payload)
+                encoded = codec.encoded
+                params = {'codec': codecName, 'payloadSize': size, 'escDensity': escDensity}
+
+                runBenchmark(results, 'encode', lambda: codec.encodeMsg(payload), size, 1, minTime, params)
+                runBenchmark(results, 'decode', lambda: codec.parseMsg(encoded, 0), size, 1, minTime, params)
+
+def benchmarkParser(results, minTime, rand):
+    for codecName, createCodec in codecs.items():
+        for size in payloadSizes:
+            for numFrames in framesPerBuffer:
+                msgParser = MsgParser({'parseMsgMax': numFrames}, createCodec())
+                rxBuffer = bytearray()
+                for i in range(numFrames):
+                    rxBuffer += msgParser.encodeMsg(createPayload(size, 0.1, reservedBytes(msgParser.msg), rand))
+                params = {'codec': codecName, 'payloadSize': size, 'framesPerBuffer': numFrames}
+
+                def parse():
+                    msgParser.parseMsgs(rxBuffer, len(rxBuffer))
+                    msgParser.parsedMsgs.clear()
+                runBenchmark(results, 'parseMsgs', parse, size*numFrames, numFrames, minTime, params)
+
+def benchmarkCommands(results, minTime, rand):
+    cmdId = NodeCmds['ParamUpdate']
+    for size in payloadSizes:
+        paramValue = bytes(rand.getrandbits(8) for i in range(size))
+        cmdData = {'destId': 1, 'paramId': 0, 'dataLength': size % 256, 'paramValue': paramValue}
+        cmd = Command(cmdId, cmdData, [cmdId, 1, 1])
+        msgBytes = cmd.serialize()
+        params = {'cmd': 'ParamUpdate', 'payloadSize': size}
+
+        runBenchmark(results, 'serialize', lambda: cmd.serialize(), size, 1, minTime, params)
+        runBenchmark(results, 'deserialize', lambda: deserialize(msgBytes, cmdId), size, 1, minTime, params)
+
+def getCommit():
+    """Returns current git commit if available."""
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run message framing and serialization benchmarks.')
+    parser.add_argument('-o', '--output', default='benchmarkResults.json', help='JSON results output file')
+    parser.add_argument('--quick', action='store_true', help='shorter timing runs')
+    args = parser.parse_args()
+
+    minTime = 0.01 if args.quick else 0.1 # minimum time per timing run (sec)
+    rand = random.Random(0) # fixed seed so payloads are repeatable between runs
+
+    results = []
+    benchmarkCodecs(results, minTime, rand)
+    benchmarkParser(results, minTime, rand)
+    benchmarkCommands(results, minTime, rand)
+
+    output = {'commit': getCommit(), 'python': platform.python_version(), 'time': time.time(), 'results': results}
+    with open(args.output, 'w') as outFile:
+        json.dump(output, outFile, indent=1)
+    print("Results written to " + args.output)
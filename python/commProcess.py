@@ -1,11 +1,15 @@
 from multiprocessing import Process
-import serial, time
+import serial
 from mesh.generic.nodeParams import NodeParams
 from mesh.generic.xbeeRadio import XbeeRadio
 from mesh.generic.li1Radio import Li1Radio
 from mesh.generic.udpRadio import UDPRadio
+from mesh.generic.shmRadio import ShmRadio
+from mesh.generic.commEventLoop import CommEventLoop
+from mesh.generic.deadlineScheduler import DeadlineScheduler
 #from mesh.generic.slipMsgParser import SLIPMsgParser
 from mesh.generic.hdlcMsg import HDLCMsg
+from mesh.generic.cobsMsg import COBSMsg
 from mesh.generic.slipMsg import SLIPMsg
 from mesh.generic.msgParser import MsgParser
 from mesh.generic.serialComm import SerialComm    
@@ -24,9 +28,15 @@ class CommProcess(Process):
         self.nodeParams = NodeParams(configFile=configFile)
 
         # Node/Comm interface
-        interfaceConfig = {'uartNumBytesToRead': self.nodeParams.config.uartNumBytesToRead, 'rxBufferSize': self.nodeParams.config.rxBufferSize, 'ipAddr': self.nodeParams.config.interface['nodeCommIntIP'], 'readPort': self.nodeParams.config.interface['commRdPort'], 'writePort': self.nodeParams.config.interface['commWrPort']}
+        interface = self.nodeParams.config.interface
+        if interface['type'] == "shm": # shared memory connection to node control process
+            interfaceConfig = {'uartNumBytesToRead': self.nodeParams.config.uartNumBytesToRead, 'rxBufferSize': self.nodeParams.config.rxBufferSize, 'readName': interface['shmName'] + str(meshNum) + 'Rd', 'writeName': interface['shmName'] + str(meshNum) + 'Wr', 'shmSize': interface['shmSize'], 'wakeup': interface['shmWakeup']}
+            interfaceRadio = ShmRadio(interfaceConfig)
+        else: # UDP connection to node control process
+            interfaceConfig = {'uartNumBytesToRead': self.nodeParams.config.uartNumBytesToRead, 'rxBufferSize': self.nodeParams.config.rxBufferSize, 'ipAddr': interface['nodeCommIntIP'], 'readPort': interface['commRdPort'], 'writePort': interface['commWrPort']}
+            interfaceRadio = UDPRadio(interfaceConfig)
         #self.interface = SerialComm([], UDPRadio(interfaceConfig), SLIPMsgParser({'parseMsgMax': self.nodeParams.config.parseMsgMax}))
-        self.interface = SerialComm([], self.nodeParams, UDPRadio(interfaceConfig), MsgParser({'parseMsgMax': self.nodeParams.config.parseMsgMax}, SLIPMsg(256))) # UDP connection to node control process
+        self.interface = SerialComm([], self.nodeParams, interfaceRadio, MsgParser({'parseMsgMax': self.nodeParams.config.parseMsgMax})) # connection to node control process (messages delimited by datagrams)
 
         # Interprocess data package (Google protocol buffer interface to node control process)
         self.dataPackage = NodeThreadMsg()
@@ -43,6 +53,9 @@ class CommProcess(Process):
 
         # Radio
         radioConfig = {'uartNumBytesToRead': self.nodeParams.config.uartNumBytesToRead, 'rxBufferSize': self.nodeParams.config.rxBufferSize}
+        if self.nodeParams.config.commConfig['txPacing']:
+            radioConfig['txRate'] = self.nodeParams.config.meshBaudrate/10.0 # bytes per second including start and stop bits
+            radioConfig['txFifoSize'] = self.nodeParams.config.commConfig['fpgaFifoSize'] if self.nodeParams.config.commConfig['fpga'] else self.nodeParams.config.commConfig['radioFifoSize']
         if (self.nodeParams.config.commConfig['fpga'] == True):
             from mesh.generic.fpgaRadio import FPGARadio
             radio = FPGARadio(ser, radioConfig)
@@ -56,6 +69,8 @@ class CommProcess(Process):
         parserConfig = {'parseMsgMax': self.nodeParams.config.parseMsgMax}
         if self.nodeParams.config.msgParsers[meshNum] == "HDLC":
             msgParser = MsgParser(parserConfig, HDLCMsg(256))
+        elif self.nodeParams.config.msgParsers[meshNum] == "COBS":
+            msgParser = MsgParser(parserConfig, COBSMsg(256))
         elif self.nodeParams.config.msgParsers[meshNum] == "standard":
             msgParser = MsgParser(parserConfig)
 
@@ -69,6 +84,19 @@ class CommProcess(Process):
         self.comm = TDMAComm([], radio, msgParser, self.nodeParams)
         self.meshController = MeshController(self.nodeParams, self.comm)
 
+        # Event loop (waits on radio, interface, and TDMA schedule instead of polling continuously)
+        self.eventLoop = None
+        if (self.nodeParams.config.commConfig['eventLoop'] == True and self.nodeParams.config.commConfig['fpga'] == False):
+            self.eventLoop = CommEventLoop(clockSource=self.nodeParams.clockSource)
+            self.eventLoop.register(self.comm.radio)
+            self.eventLoop.register(self.interface.radio)
+
+        # Deadline scheduler (sleeps until shortly before TDMA events and spins the remainder)
+        self.scheduler = None
+        if (self.eventLoop == None and self.nodeParams.config.commConfig['deadlineScheduler'] == True and self.nodeParams.config.commConfig['fpga'] == False):
+            self.scheduler = DeadlineScheduler(self.nodeParams.clockSource, self.nodeParams.config.commConfig['spinTime'])
+            self.comm.blockingSleep = False # sleep period waited by scheduler
+
         # Node control run time bounds
         if (self.nodeParams.config.commConfig['fpga'] == False): # only needed for software-controlled comm
             if self.comm.transmitSlot == 1: # For first node, run any time after transmit slot
@@ -83,7 +111,7 @@ class CommProcess(Process):
         while 1:
             try:
                 # Check for loss of node commands
-                if self.lastNodeCmdTime and (time.time() - self.lastNodeCmdTime) > 5.0:
+                if self.lastNodeCmdTime and (self.nodeParams.clockSource.getTime() - self.lastNodeCmdTime) > 5.0:
                     # No node interface link so disable comm 
                     self.comm.enabled = False
                 else:
@@ -93,13 +121,13 @@ class CommProcess(Process):
                 self.interface.readMsgs()
                 
                 # Parse protocol buffer messages 
-                for msg in self.interface.msgParser.parsedMsgs: # Process received messages
+                for msg in self.interface.msgParser.getMsgs(): # Process received messages
                     nodeMsg = NodeThreadMsg()
                     nodeMsg.ParseFromString(msg)
                     
                     # Check if new message
                     if (nodeMsg.timestamp > 0.0 and nodeMsg.timestamp > self.dataPackage.timestamp):
-                        self.lastNodeCmdTime = time.time()
+                        self.lastNodeCmdTime = self.nodeParams.clockSource.getTime()
                         self.dataPackage = nodeMsg
                    
      
@@ -107,8 +135,7 @@ class CommProcess(Process):
                         if (nodeMsg.cmds): # commands received
                             for cmd in nodeMsg.cmds:
                                 self.meshController.sendMsg(cmd.destId, cmd.msgBytes)
-                
-                self.interface.msgParser.parsedMsgs = [] # clear out processed parsed messages
+
                 
                 # Execute network
                 self.meshController.execute()
@@ -141,6 +168,13 @@ class CommProcess(Process):
                 meshMsgsBytes = meshMsgs.SerializeToString()        
 
                 self.interface.sendBytes(meshMsgsBytes) 
+
+                # Wait for received data or next TDMA event
+                if self.eventLoop:
+                    self.eventLoop.setMonitored(self.comm.radio, self.comm.isReadPending())
+                    self.eventLoop.wait(self.comm.getNextEventTime(self.nodeParams.clockSource.getTime()))
+                elif self.scheduler:
+                    self.scheduler.waitForNextEvent(self.comm)
                 
             except KeyboardInterrupt:
                 print("\nTerminating Comm Process.")
@@ -0,0 +1,189 @@
+import asyncio
+from mesh.generic.datagramRadio import DatagramRadio
+from mesh.generic.meshTxQueue import MeshMsgPriority
+
+class AsyncRadio(object):
+    """asyncio adapter that waits for received data on a Radio without blocking the event loop.
+
+    Radios that provide a file descriptor (see Radio.fileno) are monitored by the event loop, otherwise the radio is polled at pollInterval.
+
+    Attributes:
+        radio: Radio being monitored.
+        pollInterval: Wait time for radios without a file descriptor.
+    """
+
+    def __init__(self, radio, pollInterval=0.001):
+        self.radio = radio
+        self.pollInterval = pollInterval
+
+    async def waitForData(self, timeout):
+        """Wait until radio has received data or timeout has elapsed.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            True if radio has received data.
+        """
+        if hasattr(self.radio, 'waitForData'): # radio provides its own asyncio wait
+            return await self.radio.waitForData(timeout)
+
+        fd = self.radio.fileno()
+        if fd is None: # poll radio
+            await asyncio.sleep(min(timeout, self.pollInterval))
+            return False
+
+        loop = asyncio.get_running_loop()
+        dataReceived = loop.create_future()
+        loop.add_reader(fd, lambda: dataReceived.done() or dataReceived.set_result(True))
+        try:
+            return await asyncio.wait_for(dataReceived, timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            loop.remove_reader(fd)
+
+class DatagramEndpointProtocol(asyncio.DatagramProtocol):
+    """Datagram protocol that queues received datagrams for an AsyncUDPRadio."""
+
+    def __init__(self, radio):
+        self.radio = radio
+
+    def datagram_received(self, data, addr):
+        self.radio.rxDatagrams.append(data)
+        self.radio.rxEvent.set()
+
+class AsyncUDPRadio(DatagramRadio):
+    """Radio interface over asyncio UDP datagram endpoints.  Instances must be created with the create coroutine from within a running event loop.
+
+    Received datagrams are queued by the endpoint protocol and added to the receive buffer when read, so this radio is used the same way as UDPRadio.
+
+    Attributes:
+        rxDatagrams: Received datagrams not yet read.
+        rxEvent: Event set when datagrams are received.
+        readTransport: Transport of endpoint bound to read port.
+        writeTransport: Transport of endpoint connected to write port.
+    """
+
+    def __init__(self, config):
+        DatagramRadio.__init__(self, [], config)
+        self.rxDatagrams = []
+        self.rxEvent = asyncio.Event()
+        self.readTransport = None
+        self.writeTransport = None
+
+    @classmethod
+    async def create(cls, config):
+        """Create radio and open its datagram endpoints."""
+        radio = cls(config)
+        loop = asyncio.get_running_loop()
+        radio.readTransport, protocol = await loop.create_datagram_endpoint(lambda: DatagramEndpointProtocol(radio), local_addr=(config['ipAddr'], config['readPort']))
+        radio.writeTransport, protocol = await loop.create_datagram_endpoint(asyncio.DatagramProtocol, remote_addr=(config['ipAddr'], config['writePort']))
+        return radio
+
+    def fileno(self):
+        """Returns None since received data is delivered by the event loop (see waitForData)."""
+        return None
+
+    async def waitForData(self, timeout):
+        """Wait until datagrams have been received or timeout has elapsed."""
+        if not self.rxDatagrams:
+            self.rxEvent.clear()
+            try:
+                await asyncio.wait_for(self.rxEvent.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+        return len(self.rxDatagrams) > 0
+
+    def readBytes(self, bufferFlag):
+        """Add received datagrams to receive buffer.  Datagrams that do not fit in the receive buffer are retained until the next read."""
+        if bufferFlag == False: # replace buffer contents with new bytes
+            self.clearRxBuffer()
+
+        bytesRead = 0
+        numRead = 0
+        for datagram in self.rxDatagrams:
+            if not self.bufferDatagram(datagram): # receive buffer full
+                break
+            bytesRead += len(datagram)
+            numRead += 1
+        del self.rxDatagrams[:numRead]
+
+        return bytesRead
+
+    def sendBytes(self, msgBytes):
+        """Send bytes as a single datagram."""
+        if not self.writeTransport:
+            return 0
+        self.writeTransport.sendto(bytes(msgBytes))
+        return len(msgBytes)
+
+    def close(self):
+        for transport in [self.readTransport, self.writeTransport]:
+            if transport:
+                transport.close()
+
+class AsyncMeshController(object):
+    """asyncio interface to a MeshController.  Messages to send are passed directly to the mesh controller transmit queue, and received messages are transferred to a queue on each execution.
+
+    Attributes:
+        meshController: Mesh controller instance.
+        rxQueue: Messages received from the mesh network.
+    """
+
+    def __init__(self, meshController):
+        self.meshController = meshController
+        self.rxQueue = asyncio.Queue()
+
+    async def sendMsg(self, destId, msg, priority=MeshMsgPriority.state, lifetime=None):
+        """Queue message for transmission over the mesh network.
+
+        Args:
+            destId: Destination node id (0 for broadcast).
+            msg: Message bytes.
+            priority: Message priority class.
+            lifetime: Time after which message is discarded if not yet sent (defaults to configured msgLifetime, 0 for no expiry).
+
+        Returns:
+            False if message is too large or was dropped because the transmit queue is full.
+        """
+        return self.meshController.sendMsg(destId, msg, priority, lifetime)
+
+    async def getMsg(self):
+        """Wait for next message received from the mesh network."""
+        return await self.rxQueue.get()
+
+    def execute(self):
+        """Execute mesh controller and queue received messages."""
+        self.meshController.execute()
+
+        for msg in self.meshController.getMsgs():
+            self.rxQueue.put_nowait(msg)
+
+async def runTDMAComm(comm, meshController=None):
+    """Coroutine that executes the TDMA frame loop, awaiting slot deadlines and received data instead of blocking.  The loop runs until cancelled.
+
+    Several networks can be run in one process by running a frame loop for each network concurrently.
+
+    Args:
+        comm: TDMAComm instance.
+        meshController: Optional AsyncMeshController for this network.
+    """
+    comm.blockingSleep = False # sleep period is awaited
+    asyncRadio = AsyncRadio(comm.radio)
+
+    while True:
+        if meshController: # mesh controller also executes comm
+            meshController.execute()
+        else:
+            comm.execute()
+
+        # Wait until next TDMA event or received data
+        currentTime = comm.nodeParams.clockSource.getTime()
+        timeout = comm.getNextEventTime(currentTime) - currentTime
+        if timeout <= 0:
+            await asyncio.sleep(0) # yield to other tasks
+        elif comm.isReadPending():
+            await asyncRadio.waitForData(timeout)
+        else:
+            await asyncio.sleep(timeout)
@@ -1,4 +1,49 @@
-from struct import unpack
+from struct import pack
+from itertools import accumulate
+
+class FletcherChecksum(object):
+    """Incremental 8-bit Fletcher checksum for Li-1 radio packets.
+
+    Bytes can be added to the checksum in multiple pieces, so a header and payload can be checksummed without concatenating them.  Each update sums the provided bytes as a whole buffer rather than stepping through them individually.
+
+    Attributes:
+        ck_A: Running sum of message bytes.
+        ck_B: Running sum of ck_A values.
+    """
+
+    def __init__(self, msgBytes=b''):
+        self.ck_A = 0
+        self.ck_B = 0
+        if msgBytes:
+            self.update(msgBytes)
+
+    def update(self, msgBytes):
+        """Add bytes to checksum.
+
+        Args:
+            msgBytes: Raw message bytes to add to checksum.
+        """
+        # ck_B accumulates ck_A after each byte, so the current ck_A is added once per new byte
+        self.ck_B = (self.ck_B + len(msgBytes)*self.ck_A + sum(accumulate(msgBytes))) & 0xFF
+        self.ck_A = (self.ck_A + sum(msgBytes)) & 0xFF
+
+    def checksum(self):
+        """Returns checksum values."""
+        return [self.ck_A, self.ck_B]
+
+    def pack(self):
+        """Returns checksum packed into bytes."""
+        return pack('BB', self.ck_A, self.ck_B)
+
+    def compare(self, checksumBytes):
+        """Compare checksum against provided checksum bytes.
+
+        Args:
+            checksumBytes: Checksum to compare against.
+        Returns:
+            A boolean of whether checksum matched or not.
+        """
+        return len(checksumBytes) == 2 and checksumBytes[0] == self.ck_A and checksumBytes[1] == self.ck_B
 
 def calc8bitFletcherChecksum(msgBytes):
     """Calculate 8-bit Fletcher checksum for Li-1 radio packets.
@@ -6,13 +51,7 @@ def calc8bitFletcherChecksum(msgBytes):
     Args:
         msgBytes: Raw message bytes to calculate checksum of.
     """
-    ck_A = 0
-    ck_B = 0
-    for msgByte in msgBytes:
-        ck_A += int(msgByte)
-        ck_B += ck_A
-
-    return [ck_A & 0xFF, ck_B & 0xFF]
+    return FletcherChecksum(msgBytes).checksum()
 
 def compareChecksum(msgBytes, checksumBytes):
     """Compute and compare Li-1 message checksum.
@@ -24,10 +63,4 @@ def compareChecksum(msgBytes, checksumBytes):
         A boolean of whether checksum matched or not.
 """
 
-    checksum = calc8bitFletcherChecksum(msgBytes)
-    msgChecksum = list(unpack('BB', checksumBytes))
-
-    if checksum == msgChecksum:
-        return True # check sum matches
-    else:
-        return False
+    return FletcherChecksum(msgBytes).compare(checksumBytes)
@@ -0,0 +1,38 @@
+import time
+
+class SystemClock(object):
+    """Clock source that provides the system time.  Used by default for normal (real-time) operation."""
+    realTime = True
+
+    def getTime(self):
+        """Returns current system time."""
+        return time.time()
+
+    def sleep(self, duration):
+        """Block for provided duration."""
+        time.sleep(duration)
+
+class SimClock(object):
+    """Simulated clock source whose time only changes when it is advanced, allowing simulations to run faster (or slower) than real time.
+
+    Attributes:
+        time: Current simulated time.
+    """
+    realTime = False
+
+    def __init__(self, startTime=0.0):
+        self.time = startTime
+
+    def getTime(self):
+        """Returns current simulated time."""
+        return self.time
+
+    def sleep(self, duration):
+        """Advance simulated time by provided duration."""
+        if duration > 0:
+            self.time += duration
+
+    def advanceTo(self, newTime):
+        """Advance simulated time to provided time.  Time never moves backwards."""
+        if newTime > self.time:
+            self.time = newTime
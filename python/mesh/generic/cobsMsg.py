@@ -0,0 +1,80 @@
+from struct import pack
+from mesh.generic.crc import CRC16
+from mesh.generic.delimitedMsg import DelimitedMsg
+
+COBS_END = pack('B', 0)
+COBS_MAX_BLOCK = 254 # maximum number of data bytes in a COBS block
+
+class COBSMsg(DelimitedMsg):
+    """An implementation of Consistent Overhead Byte Stuffing (COBS) message framing.
+
+    COBS removes all zero bytes from the message contents by splitting the message into blocks that are each prefixed by a code byte giving the distance to the next removed zero.  Zero bytes are then used to delimit messages.  Unlike SLIP and HDLC escaping, the encoding overhead is bounded at one byte per 254 message bytes.  A CRC-16 is appended to each message before encoding.  Message parsing is provided by DelimitedMsg.
+
+    Attributes:
+        buffer: Encoded bytes of block whose contents (or following zero) are not yet known.
+    """
+
+    def __init__(self, maxLength):
+        DelimitedMsg.__init__(self, maxLength, COBS_END, CRC16, CRC16.length)
+
+    def getMsgView(self, byteList, pos, end):
+        if (byteList[pos] == end - pos): # single block with no removed zeros
+            return memoryview(byteList)[pos+1:end]
+        return None
+
+    def unstuffBytes(self, rawBytes, partial):
+        """Decode COBS blocks in raw message bytes and append them to the decoded message.  Invalid blocks that extend past the end of the message are decoded as-is and rejected by the CRC check.
+
+        Args:
+            rawBytes: Raw message bytes containing no END bytes.
+            partial: Flag indicating whether more message bytes are still to come.
+        """
+        if (self.buffer): # prepend block held back from previous bytes
+            rawBytes = self.buffer + rawBytes
+            self.buffer = b''
+
+        decoded = []
+        pos = 0
+        while pos < len(rawBytes):
+            code = rawBytes[pos]
+            end = pos + code
+            if (partial and end >= len(rawBytes)): # hold back block until it is known whether a zero follows
+                self.buffer = rawBytes[pos:]
+                break
+            decoded.append(rawBytes[pos+1:end])
+            pos = end
+            if code <= COBS_MAX_BLOCK and pos < len(rawBytes): # block followed by removed zero
+                decoded.append(COBS_END)
+
+        self.appendMsgBytes(b''.join(decoded))
+
+    def stuffBytes(self, msgBytes):
+        """Encode blocks between zero bytes of provided message contents."""
+        encoded = []
+        for block in msgBytes.split(COBS_END):
+            while len(block) >= COBS_MAX_BLOCK: # maximum length block with no following zero
+                encoded.append(pack('B', COBS_MAX_BLOCK + 1))
+                encoded.append(block[:COBS_MAX_BLOCK])
+                block = block[COBS_MAX_BLOCK:]
+            encoded.append(pack('B', len(block) + 1))
+            encoded.append(block)
+
+        return b''.join(encoded)
+
+    def maxEncodedLength(self, msgLength):
+        """Returns the worst case length of an encoded message including framing bytes.
+
+        Args:
+            msgLength: Length of message contents.
+        """
+        msgLength += self.crcLength
+        return msgLength + msgLength // COBS_MAX_BLOCK + 3
+
+    def encodedLength(self, msgBytes, extraLength=0):
+        """Returns the length of provided message contents once encoded including framing bytes (COBS overhead does not depend on the message contents).
+
+        Args:
+            msgBytes: Message contents.
+            extraLength: Number of additional message bytes.
+        """
+        return self.maxEncodedLength(len(msgBytes) + extraLength)
@@ -0,0 +1,67 @@
+import selectors
+from mesh.generic.clockSource import SystemClock
+
+class CommEventLoop(object):
+    """Waits until data is received on a communication link or the next scheduled event time is reached, instead of continuously polling the links.
+
+    Links are any objects with a fileno method (e.g. Radio).  Links that cannot provide a file descriptor are polled at pollInterval.
+
+    Attributes:
+        selector: Selector that monitors link file descriptors.
+        fds: File descriptor of each registered link (None if link cannot be monitored).
+        monitored: Registered links currently being monitored.
+        pollInterval: Maximum time to wait when a monitored link has no file descriptor.
+        clockSource: Source of time for event times (defaults to system clock).
+    """
+
+    def __init__(self, pollInterval=0.001, clockSource=None):
+        self.selector = selectors.DefaultSelector()
+        self.fds = dict()
+        self.monitored = set()
+        self.pollInterval = pollInterval
+        self.clockSource = clockSource if clockSource else SystemClock()
+
+    def register(self, link):
+        """Add communication link to be monitored for received data."""
+        self.fds[link] = link.fileno()
+        self.setMonitored(link, True)
+
+    def setMonitored(self, link, monitored):
+        """Enable or disable monitoring of a registered link.  Links with unread data should not be monitored while the data is not being read, otherwise wait will return immediately.
+
+        Args:
+            link: Registered link.
+            monitored: Flag indicating whether link should wake the event loop.
+        """
+        if (link in self.monitored) == monitored:
+            return
+
+        if monitored:
+            self.monitored.add(link)
+            if self.fds[link] is not None:
+                self.selector.register(self.fds[link], selectors.EVENT_READ, link)
+        else:
+            self.monitored.discard(link)
+            if self.fds[link] is not None:
+                self.selector.unregister(self.fds[link])
+
+    def wait(self, eventTime, currentTime=None):
+        """Wait for received data or until provided event time.
+
+        Args:
+            eventTime: Time of next scheduled event.
+            currentTime: Current time (defaults to current time of clock source).
+
+        Returns:
+            List of links with received data.
+        """
+        if currentTime == None:
+            currentTime = self.clockSource.getTime()
+        timeout = max(0.0, eventTime - currentTime)
+        if any(self.fds[link] is None for link in self.monitored): # link must be polled
+            timeout = min(timeout, self.pollInterval)
+
+        return [key.data for key, events in self.selector.select(timeout)]
+
+    def close(self):
+        self.selector.close()
@@ -0,0 +1,89 @@
+import struct
+import crcmod
+
+class CrcCalc(object):
+    """CRC calculator for a single CRC polynomial.
+
+    CRC lookup tables are generated once when the calculator is created, so a single instance should be shared by all users of the same CRC definition (see getCrcCalc).  CRC values are appended to messages in little-endian byte order.
+
+    Attributes:
+        poly: CRC polynomial.
+        initCrc: Initial CRC value.
+        length: Length of CRC in bytes.
+        crcFun: Compiled CRC function.
+        crcStruct: Precompiled struct for packing and unpacking CRC values.
+    """
+
+    def __init__(self, poly, initCrc, length, rev=False):
+        self.poly = poly
+        self.initCrc = initCrc
+        self.length = length
+        self.crcFun = crcmod.mkCrcFun(poly, initCrc=initCrc, xorOut=0, rev=rev)
+        if (length == 1):
+            self.crcStruct = struct.Struct('<B')
+        else:
+            self.crcStruct = struct.Struct('<H')
+
+    def __call__(self, msgBytes, crc=None):
+        """Calculate CRC of provided bytes.
+
+        Args:
+            msgBytes: Bytes to calculate CRC of.
+            crc: Running CRC value of preceding bytes (defaults to initial CRC value).
+        """
+        if crc == None:
+            return self.crcFun(msgBytes)
+        return self.crcFun(msgBytes, crc)
+
+    def pack(self, crc):
+        """Pack CRC value into bytes."""
+        return self.crcStruct.pack(crc)
+
+    def checkMsg(self, msgBytes, crc=None):
+        """Check CRC of message with CRC appended.
+
+        Args:
+            msgBytes: Message bytes followed by message CRC.
+            crc: Precomputed CRC of message bytes excluding the appended CRC (computed if not provided).
+
+        Returns:
+            A boolean of whether CRC matched or not.
+        """
+        if len(msgBytes) <= self.length: # no message contents
+            return False
+
+        if crc == None:
+            crc = self.crcFun(msgBytes[:-self.length])
+
+        return self.crcStruct.unpack_from(msgBytes, len(msgBytes) - self.length)[0] == crc
+
+    def checkMsgs(self, msgs):
+        """Check CRC of a batch of messages.
+
+        Args:
+            msgs: List of tuples of message bytes with CRC appended and precomputed CRC (None if not precomputed).
+
+        Returns:
+            List of valid message contents with CRCs removed and the number of messages with invalid CRCs.
+        """
+        validMsgs = []
+        for msgBytes, crc in msgs:
+            if self.checkMsg(msgBytes, crc):
+                validMsgs.append(msgBytes[:-self.length])
+
+        return validMsgs, len(msgs) - len(validMsgs)
+
+crcCalcs = dict() # shared CRC calculators
+
+def getCrcCalc(poly, initCrc, length, rev=False):
+    """Get shared CRC calculator for requested CRC definition, creating it if necessary."""
+    key = (poly, initCrc, rev)
+    if key not in crcCalcs:
+        crcCalcs[key] = CrcCalc(poly, initCrc, length, rev)
+
+    return crcCalcs[key]
+
+# Standard mesh network CRCs
+CRC8 = getCrcCalc(0x107, 0x0, 1)
+CRC16 = getCrcCalc(0x11021, 0xFFFF, 2)
+CRC16_ARC = getCrcCalc(0x18005, 0x0, 2, True) # crcmod predefined 'crc16'
@@ -0,0 +1,100 @@
+from collections import deque
+from mesh.generic.radio import Radio
+
+class DatagramRadio(Radio):
+    """Base interface for radios that transfer discrete messages (datagrams) rather than a byte stream.
+
+    The length of each unread datagram in the receive buffer is retained so that messages delimited by datagram boundaries can be retrieved without further framing (see getRxDatagrams).  Each queued transmit frame is sent as a separate datagram.
+
+    Attributes:
+        rxDatagramLengths: Lengths of unread datagrams in the receive buffer in the order received.
+        txDropCount: Number of paced frames dropped because they are larger than the radio transmit FIFO.
+    """
+
+    def __init__(self, serial, config):
+        self.rxDatagramLengths = deque()
+        self.txDropCount = 0
+        Radio.__init__(self, serial, config)
+
+    def clearRxBuffer(self):
+        Radio.clearRxBuffer(self)
+        self.rxDatagramLengths.clear()
+
+    def bufferDatagram(self, datagram):
+        """Add received datagram to receive buffer.
+
+        Args:
+            datagram: Received datagram bytes (or list of pieces of datagram).
+
+        Returns:
+            False if there is not currently room for the datagram in the receive buffer.
+        """
+        pieces = datagram if isinstance(datagram, list) else [datagram]
+        length = sum(len(piece) for piece in pieces)
+        if length > len(self.rxBuffer) - self.bytesInRxBuffer:
+            if self.bytesInRxBuffer > 0: # wait for buffer to be read
+                return False
+            else: # datagram larger than buffer so discard
+                self.rxOverflowCount += length
+                return True
+
+        if length > 0:
+            for piece in pieces:
+                self.bufferRxMsg(piece, True)
+            self.rxDatagramLengths.append(length)
+
+        return True
+
+    def consumeRxBytes(self, numBytes):
+        Radio.consumeRxBytes(self, numBytes)
+
+        # Remove datagrams that have been read
+        numUnread = 0
+        for i in range(len(self.rxDatagramLengths)-1, -1, -1):
+            if numUnread + self.rxDatagramLengths[i] >= self.bytesInRxBuffer: # first unread datagram
+                self.rxDatagramLengths[i] = self.bytesInRxBuffer - numUnread
+                for j in range(i):
+                    self.rxDatagramLengths.popleft()
+                break
+            numUnread += self.rxDatagramLengths[i]
+        if self.bytesInRxBuffer == 0:
+            self.rxDatagramLengths.clear()
+
+    def getRxDatagrams(self):
+        """Returns unread datagrams in the order received.  Datagrams are memoryviews into the receive buffer unless they wrap around the end of the buffer."""
+        datagrams = []
+        rxBytes = memoryview(self.rxBuffer)
+        pos = self.rxReadPos
+        for length in self.rxDatagramLengths:
+            end = pos + length
+            if end <= len(self.rxBuffer):
+                datagrams.append(rxBytes[pos:end])
+            else: # datagram wraps around end of buffer
+                end -= len(self.rxBuffer)
+                datagrams.append(bytes(rxBytes[pos:]) + bytes(rxBytes[:end]))
+            pos = end % len(self.rxBuffer)
+
+        return datagrams
+
+    def sendBuffer(self, maxBytesToSend=0, deadline=None):
+        """Send queued frames as separate datagrams.  Frames are not split, so at least one frame is sent even if it exceeds maxBytesToSend.  Paced frames are only sent once they fit within the transmit allowance (see Radio.getTxAllowance), and frames that can never fit in the radio transmit FIFO are dropped."""
+        bytesSent = 0
+        bytesConsumed = 0
+
+        allowance = self.getTxAllowance(deadline)
+        for frame in self.txQueue.getSpans():
+            frameLength = self.encodedTxLength(len(frame))
+            if allowance != None and self.txFifoSize and frameLength > self.txFifoSize: # frame can never be sent
+                self.txDropCount += 1
+                bytesConsumed += len(frame)
+                continue
+            if allowance != None and bytesSent + frameLength > allowance: # paced transmission limit reached
+                break
+            if bytesSent > 0 and maxBytesToSend > 0 and bytesSent + frameLength > maxBytesToSend: # no room for next frame
+                break
+            self.sendMsg(frame)
+            bytesSent += frameLength
+            bytesConsumed += len(frame)
+        self.txQueue.consume(bytesConsumed)
+
+        return bytesSent
@@ -0,0 +1,52 @@
+from mesh.generic.clockSource import SystemClock
+
+class DeadlineScheduler(object):
+    """Waits for TDMA schedule deadlines without polling continuously.
+
+    The scheduler sleeps coarsely until shortly before a deadline and then spins for the remaining time, since sleeping alone can overshoot by the operating system scheduling granularity.  While a comm is reading received data, it is woken at pollInterval instead (without spinning).  Simulated clocks are advanced directly to the deadline.
+
+    Attributes:
+        clockSource: Source of current time.
+        spinTime: Time before a deadline at which sleeping stops and spinning begins.
+        pollInterval: Wait time while received data is being read.
+    """
+
+    def __init__(self, clockSource=None, spinTime=0.001, pollInterval=0.001):
+        self.clockSource = clockSource if clockSource else SystemClock()
+        self.spinTime = spinTime
+        self.pollInterval = pollInterval
+
+    def waitUntil(self, deadline, spin=True):
+        """Wait until provided deadline.
+
+        Args:
+            deadline: Time to wait until.
+            spin: Flag indicating that the end of the wait is spun for accuracy.
+
+        Returns:
+            Lateness of wake up relative to deadline.
+        """
+        remaining = deadline - self.clockSource.getTime()
+        if not self.clockSource.realTime: # simulated time
+            self.clockSource.sleep(remaining)
+            return 0.0
+
+        if remaining > self.spinTime or (remaining > 0 and not spin):
+            self.clockSource.sleep(remaining - self.spinTime if spin else remaining)
+        if spin:
+            while self.clockSource.getTime() < deadline:
+                pass
+
+        return self.clockSource.getTime() - deadline
+
+    def waitForNextEvent(self, comm):
+        """Wait until next TDMA schedule event of provided comm (see TDMAComm.getNextEventTime).
+
+        Returns:
+            Lateness of wake up relative to event time.
+        """
+        currentTime = self.clockSource.getTime()
+        eventTime = comm.getNextEventTime(currentTime)
+        if comm.isReadPending() and currentTime + self.pollInterval < eventTime: # poll for received data
+            return self.waitUntil(currentTime + self.pollInterval, False)
+        return self.waitUntil(eventTime)
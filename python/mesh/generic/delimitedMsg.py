@@ -0,0 +1,216 @@
+class DelimitedMsg(object):
+    """Framing engine for message formats that delimit encoded messages with an END byte that never appears in the encoded contents.
+
+    Message delimiters are located with find instead of stepping through the raw bytes one at a time, and the CRC of a message is computed as its contents are decoded.  Complete messages that require no decoding are returned as memoryviews into the raw serial data rather than copies.  Subclasses provide the encoding of the message contents by implementing stuffBytes, unstuffBytes, getMsgView, maxEncodedLength and encodedLength.
+
+    Attributes:
+        msg: Decoded message with framing characters removed (may be a memoryview into the raw serial data).
+        msgFound: Boolean flag to indicate whether a message has been found in the provided raw serial byte data.
+        msgMaxLength: Maximum length of valid messages.
+        msgEnd: Location of end of message found in provided raw serial data array.
+        msgLength: Length of decoded message.
+        encoded: Encoded message for transmission.
+        buffer: Encoded bytes awaiting the remainder of their encoding before they can be decoded.
+        crc: Shared CRC calculator (None if the message format does not include a CRC).
+        crcLength: Length of message CRC in bytes.
+        crcValue: Running CRC of decoded message bytes.
+        crcPos: Number of decoded message bytes included in crcValue.
+        endByte: Message delimiter byte.
+    """
+
+    def __init__(self, maxLength, endByte, crc=None, crcLength=0):
+        self.msgMaxLength = maxLength
+        self.msgFound = False
+        self.msgEnd = -1
+        self.msgLength = 0
+        self.msg = b''
+        self.encoded = b''
+        self.buffer = b''
+        self.crc = crc
+        self.crcLength = crcLength
+        self.crcValue = None
+        self.crcPos = 0
+        self.endByte = endByte
+
+    def parseMsg(self, msgBytes, msgStart, length=None):
+        if length == None:
+            length = len(msgBytes)
+
+        if length > 0:
+            # Process serial message
+            self.decodeMsg(msgBytes, msgStart, length)
+
+            if self.msgFound == True: # Message start found
+                if self.msgEnd != -1: # entire msg found
+                    if self.crcLength == 0: # no CRC to check
+                        return self.msg
+
+                    # Check msg CRC
+                    if self.crc.checkMsg(self.msg, self.getMsgCrc()): # CRC matches - valid message
+                        return self.msg[:-self.crcLength]
+
+        return [] # no message found
+
+    def parseMsgs(self, msgBytes, length=None, start=0):
+        """Decodes all complete messages in provided raw serial bytes and verifies their CRCs as a batch.  Any partial message at the end of the bytes is retained.
+
+        Args:
+            msgBytes: Raw serial data to be parsed.
+            length: Number of valid bytes in msgBytes (defaults to entire array).
+            start: Position of first valid byte in msgBytes.
+
+        Returns:
+            List of valid messages and the number of messages rejected for invalid CRC.
+        """
+        if length == None:
+            length = len(msgBytes)
+
+        # Decode messages
+        msgs = []
+        msgEnd = start
+        while msgEnd < length:
+            # End byte of previous message is also checked as the start of the next message
+            self.decodeMsg(msgBytes, msgEnd, length)
+            if (self.msgFound == False or self.msgEnd == -1): # no further complete messages
+                break
+            msgs.append((self.msg, self.getMsgCrc()))
+            msgEnd = self.msgEnd
+
+        # Verify messages
+        if self.crcLength == 0: # no CRC to check
+            return [msg[0] for msg in msgs], 0
+        return self.crc.checkMsgs(msgs)
+
+    def getMsgCrc(self):
+        """Returns CRC of decoded message contents if it was computed while decoding, otherwise None."""
+        if (self.crcPos > 0 and self.crcPos == self.msgLength - self.crcLength):
+            return self.crcValue
+        return None
+
+    def resetMsg(self):
+        """Clear any decoded message contents."""
+        self.msg = b''
+        self.msgLength = 0
+        self.msgFound = False
+        self.msgEnd = -1
+        self.buffer = b''
+        self.crcValue = None
+        self.crcPos = 0
+
+    def decodeMsg(self, byteList, msgStart=0, length=None):
+        """Searches provided raw serial bytes to locate any messages.
+
+        Args:
+            byteList: Raw serial byte array.
+            msgStart: Array location to begin searching for messages in raw serial data.
+            length: Number of valid bytes in byteList (defaults to entire array).
+        """
+        if length == None:
+            length = len(byteList)
+
+        # Check for existing partial message
+        if (self.msgFound):
+            if (self.msgEnd != -1): # Discard results and restart search
+                self.resetMsg()
+            else: # continue parsing partial message
+                self.decodeMsgContents(byteList, msgStart, length)
+                return
+
+        # Locate message start
+        pos = byteList.find(self.endByte, msgStart, length)
+        if pos != -1: # message start found
+            self.msgFound = True
+            self.decodeMsgContents(byteList, pos + 1, length)
+
+    def decodeMsgContents(self, byteList, pos, length=None):
+        """Helper function to strip framing bytes from identified message.
+
+        Args:
+            byteList: Raw serial data array.
+            pos: Array position of start of message in raw serial data.
+            length: Number of valid bytes in byteList (defaults to entire array).
+        """
+        if length == None:
+            length = len(byteList)
+
+        while pos < length:
+            end = byteList.find(self.endByte, pos, length)
+            if end == -1: # message end not yet received
+                self.unstuffBytes(byteList[pos:length], True)
+                if self.msgLength > self.msgMaxLength: # message too long so discard and wait for next message start
+                    self.resetMsg()
+                return
+
+            msgView = None
+            if (self.msgLength == 0 and not self.buffer and end > pos): # entire message available
+                msgView = self.getMsgView(byteList, pos, end)
+            if msgView != None: # no decoding required
+                self.msg = msgView
+                self.msgLength = len(msgView)
+            else:
+                self.unstuffBytes(byteList[pos:end], False)
+            if self.msgLength > self.msgMaxLength: # message too long so discard and treat END as start of next message
+                self.resetMsg()
+                self.msgFound = True
+            elif self.msgLength > 0: # guards against falsely identifying a message of zero length between two END characters
+                self.msgEnd = end
+                return
+
+            pos = end + 1
+
+    def appendMsgBytes(self, decoded):
+        """Append decoded bytes to the message and update the running CRC.
+
+        Args:
+            decoded: Decoded message bytes.
+        """
+        self.msg += decoded
+        self.msgLength += len(decoded)
+
+        # Update running CRC (trailing bytes may be the message CRC so are not included until more bytes are decoded)
+        if (self.crc and self.msgLength - self.crcLength > self.crcPos):
+            self.crcValue = self.crc(memoryview(self.msg)[self.crcPos:self.msgLength - self.crcLength], self.crcValue)
+            self.crcPos = self.msgLength - self.crcLength
+
+    def encodeMsg(self, byteList):
+        """Encodes provided serial data into a message.
+
+        Args:
+            byteList: Serial bytes to be encoded into message.
+        """
+        if not byteList: # Check for empty msg
+            return
+
+        # Create crc
+        msgBytes = bytes(byteList)
+        if self.crc:
+            msgBytes += self.crc.pack(self.crc(msgBytes))
+
+        self.encoded = self.endByte + self.stuffBytes(msgBytes) + self.endByte
+
+    def getMsgView(self, byteList, pos, end):
+        """Returns the contents of a complete encoded message as a memoryview into the raw serial data if the message requires no decoding, otherwise None.
+
+        Args:
+            byteList: Raw serial data array.
+            pos: Array position of start of encoded message contents.
+            end: Array position of END byte following message.
+        """
+        return None
+
+    def unstuffBytes(self, rawBytes, partial):
+        """Decode raw message bytes and append them to the decoded message (see appendMsgBytes).  Bytes that cannot be decoded until more bytes are received are held in buffer.  Implemented by message format subclasses.
+
+        Args:
+            rawBytes: Raw message bytes containing no END bytes.
+            partial: Flag indicating whether more message bytes are still to come.
+        """
+        pass
+
+    def stuffBytes(self, msgBytes):
+        """Returns provided message contents encoded so that they contain no END bytes.  Implemented by message format subclasses.
+
+        Args:
+            msgBytes: Message contents including CRC.
+        """
+        pass
@@ -0,0 +1,74 @@
+import heapq
+from mesh.generic.clockSource import SimClock
+
+class DiscreteEventRunner(object):
+    """Runs mesh nodes in one process against a simulated clock, jumping directly from one event to the next instead of waiting in real time.
+
+    Each node is executed at the next TDMA schedule event reported by its comm (see TDMAComm.getNextEventTime).  While a node is reading received data, it is also executed when data arrives at its VirtualMedium port, or at pollInterval for nodes without a virtual port.  Other events (e.g. queueing messages for transmission) can be scheduled with addEvent.  All nodes must use the runner clock as their clock source.
+
+    Attributes:
+        clock: Simulated clock advanced by the runner.
+        pollInterval: Execution interval of reading nodes that do not have a virtual port.
+        minStep: Time step added to each scheduled node execution, so that pending work always advances time and schedule boundaries are reached despite rounding of frame times.
+        events: Heap of scheduled events (event time, sequence number, callback).
+        eventCount: Number of events executed.
+        nodes: Executed nodes by node id.
+    """
+
+    def __init__(self, clock=None, pollInterval=0.001, minStep=1e-5):
+        self.clock = clock if clock else SimClock()
+        self.pollInterval = pollInterval
+        self.minStep = minStep
+        self.events = []
+        self.eventCount = 0
+        self.sequence = 0 # preserves scheduling order of simultaneous events
+        self.nodes = dict()
+
+    def addEvent(self, eventTime, callback):
+        """Schedule callback to be executed at provided time."""
+        heapq.heappush(self.events, (eventTime, self.sequence, callback))
+        self.sequence += 1
+
+    def addNode(self, node, port=None):
+        """Add node to be executed by runner.
+
+        Args:
+            node: TDMAComm or MeshController instance to execute.
+            port: Optional VirtualPort used by node radio.  Received data then triggers execution of the node.
+        """
+        comm = getattr(node, 'comm', node)
+        comm.blockingSleep = False # sleep period is scheduled by runner
+        nodeId = comm.nodeParams.config.nodeId
+        self.nodes[nodeId] = (node, comm, port)
+        if port:
+            port.medium.rxCallback = self.scheduleRx
+        self.addEvent(self.clock.getTime(), lambda: self.executeNode(nodeId))
+
+    def executeNode(self, nodeId, reschedule=True):
+        """Execute node and schedule its next execution."""
+        node, comm, port = self.nodes[nodeId]
+        currentTime = self.clock.getTime()
+        node.execute()
+
+        if reschedule:
+            nextTime = comm.getNextEventTime(currentTime)
+            if comm.isReadPending() and port == None: # poll for received data
+                nextTime = min(nextTime, currentTime + self.pollInterval)
+            self.addEvent(max(nextTime, currentTime) + self.minStep, lambda: self.executeNode(nodeId))
+
+        if port and port.rxBytes and comm.isReadPending(): # received data remaining
+            self.scheduleRx(nodeId, currentTime + self.minStep)
+
+    def scheduleRx(self, nodeId, rxTime):
+        """Schedule additional execution of node when data arrives at its port."""
+        if nodeId in self.nodes:
+            self.addEvent(rxTime, lambda: self.executeNode(nodeId, False))
+
+    def run(self, endTime):
+        """Execute all events scheduled before provided time and advance clock to that time."""
+        while self.events and self.events[0][0] <= endTime:
+            eventTime, sequence, callback = heapq.heappop(self.events)
+            self.clock.advanceTo(eventTime)
+            callback()
+            self.eventCount += 1
+        self.clock.advanceTo(endTime)
@@ -1,5 +1,5 @@
 from mesh.generic.timeLib import getTimeOffset
-import time
+from mesh.generic.clockSource import SystemClock
 
 class FormationClock:
     """The formation clock is used to provide a command time reference among the formation nodes.  The clock provides the time with respect to a reference time established upon initialization.
@@ -8,10 +8,12 @@ class FormationClock:
     Attributes:
         time: Current clock time with respect to reference time.
         referenceTime: Reference time used by clock to compute clock time upon request. 
+        clockSource: Source of current time (system clock by default).
     """
         
-    def __init__(self, referenceTime=[], timeSource=None):
+    def __init__(self, referenceTime=[], timeSource=None, clockSource=None):
         self.timeSource = None
+        self.clockSource = clockSource if clockSource else SystemClock()
 
         if referenceTime: # Initialize time from some reference time
             self.referenced = True
@@ -21,9 +23,9 @@ class FormationClock:
 
     def getTime(self):
         if self.referenced:
-            return (time.time() - self.referenceTime)
+            return (self.clockSource.getTime() - self.referenceTime)
         else:
-            return time.time()
+            return self.clockSource.getTime()
 
     def getOffset(self):
         return getTimeOffset(self.timeSource)
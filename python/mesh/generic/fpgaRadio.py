@@ -2,17 +2,28 @@ import struct
 from mesh.generic.radio import Radio
 from mesh.generic.slipMsg import SLIP_END
 from mesh.generic.cmds import FPGACmds
-import crcmod.predefined
+from mesh.generic.crc import CRC16_ARC
+
+FPGAMsgOverhead = len(SLIP_END) + 5 # message start, length, and crc
 
 class FPGARadio(Radio):
 
     def __init__(self, serial, config):
         Radio.__init__(self, serial, config)
         
-        self.crc16 = crcmod.predefined.mkCrcFun('crc16')
+        self.crc16 = CRC16_ARC # shared crc16
    
+    def encodedTxLength(self, msgLength):
+        return msgLength + FPGAMsgOverhead
+
+    def getMsgBytesSent(self, msgLength, bytesWritten):
+        return msgLength if bytesWritten >= self.encodedTxLength(msgLength) else 0 # incomplete message is discarded by FPGA
+
     def sendMsg(self, msgBytes):
         """Package message to send to FPGA."""
         #print("outgoing message:", SLIP_END + struct.pack('=BH',FPGACmds['FPGAMsgStart'], len(msgBytes)) + msgBytes + struct.pack("H", self.crc16(msgBytes)))
-        self.sendBytes(SLIP_END + struct.pack('=BH',FPGACmds['FPGAMsgStart'], len(msgBytes)) + msgBytes + struct.pack("H", self.crc16(msgBytes)))
+        bytesSent = self.sendBytes(SLIP_END + struct.pack('=BH',FPGACmds['FPGAMsgStart'], len(msgBytes)) + msgBytes + struct.pack("H", self.crc16(msgBytes)))
+        self.meterTx(bytesSent) # message framing also occupies transmit FIFO
+
+        return bytesSent
          
@@ -1,19 +1,26 @@
 from mesh.generic.radio import Radio
-from mesh.generic.checksum import calc8bitFletcherChecksum, compareChecksum
+from mesh.generic.checksum import FletcherChecksum, compareChecksum
 from mesh.generic.li1RadioCmds import Li1RadioCmds, Li1RadioPayloadCmds
-from struct import pack, unpack
+from struct import pack, unpack, Struct
 from math import ceil
+from collections import deque
 
 Li1HeaderLength = 8
 Li1SyncBytes = b'He'
 lenSyncBytes = len(Li1SyncBytes)
 checksumLen = 2
 Li1MaxPayload = 255
+Li1CmdBufferLength = 100
+Li1HeaderStruct = Struct('>2sHH') # sync bytes, command type, payload size
 class Li1Radio(Radio):
+    rxReadInto = False # received bytes contain radio commands that must be processed
     
     def __init__(self, serial, config):
         Radio.__init__(self, serial, config)
         self.cmdRxBuffer = bytearray()
+        self.cmdRxReadPos = 0 # read position in cmdRxBuffer
+        self.cmdBuffer = deque(maxlen=Li1CmdBufferLength) # most recently received radio commands
+        self.txMsgBuffer = bytearray(Li1HeaderLength + Li1MaxPayload + checksumLen) # packed radio messages for transmission
 
     def createCommand(self, cmd):
         """Send command to Li-1 Radio."""
@@ -22,19 +29,72 @@ class Li1Radio(Radio):
         return cmd['msgBytes']
 
     def sendMsg(self, msgBytes):
-        """Send messages to radio."""
+        """Send messages to radio.  Bytes larger than the maximum radio payload are split into multiple radio messages, which are all written to the radio at once."""
+        bytesSent = 0
         if len(msgBytes) > 0:
-            numMsgs = ceil(len(msgBytes)/Li1MaxPayload) # calculate how many radio messages required
+            msgLength = self.packMsgs(msgBytes)
+            with memoryview(self.txMsgBuffer) as txMsgBytes:
+                bytesSent = self.sendBytes(txMsgBytes[:msgLength])
+            self.meterTx(bytesSent) # radio headers and checksums also occupy transmit FIFO
+
+        return bytesSent
+
+    def encodedTxLength(self, msgLength):
+        numMsgs = ceil(msgLength/Li1MaxPayload) # radio messages required
+        return msgLength + numMsgs*(Li1HeaderLength + checksumLen)
+
+    def getMsgBytesSent(self, msgLength, bytesWritten):
+        if bytesWritten >= self.encodedTxLength(msgLength): # all radio messages written
+            return msgLength
+        return bytesWritten // self.encodedTxLength(Li1MaxPayload) * Li1MaxPayload # complete radio messages written
+
+    def packMsgs(self, msgBytes):
+        """Pack radio messages for provided bytes back-to-back into transmit message buffer.
+
+        Args:
+            msgBytes: Raw bytes to send.
+
+        Returns:
+            Length of packed radio messages.
+        """
+        numMsgs = ceil(len(msgBytes)/Li1MaxPayload) # calculate how many radio messages required
+        msgLength = self.encodedTxLength(len(msgBytes))
+        if msgLength > len(self.txMsgBuffer): # increase buffer size
+            self.txMsgBuffer = bytearray(msgLength)
+
+        pos = 0
+        with memoryview(self.txMsgBuffer) as txMsgBytes, memoryview(msgBytes) as rawBytes:
             for i in range(numMsgs):
                 # Split into multiple messages
-                if len(msgBytes) >= (i+1)*Li1MaxPayload: # get message end
-                    msgEnd = (i+1)*Li1MaxPayload
-                else:
-                    msgEnd = len(msgBytes)
-                payload = msgBytes[i*Li1MaxPayload:msgEnd]
-
-                msg = self.createMsg(payload)
-                self.serial.write(msg)
+                pos = self.packMsg(txMsgBytes, pos, rawBytes[i*Li1MaxPayload:(i+1)*Li1MaxPayload])
+
+        return pos
+
+    def packMsg(self, txMsgBytes, pos, payload):
+        """Pack single radio message into provided buffer.
+
+        Args:
+            txMsgBytes: Buffer to pack message into.
+            pos: Position in buffer to pack message.
+            payload: Message payload.
+
+        Returns:
+            Buffer position after end of packed message.
+        """
+        # Header
+        Li1HeaderStruct.pack_into(txMsgBytes, pos, Li1SyncBytes, Li1RadioCmds['Transmit'], len(payload))
+        checksum = FletcherChecksum(txMsgBytes[pos+lenSyncBytes:pos+Li1HeaderLength-checksumLen])
+        txMsgBytes[pos+Li1HeaderLength-checksumLen:pos+Li1HeaderLength] = checksum.pack()
+        checksum.update(txMsgBytes[pos+Li1HeaderLength-checksumLen:pos+Li1HeaderLength]) # payload checksum includes header checksum
+        pos += Li1HeaderLength
+
+        # Payload
+        txMsgBytes[pos:pos+len(payload)] = payload
+        checksum.update(payload)
+        pos += len(payload)
+        txMsgBytes[pos:pos+checksumLen] = checksum.pack()
+
+        return pos + checksumLen
     
     def createMsg(self, rawMsg):
         """Create message to send to Li-1 radio."""
@@ -55,7 +115,7 @@ class Li1Radio(Radio):
         headerBytes += pack('>H', msg['payloadSize']) # payload size, big endian unsigned short integer
 
         # Create and append checksum
-        headerBytes += pack('BB', *calc8bitFletcherChecksum(headerBytes[2:]))
+        headerBytes += FletcherChecksum(headerBytes[lenSyncBytes:]).pack()
          
         msg['msgBytes'] += headerBytes
 
@@ -63,36 +123,43 @@ class Li1Radio(Radio):
         """Create payload for Li-1 message packet."""
         # Create and append payload checksum
         if 'payload' in msg:
-            payloadBytes = msg['payload'] + pack('BB', *calc8bitFletcherChecksum(msg['msgBytes'][lenSyncBytes:] + msg['payload']))
-            msg['msgBytes'] += payloadBytes
+            checksum = FletcherChecksum(msg['msgBytes'][lenSyncBytes:]) # header checksummed separately from payload to avoid copying payload
+            checksum.update(msg['payload'])
+            msg['msgBytes'] += msg['payload']
+            msg['msgBytes'] += checksum.pack()
         else: # no payload
             return
     
 
     def processRxBytes(self, serBytes, bufferFlag):
-        # Search received bytes for commands
+        """Search received bytes for Li-1 commands.  Bytes of partially received commands are retained until the remainder of the command is received.
+
+        Args:
+            serBytes: Raw bytes read from radio.
+            bufferFlag: Flag to append received data to rxBuffer (True) or replace rxBuffer contents (False).
+        """
+        # Compact parsed bytes out of buffer before adding new bytes
+        if self.cmdRxReadPos > 0:
+            del self.cmdRxBuffer[:self.cmdRxReadPos]
+            self.cmdRxReadPos = 0
         self.cmdRxBuffer += serBytes
-        msgEnd = 0
-        while msgEnd < len(self.cmdRxBuffer): # Continue searching until end of received bytes
-            msgEnd, cmd = self.parseCommand(self.cmdRxBuffer)
+
+        while self.cmdRxReadPos < len(self.cmdRxBuffer): # Continue searching until end of received bytes
+            msgEnd, cmd = self.parseCommand(self.cmdRxBuffer, self.cmdRxReadPos)
+            if msgEnd <= self.cmdRxReadPos: # remaining bytes are a partial command
+                break
+            self.cmdRxReadPos = msgEnd # advance past parsed bytes
+
             # Sort commands
             if cmd:
-                print("Command rx buffer:", self.cmdRxBuffer)
-                print(cmd)
-                self.cmdRxBuffer = self.cmdRxBuffer[msgEnd:] # clear out parsed bytes
                 # Buffer command
                 self.cmdBuffer.append(cmd)
 
                 # Check for data
                 if cmd['cmdType'] == Li1RadioCmds['ReceivedData'] and cmd['payload'] != None: # Valid data message
                     # Put data in rxBuffer
-                    print("Valid data message received.")
                     self.bufferRxMsg(cmd['payload'], bufferFlag)
-                else:  # Other command type
-                    print(cmd)
-                    pass
-        if len(self.cmdRxBuffer) > 1000:
-            self.cmdRxBuffer = bytearray()
+                    bufferFlag = True # append any further data received in these bytes
 
     def parseCmdHeader(self, cmd, serBytes):
         # Parse header
@@ -102,14 +169,12 @@ class Li1Radio(Radio):
                     
         # Check header checksum
         if (compareChecksum(cmdInfo, checksumBytes)):
-            #print("Header checksum matches")
             cmd['header'] = cmdInfo
             cmd['rawHeader'] = headerBytes[lenSyncBytes:]
             # Decode command type
             cmd['cmdType'] = unpack('>H', cmd['header'][0:2])[0]
             return True # header found
         else:
-            print("Header checksum failed")
             return False # header not found
         
 
@@ -121,16 +186,14 @@ class Li1Radio(Radio):
             payloadBytes = serBytes[0:payloadSize]
             payloadChecksumBytes = serBytes[payloadSize:payloadSize+checksumLen]
 
-            if (compareChecksum(headerBytes+payloadBytes, payloadChecksumBytes)):
-                #print("Payload checksum matches")
-                #return msgEnd, payloadBytes
+            checksum = FletcherChecksum(headerBytes)
+            checksum.update(payloadBytes)
+            if (checksum.compare(payloadChecksumBytes)):
                 return msgEnd, self.parseAX25Msg(payloadBytes)
             else: # invalid checksum
-                print("Invalid payload checksum")
                 return msgEnd, None
                 
         else: # incomplete command
-                #print("Incomplete payload")
                 return len(serBytes), None
 
     def parseAX25Msg(self, msgBytes):
@@ -138,52 +201,53 @@ class Li1Radio(Radio):
         # For now, just discard everything but original message payload."""        
         return msgBytes[16:-2] 
 
-    def parseCommand(self, serBytes):
-        """Search raw received bytes for commands."""
-    
+    def parseCommand(self, serBytes, start=0):
+        """Search raw received bytes for commands.
+
+        Args:
+            serBytes: Raw received bytes.
+            start: Position in serBytes to begin searching for commands.
+
+        Returns:
+            Position in serBytes up to which bytes have been parsed and the command found (None if no valid command found).  Partial commands are not parsed, so the returned position is the start of the partial command.
+        """
         cmd = {'header': None, 'payload': None}
 
-        for i in range(len(serBytes) - (lenSyncBytes-1)):
-            # Search serial bytes for sync characters
-            if (serBytes[i:i+lenSyncBytes] == Li1SyncBytes): # sync bytes found
-                #print("Message Found")
-                msgStart = i
-               
-                if (len(serBytes[msgStart:]) >= Li1HeaderLength): # entire header received
-                    # Parse command header
-                    headerFound = self.parseCmdHeader(cmd, serBytes[msgStart:])
+        # Search serial bytes for sync characters
+        msgStart = serBytes.find(Li1SyncBytes, start)
+        if msgStart == -1: # no command found
+            return max(start, len(serBytes) - (lenSyncBytes-1)), None # retain bytes that may be the start of sync bytes
+
+        if (len(serBytes) - msgStart < Li1HeaderLength): # incomplete command
+            return msgStart, None
+
+        # Parse command header
+        if not self.parseCmdHeader(cmd, serBytes[msgStart:msgStart+Li1HeaderLength]): # invalid header
+            return msgStart + 1, None # resume search after false sync bytes
+
+        # Update buffer position
+        msgEnd = msgStart + Li1HeaderLength
+
+        # Check if payload present
+        if cmd['cmdType'] in Li1RadioPayloadCmds.values():
+            payloadSize = unpack('>H', cmd['header'][2:])[0]
+            if payloadSize == 0: # No payload
+                return msgEnd, cmd # header only command
+            elif payloadSize == 65535: # receive error
+                return msgEnd, cmd
+            else: # payload present
+                if len(serBytes) - msgEnd >= (payloadSize + checksumLen): # entire message received
+                    payloadEnd, cmd['payload'] = self.parseCmdPayload(payloadSize, bytes(serBytes[msgEnd:msgEnd+payloadSize+checksumLen]), cmd['rawHeader'])
+                    msgEnd += payloadEnd # update buffer position
+                    if cmd['payload']:
+                        return msgEnd, cmd
+                    else:
+                        return msgEnd, None # invalid payload
                 else: # incomplete command
-                    return len(serBytes), None
-
-                # Update buffer position
-                msgEnd = msgStart + Li1HeaderLength
-
-                if headerFound:
-                    # Check if payload present
-                    if cmd['cmdType'] in Li1RadioPayloadCmds.values():
-                        payloadSize = unpack('>H', cmd['header'][2:])[0]
-                        if payloadSize == 0: # No payload
-                            return msgEnd, cmd # header only command
-                        elif payloadSize == 65535: # receive error
-                            return msgEnd, cmd
-                        else: # payload present
-                            if len(serBytes) >= (Li1HeaderLength + payloadSize + checksumLen): # entire message received
-                                payloadEnd, cmd['payload'] = self.parseCmdPayload(payloadSize, serBytes[msgStart+Li1HeaderLength:], cmd['rawHeader'])
-                                msgEnd += payloadEnd # update buffer position
-                                if cmd['payload']:
-                                    return msgEnd, cmd
-                                else:
-                                    return msgEnd, None # invalid payload
-                            else: # incomplete command
-                                return len(serBytes), None
-                        
-                    else: # no payload
-                        return msgEnd, cmd # header only command
-            
-                else: # invalid header
-                    return msgEnd, None
-
-        return len(serBytes), None
+                    return msgStart, None
+                
+        else: # no payload
+            return msgEnd, cmd # header only command
 
     def sendCommand(self, cmd):
         """Issue command to Li-1 radio."""
@@ -2,6 +2,7 @@ from enum import IntEnum
 from collections import namedtuple
 from mesh.generic.cmds import NodeCmds, TDMACmds
 from mesh.generic.command import Command
+from mesh.generic.meshTxQueue import MeshMsgPriority
 import math
 
 class NetworkVote(IntEnum):
@@ -33,9 +34,11 @@ class NetworkPoll(object):
         self.voteSent = False
 
 class MeshTxMsg(object):
-    def __init__(self, destId, msgBytes):
+    def __init__(self, destId, msgBytes, priority=MeshMsgPriority.state, expiryTime=None):
         self.destId = destId
         self.msgBytes = msgBytes
+        self.priority = priority
+        self.expiryTime = expiryTime # message discarded if not sent by this time (None for no expiry)
 
 class MeshMsg(object):
     def __init__(self, msgType, cmdId=None, status=None, msgBytes=None):
@@ -295,14 +298,23 @@ class MeshController(object):
 
         return False
  
-    def sendMsg(self, destId, msg):
-        """This function receives messages to be sent over the mesh network and queues them for transmission."""
-        
-        # Place message in appropriate position in outgoing queue (broadcast messages are stored in the zero position) 
-
+    def sendMsg(self, destId, msg, priority=MeshMsgPriority.state, lifetime=None):
+        """This function receives messages to be sent over the mesh network and queues them for transmission.
+
+        Args:
+            destId: Destination node id (0 for broadcast).
+            msg: Message bytes.
+            priority: Message priority class.
+            lifetime: Time after which message is discarded if not yet sent (defaults to configured msgLifetime, 0 for no expiry).
+
+        Returns:
+            False if message is too large or was dropped because the transmit queue is full.
+        """
         if (len(msg) <= self.nodeParams.config.commConfig['msgPayloadMaxLength']): # message meets size requirements
-            self.comm.meshQueueIn.append(MeshTxMsg(destId, msg))
-            return True
+            if lifetime == None:
+                lifetime = self.nodeParams.config.commConfig['msgLifetime']
+            expiryTime = self.nodeParams.clock.getTime() + lifetime if lifetime else None
+            return self.comm.meshQueueIn.append(MeshTxMsg(destId, msg, priority, expiryTime))
         else:
             return False
 
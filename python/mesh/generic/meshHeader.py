@@ -0,0 +1,143 @@
+from struct import pack, unpack_from
+
+# Compact mesh packet header
+#
+# The header starts with a flags byte whose top three bits identify the header version.  The flags indicate which optional fields follow:
+#   flags (B), sourceId (B), destId (B), [originId (B)], seqNum (B, or H with status in top 4 bits), [statusByte (B)], [adminLength (varint)], [payloadLength (varint)]
+#
+# The first byte of the standard header is the source node id, so compact headers are distinguished by a flags byte of 0xC0 or greater.  Node ids used with the standard header must be less than 0xC0.
+MESH_HEADER_VERSION_SHIFT = 5
+MESH_HEADER_COMPACT_V1 = 6 # version bits of compact header version 1
+MESH_HEADER_COMPACT_MIN = MESH_HEADER_COMPACT_V1 << MESH_HEADER_VERSION_SHIFT # smallest first byte of a compact header
+MESH_FLAG_ADMIN_LENGTH = 0x10 # admin length present
+MESH_FLAG_PAYLOAD_LENGTH = 0x08 # payload length present
+MESH_FLAG_ORIGIN = 0x04 # origin node id present (packet relayed)
+MESH_FLAG_STATUS = 0x02 # status byte present (8-bit sequence numbers only)
+MESH_FLAG_SEQ12 = 0x01 # 12-bit sequence number with status in upper 4 bits
+MESH_SEQ12_MASK = 0x0FFF
+MESH_HEADER_ORIGIN_POS = 3 # position of origin id in compact header
+
+def packVarint(value):
+    """Returns unsigned integer encoded with 7 bits per byte, least significant group first."""
+    varint = bytearray()
+    while value >= 0x80:
+        varint.append((value & 0x7F) | 0x80)
+        value >>= 7
+    varint.append(value)
+    return bytes(varint)
+
+def unpackVarint(varintBytes, pos):
+    """Decode unsigned varint starting at provided position.
+
+    Returns:
+        Decoded value and position following varint (value is None if varint is incomplete).
+    """
+    value = 0
+    shift = 0
+    while pos < len(varintBytes):
+        byte = varintBytes[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+    return None, pos
+
+def isCompactHeader(packetBytes):
+    """Returns True if provided packet starts with a compact header."""
+    return len(packetBytes) > 0 and packetBytes[0] >= MESH_HEADER_COMPACT_MIN
+
+def compactHeaderLength(adminLength, payloadLength, seqNumBits=8, statusByte=0, relayed=False):
+    """Returns length of compact header for provided packet contents."""
+    length = 4 + (seqNumBits > 8) + relayed
+    if seqNumBits <= 8 and statusByte:
+        length += 1
+    if adminLength:
+        length += len(packVarint(adminLength))
+    if payloadLength:
+        length += len(packVarint(payloadLength))
+    return length
+
+def packCompactHeader(sourceId, destId, adminLength, payloadLength, seqNum, statusByte=0, originId=None, seqNumBits=8):
+    """Create compact mesh packet header.
+
+    Args:
+        sourceId: Node id of transmitting node.
+        destId: Node id of destination (0 for broadcast).
+        adminLength: Length of admin section.
+        payloadLength: Length of payload.
+        seqNum: Sequence number of packet from origin node.
+        statusByte: Packet status (must be less than 16 with 12-bit sequence numbers).
+        originId: Node id of originating node if different from source.
+        seqNumBits: Number of sequence number bits (8 or 12).
+    """
+    flags = MESH_HEADER_COMPACT_MIN
+    fields = [pack('<BB', sourceId, destId)]
+    if originId != None:
+        flags |= MESH_FLAG_ORIGIN
+        fields.append(pack('<B', originId))
+    if seqNumBits > 8:
+        flags |= MESH_FLAG_SEQ12
+        fields.append(pack('<H', (seqNum & MESH_SEQ12_MASK) | (statusByte << 12)))
+    else:
+        fields.append(pack('<B', seqNum & 0xFF))
+        if statusByte:
+            flags |= MESH_FLAG_STATUS
+            fields.append(pack('<B', statusByte))
+    if adminLength:
+        flags |= MESH_FLAG_ADMIN_LENGTH
+        fields.append(packVarint(adminLength))
+    if payloadLength:
+        flags |= MESH_FLAG_PAYLOAD_LENGTH
+        fields.append(packVarint(payloadLength))
+
+    return pack('<B', flags) + b''.join(fields)
+
+def unpackCompactHeader(packetBytes):
+    """Parse compact mesh packet header.
+
+    Returns:
+        Dictionary of header fields including the header length (None if header is invalid or incomplete).
+    """
+    if len(packetBytes) < 4 or (packetBytes[0] >> MESH_HEADER_VERSION_SHIFT) != MESH_HEADER_COMPACT_V1:
+        return None
+
+    flags = packetBytes[0]
+    seqLength = 2 if flags & MESH_FLAG_SEQ12 else 1 + bool(flags & MESH_FLAG_STATUS)
+    if len(packetBytes) < 3 + bool(flags & MESH_FLAG_ORIGIN) + seqLength: # incomplete header
+        return None
+
+    header = {'sourceId': packetBytes[1], 'destId': packetBytes[2], 'originId': None, 'statusByte': 0, 'adminLength': 0, 'payloadLength': 0}
+    pos = 3
+    if flags & MESH_FLAG_ORIGIN:
+        header['originId'] = packetBytes[pos]
+        pos += 1
+    if flags & MESH_FLAG_SEQ12:
+        seqField = unpack_from('<H', packetBytes, pos)[0]
+        header['seqNum'] = seqField & MESH_SEQ12_MASK
+        header['seqNumBits'] = 12
+        header['statusByte'] = seqField >> 12
+    else:
+        header['seqNum'] = packetBytes[pos]
+        header['seqNumBits'] = 8
+        if flags & MESH_FLAG_STATUS:
+            header['statusByte'] = packetBytes[pos+1]
+    pos += seqLength
+
+    for flag, field in [(MESH_FLAG_ADMIN_LENGTH, 'adminLength'), (MESH_FLAG_PAYLOAD_LENGTH, 'payloadLength')]:
+        if flags & flag:
+            header[field], pos = unpackVarint(packetBytes, pos)
+            if header[field] == None: # incomplete length
+                return None
+
+    header['headerLength'] = pos
+    return header
+
+def relayCompactHeader(packetBytes, sourceId):
+    """Returns copy of packet with compact header updated for relay by provided node.  The original source is recorded as the origin of the packet if not already present."""
+    packetBytes = bytearray(packetBytes)
+    if not packetBytes[0] & MESH_FLAG_ORIGIN: # record originating node
+        packetBytes[0] |= MESH_FLAG_ORIGIN
+        packetBytes[MESH_HEADER_ORIGIN_POS:MESH_HEADER_ORIGIN_POS] = packetBytes[1:2]
+    packetBytes[1] = sourceId
+    return packetBytes
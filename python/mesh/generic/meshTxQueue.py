@@ -0,0 +1,177 @@
+from enum import IntEnum
+from collections import OrderedDict, deque
+
+class MeshMsgPriority(IntEnum):
+    control = 0
+    state = 1
+    bulk = 2
+
+class MeshTxQueue(object):
+    """Queue of messages awaiting transmission over the mesh network.
+
+    Messages are sent in priority order (see MeshMsgPriority).  Within each priority class, destinations are served in turn so that traffic to one destination cannot starve others.  Messages that are not sent remain queued for the next transmit opportunity until they expire.  When the queue is full, a new message displaces the newest message of a lower priority class or is otherwise dropped.
+
+    Messages are expected to have destId, priority and expiryTime attributes (see MeshTxMsg).
+
+    Attributes:
+        maxDepth: Maximum number of queued messages.
+        queues: Queued messages for each priority class, by destination.
+        depth: Number of queued messages.
+        queuedCount: Number of messages added to queue.
+        sentCount: Number of messages removed from queue for transmission.
+        dropCount: Number of messages dropped because the queue was full or they could not be sent, for each priority class.
+        expiredCount: Number of messages that expired before transmission, for each priority class.
+    """
+
+    def __init__(self, maxDepth=1000):
+        self.maxDepth = maxDepth
+        self.queues = [OrderedDict() for priority in MeshMsgPriority]
+        self.depth = 0
+        self.queuedCount = 0
+        self.sentCount = 0
+        self.dropCount = [0] * len(MeshMsgPriority)
+        self.expiredCount = [0] * len(MeshMsgPriority)
+
+    def __len__(self):
+        return self.depth
+
+    def __iter__(self):
+        """Iterate over queued messages in transmission order."""
+        for queue in self.queues:
+            destQueues = [list(msgs) for msgs in queue.values()]
+            for i in range(max([len(msgs) for msgs in destQueues], default=0)):
+                for msgs in destQueues:
+                    if i < len(msgs):
+                        yield msgs[i]
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def append(self, msg):
+        """Add message to queue.
+
+        Returns:
+            False if message was dropped because the queue is full.
+        """
+        if self.depth >= self.maxDepth and not self.dropLowerPriority(msg.priority):
+            self.dropCount[msg.priority] += 1
+            return False
+
+        queue = self.queues[msg.priority]
+        if msg.destId not in queue:
+            queue[msg.destId] = deque()
+        queue[msg.destId].append(msg)
+        self.depth += 1
+        self.queuedCount += 1
+        return True
+
+    def dropLowerPriority(self, priority):
+        """Drop newest message of lowest priority class below provided priority.
+
+        Returns:
+            True if a message was dropped.
+        """
+        for lowerPriority in range(len(self.queues)-1, priority, -1):
+            queue = self.queues[lowerPriority]
+            if queue:
+                destId = next(reversed(queue)) # destination most recently added
+                self.removeMsg(lowerPriority, destId, fromBack=True)
+                self.dropCount[lowerPriority] += 1
+                return True
+        return False
+
+    def removeMsg(self, priority, destId, fromBack=False):
+        """Remove message from front (or back) of provided destination queue."""
+        queue = self.queues[priority]
+        msgs = queue[destId]
+        msg = msgs.pop() if fromBack else msgs.popleft()
+        if not msgs:
+            del queue[destId]
+        self.depth -= 1
+        return msg
+
+    def dropExpired(self, currentTime):
+        """Remove messages with expiry times before provided time."""
+        for priority, queue in enumerate(self.queues):
+            for destId in list(queue.keys()):
+                msgs = queue[destId]
+                numMsgs = len(msgs)
+                queue[destId] = msgs = deque(msg for msg in msgs if msg.expiryTime == None or msg.expiryTime > currentTime)
+                numExpired = numMsgs - len(msgs)
+                if numExpired:
+                    self.expiredCount[priority] += numExpired
+                    self.depth -= numExpired
+                    if not msgs:
+                        del queue[destId]
+
+    def peek(self):
+        """Returns next message to transmit (None if queue is empty)."""
+        for queue in self.queues:
+            if queue:
+                return next(iter(queue.values()))[0]
+        return None
+
+    def pop(self):
+        """Remove and return next message to transmit (None if queue is empty).  The destination of the message is moved behind other destinations of the same priority."""
+        for priority, queue in enumerate(self.queues):
+            if queue:
+                destId = next(iter(queue))
+                msg = self.removeMsg(priority, destId)
+                if destId in queue: # destination has more messages
+                    queue.move_to_end(destId)
+                self.sentCount += 1
+                return msg
+        return None
+
+    def popFitting(self, capacity, lengthFunc, maxLength=None):
+        """Remove and return the messages to transmit that fit in the provided capacity.
+
+        Messages are considered in transmission order.  A message that does not fit in the remaining capacity is skipped so that smaller messages behind it can use the space, while higher priority messages always claim space first.  Once a message to a destination is skipped, later messages to that destination in the same priority class are also held so that each destination receives its messages in order.
+
+        Args:
+            capacity: Number of bytes available.
+            lengthFunc: Function that returns the number of bytes required to send a message, given the list of messages already selected.
+            maxLength: Messages that require more bytes than this on their own can never be sent and are dropped.
+
+        Returns:
+            List of messages to transmit.
+        """
+        msgs = []
+        for priority, queue in enumerate(self.queues):
+            heldDests = set()
+            while len(heldDests) < len(queue):
+                for destId in list(queue.keys()):
+                    if destId in heldDests:
+                        continue
+                    msg = queue[destId][0]
+                    msgLength = lengthFunc(msg, msgs)
+                    if msgLength <= capacity:
+                        msgs.append(self.removeMsg(priority, destId))
+                        capacity -= msgLength
+                        self.sentCount += 1
+                        if destId in queue: # destination has more messages
+                            queue.move_to_end(destId)
+                    elif maxLength != None and lengthFunc(msg, []) > maxLength: # message can never be sent
+                        self.removeMsg(priority, destId)
+                        self.dropCount[priority] += 1
+                    else: # hold destination until next transmit opportunity
+                        heldDests.add(destId)
+
+        return msgs
+
+    def dropNext(self):
+        """Drop next message to transmit (e.g. because it is too large to send)."""
+        msg = self.pop()
+        if msg:
+            self.sentCount -= 1
+            self.dropCount[msg.priority] += 1
+
+    def clear(self):
+        """Remove all queued messages."""
+        for queue in self.queues:
+            queue.clear()
+        self.depth = 0
+
+    def getStatus(self):
+        """Returns queue depth and counters."""
+        return {'depth': self.depth, 'depthByPriority': [sum(len(msgs) for msgs in queue.values()) for queue in self.queues], 'queued': self.queuedCount, 'sent': self.sentCount, 'dropped': self.dropCount[:], 'expired': self.expiredCount[:]}
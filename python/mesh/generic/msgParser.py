@@ -1,49 +1,119 @@
+from collections import deque
 
 class MsgParser:
     """This class is responsible for taking raw serial bytes and searching them for valid SLIP messages.
 
+    The parser is streaming: each call to parseMsgs consumes the entire provided buffer and any partially received message is carried over by the message format until the remainder of its bytes are parsed.
+
     Attributes:
-        parsedMsgs: Valid serial messages stored in this variable upon confirmation of valid CRC.
-        parseMsgMax: Maximum attempts at parsing messages from the raw receive buffer.
+        parsedMsgs: Queue of valid serial messages stored upon confirmation of valid CRC.
+        parseMsgMax: Legacy maximum of parse attempts per buffer (no longer limits parsing since the entire buffer is consumed).
+        msgViews: Flag to store parsed messages as memoryviews into the parsed buffer instead of copies.  Views are only valid until the buffer is overwritten, so they must be processed before the next receive.
+        validMsgCount: Number of complete messages parsed with valid CRC.
+        corruptMsgCount: Number of complete messages rejected for invalid CRC.
     """
 
     def __init__(self, config, msg=[]):
-        self.parsedMsgs = []
+        self.parsedMsgs = deque()
         self.parseMsgMax = config['parseMsgMax']
         self.msg = msg
-        
+        self.msgViews = False
+        self.validMsgCount = 0
+        self.corruptMsgCount = 0
+
 
     # Parsing methods
-    def parseSerialMsg(self, msgBytes, msgStart):
-        """Searches raw serial data for messages and then parses them using the specified message format. Valid parsed messages are then stored for processing."""
-        if len(msgBytes) > 0:
+    def parseSerialMsg(self, msgBytes, msgStart, length=None):
+        """Searches raw serial data for messages and then parses them using the specified message format. Valid parsed messages are then stored for processing.
+
+        Args:
+            msgBytes: Raw serial data to be parsed.
+            msgStart: Start location to begin looking for serial message in msgBytes data array.
+            length: Number of valid bytes in msgBytes (defaults to entire array).
+
+        Returns:
+            Location of the end of the message found or the number of valid bytes if no complete message was found.
+        """
+        if length == None:
+            length = len(msgBytes)
+
+        if length > 0:
             if (self.msg): # message format specified
-                parsedMsg = self.msg.parseMsg(msgBytes, msgStart)
+                parsedMsg = self.msg.parseMsg(msgBytes, msgStart, length)
                 if (parsedMsg): # message parsed successfully
-                    self.parsedMsgs.append(parsedMsg)
+                    self.storeMsg(parsedMsg)
+                if (self.msg.msgFound and self.msg.msgEnd != -1): # complete message found (valid or not)
+                    if (parsedMsg):
+                        self.validMsgCount += 1
+                    else:
+                        self.corruptMsgCount += 1
                     return self.msg.msgEnd
             else: # no format so store all received bytes
-                self.parsedMsgs.append(msgBytes[msgStart:])
-        return len(msgBytes)
-    
-    def parseMsgs(self, rxBuffer):
-        """Parse read serial data."""
-        msgEnd = -1
-        for loopCtr in range(self.parseMsgMax): # Continuing looping until end of buffer reached or max loop iterations
-            if msgEnd < len(rxBuffer): # More bytes in buffer to parse
-                msgEnd = self.parseSerialMsg(rxBuffer, msgEnd+1)
-            else: # end of buffer reached
-                break
+                self.parsedMsgs.append(msgBytes[msgStart:length])
+        return length
+
+    def parseMsgs(self, rxBuffer, length=None, start=0):
+        """Parse all messages from read serial data.  Partial messages at the end of the buffer are retained and completed by subsequent calls.
+
+        Args:
+            rxBuffer: Raw serial data to be parsed.
+            length: Number of valid bytes in rxBuffer (defaults to entire buffer).
+            start: Position of first valid byte in rxBuffer.
+        """
+        if length == None:
+            length = len(rxBuffer)
+
+        if (self.msg): # decode all messages in buffer and verify as a batch
+            validMsgs, numCorrupt = self.msg.parseMsgs(rxBuffer, length, start)
+            for msg in validMsgs:
+                self.storeMsg(msg)
+            self.validMsgCount += len(validMsgs)
+            self.corruptMsgCount += numCorrupt
+        elif (length > start): # no format so store all received bytes
+            self.parsedMsgs.append(rxBuffer[start:length])
+
+    def storeMsg(self, msg):
+        """Store valid parsed message for processing."""
+        if (self.msgViews == False and isinstance(msg, memoryview)): # copy out of parsed buffer
+            msg = bytes(msg)
+        self.parsedMsgs.append(msg)
+
+    def getMsgs(self):
+        """Iterator that removes and returns parsed messages in the order received."""
+        while self.parsedMsgs:
+            yield self.parsedMsgs.popleft()
 
         # Message creation methods
-    
+
     def encodeMsg(self, msg):
         if msg: # non-zero length message:
             if self.msg: # Package using message protocol
                 self.msg.encodeMsg(msg)
                 return self.msg.encoded
             else: # default to returning input bytes
-                return msg 
+                return msg
         else: # no message
             return []
 
+    def maxEncodedLength(self, msgLength):
+        """Returns the worst case length of an encoded message.
+
+        Args:
+            msgLength: Length of message contents.
+        """
+        if self.msg: # message protocol overhead
+            return self.msg.maxEncodedLength(msgLength)
+        else:
+            return msgLength
+
+    def encodedLength(self, msgBytes, extraLength=0):
+        """Returns the length of provided message contents once encoded.
+
+        Args:
+            msgBytes: Message contents.
+            extraLength: Number of additional message bytes whose contents are not yet known (worst case encoding assumed).
+        """
+        if self.msg: # message protocol overhead
+            return self.msg.encodedLength(msgBytes, extraLength)
+        else:
+            return len(msgBytes) + extraLength
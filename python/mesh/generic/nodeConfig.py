@@ -9,6 +9,18 @@ from nodeConfig_pb2 import NodeConfig_proto
 
 configHashSize = 20 # length of configuration hash (SHA1)
 
+# Wire format comm parameters and their values compatible with nodes that predate them (only included in the configuration hash when set to another value)
+legacyCommParams = {'aggregateMsgs': False, 'meshHeader': 'standard'}
+
+# Comm parameters only used by the compact mesh header
+compactHeaderParams = ['meshSeqNumBits']
+
+# Node-local interface parameters that are excluded from the configuration hash
+localInterfaceParams = ['type', 'shmName', 'shmSize', 'shmWakeup']
+
+# Node-local comm parameters that may differ between nodes and are excluded from the configuration hash
+localCommParams = ['transmitSlot', 'eventLoop', 'deadlineScheduler', 'spinTime', 'txPacing', 'radioFifoSize', 'txQueueMaxDepth', 'msgLifetime']
+
 class ParamId(IntEnum):
     """Enumeration of configuration parameter ID numbers."""
     nodeId = 1
@@ -38,6 +50,7 @@ class NodeConfig(dict):
         FCBaudrate (int): Speed of serial interface connection to the vehicle's flight computer in bits per second. 
         cmdInterval (float): Interval in seconds between successive send times of repeating commands.
         logInterval (float): Interval in seconds between logging attempts. 
+        interface (dict): Configuration of the link between the communication and node control processes.  The link type is set by 'type'.  Valid values are: UDP- localhost UDP sockets (default); shm- shared memory rings (see ShmRadio).
 
         commConfig (dict): This object contains all of the communication configuration parameters.
 
@@ -131,6 +144,15 @@ class NodeConfig(dict):
 
     def loadInterfaceConfig(self, config):
         self.interface = config['interface']
+        if 'type' not in self.interface: # node control interface link type (UDP or shm)
+            self.interface['type'] = "UDP"
+        if self.interface['type'] == "shm":
+            if 'shmName' not in self.interface:
+                self.interface['shmName'] = "meshNetworkComm"
+            if 'shmSize' not in self.interface:
+                self.interface['shmSize'] = 65536
+            if 'shmWakeup' not in self.interface:
+                self.interface['shmWakeup'] = False
         
         # Node interface
         #self.interface = {"node": configData['node'], "comm": configData['comm']}
@@ -152,6 +174,26 @@ class NodeConfig(dict):
             if 'fpga' not in self.commConfig.keys():
                 self.commConfig['fpga'] = False
                 self.commConfig['fpgaFailsafePin'] = ""
+            if 'eventLoop' not in self.commConfig: # wait for data or TDMA events instead of polling
+                self.commConfig['eventLoop'] = False
+            if 'deadlineScheduler' not in self.commConfig: # sleep then spin until TDMA events instead of polling
+                self.commConfig['deadlineScheduler'] = False
+            if 'spinTime' not in self.commConfig: # time spun before each TDMA event by deadline scheduler
+                self.commConfig['spinTime'] = 0.001
+            if 'txQueueMaxDepth' not in self.commConfig: # maximum number of messages awaiting transmission
+                self.commConfig['txQueueMaxDepth'] = 1000
+            if 'msgLifetime' not in self.commConfig: # default time before unsent messages are discarded (0 for no expiry)
+                self.commConfig['msgLifetime'] = 0
+            if 'aggregateMsgs' not in self.commConfig: # send all messages for a destination in a single mesh packet
+                self.commConfig['aggregateMsgs'] = False # aggregated packets are not understood by older nodes
+            if 'meshHeader' not in self.commConfig: # mesh packet header format ('standard' or 'compact')
+                self.commConfig['meshHeader'] = 'standard'
+            if 'meshSeqNumBits' not in self.commConfig: # sequence number size of compact mesh header (8 or 12 bits)
+                self.commConfig['meshSeqNumBits'] = 8
+            if 'txPacing' not in self.commConfig: # meter radio transmissions against link rate and radio FIFO size
+                self.commConfig['txPacing'] = False
+            if 'radioFifoSize' not in self.commConfig: # radio transmit FIFO size in bytes (0 if unlimited)
+                self.commConfig['radioFifoSize'] = 0
             
             # Maximum TDMA transfer size
             self.commConfig['maxTransferSize'] = self.commConfig['txLength'] * self.meshBaudrate/8.0
@@ -223,14 +265,16 @@ class NodeConfig(dict):
             self.hashElem(configHash, allAttrsDict[param])
         
         # Interface configuration parameters 
-        intParams = sorted(list(self.interface.keys()))
+        intParams = sorted([param for param in self.interface.keys() if param not in localInterfaceParams])
         for param in intParams:
             self.hashElem(configHash, self.interface[param])
              
         # Comm configuration parameters
         commParams = sorted(list(self.commConfig.keys()))
-        if ('transmitSlot' in commParams): # remove unique config parameters
-            commParams.remove('transmitSlot')
+        commParams = [param for param in commParams if param not in localCommParams] # remove unique config parameters
+        commParams = [param for param in commParams if param not in legacyCommParams or self.commConfig[param] != legacyCommParams[param]] # remove parameters compatible with older nodes
+        if self.commConfig.get('meshHeader', 'standard') == 'standard':
+            commParams = [param for param in commParams if param not in compactHeaderParams]
         for param in commParams:
             self.hashElem(configHash, self.commConfig[param])
 
@@ -329,6 +373,12 @@ class NodeConfig(dict):
         nodeConfig_p.tdma.adminLength = tdma['adminLength']
         nodeConfig_p.tdma.adminBytesMaxLength = tdma['adminBytesMaxLength']
         nodeConfig_p.tdma.msgPayloadMaxLength = tdma['msgPayloadMaxLength']
+        if 'aggregateMsgs' in tdma:
+            nodeConfig_p.tdma.aggregateMsgs = tdma['aggregateMsgs']
+        if 'meshHeader' in tdma:
+            nodeConfig_p.tdma.meshHeader = tdma['meshHeader']
+        if 'meshSeqNumBits' in tdma:
+            nodeConfig_p.tdma.meshSeqNumBits = tdma['meshSeqNumBits']
         
         #print(nodeConfig_p)
         #print(len(nodeConfig_p.SerializeToString()))
@@ -414,6 +464,11 @@ class NodeConfig(dict):
         tdma['adminLength'] = nodeConfig_p.tdma.adminLength
         tdma['adminBytesMaxLength'] = nodeConfig_p.tdma.adminBytesMaxLength
         tdma['msgPayloadMaxLength'] = nodeConfig_p.tdma.msgPayloadMaxLength
+        tdma['aggregateMsgs'] = nodeConfig_p.tdma.aggregateMsgs
+        if nodeConfig_p.tdma.meshHeader: # not set by older nodes
+            tdma['meshHeader'] = nodeConfig_p.tdma.meshHeader
+        if nodeConfig_p.tdma.meshSeqNumBits:
+            tdma['meshSeqNumBits'] = nodeConfig_p.tdma.meshSeqNumBits
         nodeConfig['tdmaConfig'] = tdma
         
         #print(nodeConfig)
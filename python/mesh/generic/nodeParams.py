@@ -2,11 +2,12 @@ import random
 from collections import deque
 from mesh.generic.nodeConfig import NodeConfig
 from mesh.generic.formationClock import FormationClock
+from mesh.generic.clockSource import SystemClock
 from mesh.generic.nodeState import NodeState, LinkStatus
 from mesh.generic.cmdDict import CmdDict 
 
 class NodeParams():
-    def __init__(self, configFile=[], config=[]):
+    def __init__(self, configFile=[], config=[], clockSource=None):
         if configFile:
             self.config = NodeConfig(configFile)
         elif config:
@@ -20,6 +21,9 @@ class NodeParams():
         self.restartRequested = False
         self.restartConfirmed = False
 
+        # Source of time for node (system clock unless simulated)
+        self.clockSource = clockSource if clockSource else SystemClock()
+
         self.setupParams()
 
     def setupParams(self):
@@ -35,7 +39,7 @@ class NodeParams():
         self.initNodeStatus()
         
         # Formation clock
-        self.clock = FormationClock()
+        self.clock = FormationClock(clockSource=self.clockSource)
 
 
     def initNodeStatus(self):
@@ -1,7 +1,8 @@
 from enum import IntEnum
-from switch import switch
-import serial
+import serial, math
 from mesh.generic.customExceptions import NoSerialConnection
+from mesh.generic.txQueue import TxQueue
+from mesh.generic.clockSource import SystemClock
 
 class RadioMode(IntEnum):
     off = 0
@@ -9,7 +10,29 @@ class RadioMode(IntEnum):
     receive = 2
     transmit = 3
 
+radioModeMethods = {RadioMode.off: 'setOff', RadioMode.sleep: 'setSleep', RadioMode.receive: 'setReceive', RadioMode.transmit: 'setTransmit'} # mode change method for each radio mode
+
 class Radio(object):
+    """Base radio interface.
+
+    Received bytes are stored in a ring buffer that is allocated once.  Unread bytes start at rxReadPos and may wrap around the end of the buffer, so they are accessed as spans (see getRxSpans).  Bytes to transmit are held as a queue of encoded frames (see TxQueue).
+
+    If a transmit rate is configured, transmissions are paced with a token bucket that models the radio transmit FIFO.  Bytes written to the radio (including any radio framing, see encodedTxLength) fill the FIFO and drain at the transmit rate, and sendBuffer only writes as many bytes as the free FIFO space allows (and, if a deadline is given, as many as can be transmitted by the deadline).  Unsent bytes remain queued for the next call.
+
+    Attributes:
+        rxReadInto: Flag indicating that received bytes are read directly into the receive buffer (False if received bytes require processing by processRxBytes).
+        rxBuffer: Receive ring buffer.
+        rxReadPos: Position of first unread byte in rxBuffer.
+        bytesInRxBuffer: Number of unread bytes in rxBuffer.
+        rxOverflowCount: Number of received bytes discarded because the receive buffer was full.
+        txQueue: Queue of frames awaiting transmission.
+        txRate: Radio transmit rate in bytes per second (0 if transmissions are not paced).
+        txFifoSize: Size of radio transmit FIFO in bytes (0 if unlimited).
+        txFifoLevel: Estimated number of bytes in radio transmit FIFO at txLevelTime.
+        txLevelTime: Time of last FIFO level update.
+        clockSource: Source of time for transmit pacing.
+    """
+    rxReadInto = True
 
     def __init__(self, serial, config):
         self.serial = serial
@@ -18,27 +41,94 @@ class Radio(object):
         # Read
         self.uartNumBytesToRead = config['uartNumBytesToRead']
         self.rxBufferSize = config['rxBufferSize']
+        self.rxOverflowCount = 0
         self.clearRxBuffer()
 
         # Send
-        self.txBuffer = bytearray()
+        self.txQueue = TxQueue()
+
+        # Transmit pacing
+        self.txRate = config.get('txRate', 0)
+        self.txFifoSize = config.get('txFifoSize', 0)
+        self.txFifoLevel = 0.0
+        self.txLevelTime = 0.0
+        self.clockSource = SystemClock()
+
+    @property
+    def txBuffer(self):
+        """Bytes awaiting transmission."""
+        return self.txQueue
+
+    @txBuffer.setter
+    def txBuffer(self, msgBytes):
+        self.txQueue.clear()
+        self.txQueue.append(msgBytes)
+
+    def getTxPendingBytes(self):
+        """Returns number of bytes awaiting transmission."""
+        return self.txQueue.pendingBytes
     
+    def updateTxFifoLevel(self):
+        """Drain transmit FIFO at transmit rate up to current time.
+
+        Returns:
+            Current time.
+        """
+        currentTime = self.clockSource.getTime()
+        self.txFifoLevel = max(0.0, self.txFifoLevel - (currentTime - self.txLevelTime) * self.txRate)
+        self.txLevelTime = currentTime
+        return currentTime
+
+    def getTxAllowance(self, deadline=None):
+        """Returns number of bytes that can currently be written to radio without overflowing its transmit FIFO or, if deadline is provided, without transmission extending past the deadline.  None is returned if transmissions are not paced."""
+        if not self.txRate:
+            return None
+
+        currentTime = self.updateTxFifoLevel()
+        allowance = (self.txFifoSize - self.txFifoLevel) if self.txFifoSize else math.inf
+        if deadline != None:
+            allowance = min(allowance, (deadline - currentTime) * self.txRate - self.txFifoLevel)
+        if allowance == math.inf:
+            return None
+        return max(0, int(allowance + 1e-6)) # tolerate rounding of drained bytes
+
+    def getTxCompleteTime(self):
+        """Returns expected time that all bytes written to radio will have been transmitted."""
+        if not self.txRate:
+            return self.clockSource.getTime()
+        currentTime = self.updateTxFifoLevel()
+        return currentTime + self.txFifoLevel / self.txRate
+
+    def encodedTxLength(self, msgLength):
+        """Returns number of bytes written to radio to send provided number of message bytes, including any radio framing."""
+        return msgLength
+
+    def getMaxTxMsgLength(self, numBytes):
+        """Returns number of message bytes that can be sent without writing more than provided number of bytes to radio."""
+        msgLength = numBytes
+        while msgLength > 0 and self.encodedTxLength(msgLength) > numBytes: # remove excess framed bytes
+            msgLength -= self.encodedTxLength(msgLength) - numBytes
+        return max(0, msgLength)
+
+    def getMsgBytesSent(self, msgLength, bytesWritten):
+        """Returns number of message bytes sent when only some of the bytes required to send them were written to radio.  Message bytes whose radio framing was not completely written are not counted as sent.
+
+        Args:
+            msgLength: Number of message bytes provided to sendMsg.
+            bytesWritten: Number of bytes written to radio (returned by sendMsg).
+        """
+        return min(msgLength, bytesWritten)
+
+    def meterTx(self, numBytes):
+        """Add bytes written to radio to transmit FIFO level."""
+        if self.txRate and numBytes:
+            self.updateTxFifoLevel()
+            self.txFifoLevel += numBytes
+
     def setMode(self, mode):
         """Change radio operating mode (i.e. rx, tx, sleep, off)."""
-        if mode != self.mode:
-            for case in switch(mode):
-                if case(RadioMode.off):
-                    self.setOff()
-                    break
-                if case(RadioMode.sleep):
-                    self.setSleep()
-                    break
-                if case(RadioMode.receive):
-                    self.setReceive()
-                    break
-                if case(RadioMode.transmit):
-                    self.setTransmit()
-                    break
+        if mode != self.mode and mode in radioModeMethods:
+            getattr(self, radioModeMethods[mode])()
 
     def setSleep(self):
         self.mode = RadioMode.sleep
@@ -52,10 +142,18 @@ class Radio(object):
     def setTransmit(self):
         self.mode = RadioMode.transmit
 
+    def fileno(self):
+        """Returns file descriptor that becomes readable when bytes are received (None if not available)."""
+        if hasattr(self.serial, 'fileno'):
+            return self.serial.fileno()
+        return None
+
     # Read methods
     def clearRxBuffer(self):
-        """Reset receive buffer."""
-        self.rxBuffer = bytearray(self.rxBufferSize)
+        """Reset receive buffer.  The buffer is only reallocated if its size has changed."""
+        if not isinstance(getattr(self, 'rxBuffer', None), bytearray) or len(self.rxBuffer) != self.rxBufferSize:
+            self.rxBuffer = bytearray(self.rxBufferSize)
+        self.rxReadPos = 0
         self.bytesInRxBuffer = 0
 
     def readBytes(self, bufferFlag):
@@ -64,6 +162,19 @@ class Radio(object):
             raise NoSerialConnection("No serial connection available")
             return 0 
         
+        # Read directly into receive buffer
+        if (self.rxReadInto and hasattr(self.serial, 'readinto')):
+            rxState = (self.rxReadPos, self.bytesInRxBuffer)
+            if bufferFlag == False: # replace buffer contents with new bytes
+                self.clearRxBuffer()
+            try:
+                bytesRead = self.readIntoRxBuffer(self.serial.readinto, self.uartNumBytesToRead)
+            except serial.SerialException:
+                bytesRead = 0
+            if bytesRead == 0: # nothing read so retain existing buffer contents
+                self.rxReadPos, self.bytesInRxBuffer = rxState
+            return bytesRead
+
         # Read from serial port
         newBytes = []
         try:
@@ -77,6 +188,35 @@ class Radio(object):
 
         return len(newBytes)
 
+    def readIntoRxBuffer(self, readInto, maxBytes):
+        """Fill free space in receive buffer using provided readinto-style method.
+
+        Args:
+            readInto: Method that fills a provided writable buffer and returns the number of bytes written (e.g. serial readinto or socket recv_into).
+            maxBytes: Maximum number of bytes to read.
+
+        Returns:
+            Number of bytes read.
+        """
+        bytesRead = 0
+        with memoryview(self.rxBuffer) as rxBytes:
+            while bytesRead < maxBytes:
+                # Contiguous free space following unread bytes
+                writePos = (self.rxReadPos + self.bytesInRxBuffer) % len(self.rxBuffer)
+                spanLength = min(maxBytes - bytesRead, len(self.rxBuffer) - self.bytesInRxBuffer, len(self.rxBuffer) - writePos)
+                if spanLength <= 0: # buffer full
+                    break
+
+                numBytes = readInto(rxBytes[writePos:writePos+spanLength])
+                if not numBytes: # no more bytes available
+                    break
+                self.bytesInRxBuffer += numBytes
+                bytesRead += numBytes
+                if numBytes < spanLength: # all available bytes read
+                    break
+
+        return bytesRead
+
     def processRxBytes(self, newBytes, bufferFlag):
         """Default behavior just adds directly to rxBuffer."""
         self.bufferRxMsg(newBytes, bufferFlag)
@@ -86,19 +226,52 @@ class Radio(object):
         if not newBytes:
             return
 
+        if bufferFlag == False: # Replace buffer contents with new bytes
+            self.clearRxBuffer()
+
         numNewBytes = len(newBytes)    
-        if bufferFlag == True: # Add new bytes read to buffer
-            if (self.bytesInRxBuffer + numNewBytes) <= len(self.rxBuffer): # Prevent rx buffer overload  
-                self.rxBuffer[self.bytesInRxBuffer:self.bytesInRxBuffer+numNewBytes] = newBytes
-                self.bytesInRxBuffer += numNewBytes
-            else:
-                print("Warning: Radio buffer rx overflow.")
-        else: # Replace buffer contents with new bytes
-            self.rxBuffer[0:numNewBytes] = newBytes
-            self.bytesInRxBuffer = numNewBytes
+        if (self.bytesInRxBuffer + numNewBytes) > len(self.rxBuffer): # Prevent rx buffer overload
+            self.rxOverflowCount += numNewBytes
+            return
+
+        # Add new bytes to buffer (wrapping around end of buffer if necessary)
+        writePos = (self.rxReadPos + self.bytesInRxBuffer) % len(self.rxBuffer)
+        firstLength = min(numNewBytes, len(self.rxBuffer) - writePos)
+        self.rxBuffer[writePos:writePos+firstLength] = newBytes[0:firstLength]
+        if firstLength < numNewBytes:
+            self.rxBuffer[0:numNewBytes-firstLength] = newBytes[firstLength:]
+        self.bytesInRxBuffer += numNewBytes
+
+    def getRxRanges(self):
+        """Returns list of (start, end) positions of unread bytes in rxBuffer in the order received."""
+        if self.bytesInRxBuffer == 0:
+            return []
+        end = self.rxReadPos + self.bytesInRxBuffer
+        if end <= len(self.rxBuffer):
+            return [(self.rxReadPos, end)]
+        else: # unread bytes wrap around end of buffer
+            return [(self.rxReadPos, len(self.rxBuffer)), (0, end - len(self.rxBuffer))]
+
+    def getRxSpans(self):
+        """Returns memoryviews of unread bytes in rxBuffer in the order received."""
+        rxBytes = memoryview(self.rxBuffer)
+        return [rxBytes[start:end] for start, end in self.getRxRanges()]
+
+    def consumeRxBytes(self, numBytes):
+        """Mark unread bytes as read.
+
+        Args:
+            numBytes: Number of bytes to remove from front of unread bytes.
+        """
+        numBytes = min(numBytes, self.bytesInRxBuffer)
+        self.rxReadPos = (self.rxReadPos + numBytes) % len(self.rxBuffer)
+        self.bytesInRxBuffer -= numBytes
+        if self.bytesInRxBuffer == 0: # restart at beginning of buffer
+            self.rxReadPos = 0
 
     def getRxBytes(self):
-        return self.rxBuffer[0:self.bytesInRxBuffer]
+        """Returns copy of unread bytes."""
+        return b''.join(self.getRxSpans())
 
     # Send methods
     def sendBytes(self, msgBytes):
@@ -111,7 +284,7 @@ class Radio(object):
             return self.serial.write(msgBytes)
             
         except serial.SerialException:
-            pass
+            return 0
             
     def sendMsg(self, msgBytes):
         """Packages provided bytes into properly formatted message for radio and transmits.  This method provides no bandwidth usage control."""
@@ -120,29 +293,39 @@ class Radio(object):
         if len(msgBytes) > 0:
             msg = self.createMsg(msgBytes)
             bytesSent = self.sendBytes(msg)
+            self.meterTx(bytesSent)
 
         return bytesSent
 
     def bufferTxMsg(self, msgBytes):
-        self.txBuffer += msgBytes
+        """Add encoded frame to transmit queue."""
+        self.txQueue.append(msgBytes)
 
     def createMsg(self, msgBytes):
         """Default behavior is to just pass through raw bytes."""
         return msgBytes
 
-    def sendBuffer(self, maxBytesToSend=0):
-        """This is the primary method for transmitting bytes using the Radio.  This method allows the radio to regulate how much data is being sent out."""
+    def sendBuffer(self, maxBytesToSend=0, deadline=None):
+        """This is the primary method for transmitting bytes using the Radio.  This method allows the radio to regulate how much data is being sent out.
+
+        Args:
+            maxBytesToSend: Maximum number of bytes to send (0 for no limit).
+            deadline: Time that paced transmissions must be complete by (see getTxAllowance).
+        """
         bytesSent = 0
 
-        if self.txBuffer:
-            if maxBytesToSend > 0 and len(self.txBuffer) > maxBytesToSend: # too much data to send
-                bytesSent = self.sendMsg(self.txBuffer[:maxBytesToSend])
-                self.txBuffer = self.txBuffer[maxBytesToSend:] # remove sent bytes from buffer
-            else: # send entire buffer
-                bytesSent = self.sendMsg(self.txBuffer)
-            
-                # Clear tx buffer
-                self.txBuffer = bytearray()
+        allowance = self.getTxAllowance(deadline)
+        if allowance != None: # transmissions paced
+            allowance = self.getMaxTxMsgLength(allowance) # leave room for radio framing
+            if allowance == 0:
+                return 0
+            maxBytesToSend = min(maxBytesToSend, allowance) if maxBytesToSend > 0 else allowance
+
+        if self.txQueue:
+            # Send up to maxBytesToSend bytes and advance send cursor past those written (unsent bytes remain queued)
+            msgBytes = self.txQueue.getBytes(maxBytesToSend)
+            bytesSent = self.sendMsg(msgBytes) or 0
+            self.txQueue.consume(self.getMsgBytesSent(len(msgBytes), bytesSent))
 
         return bytesSent
 
@@ -61,13 +61,16 @@ class SerialComm(object):
         self.parseMsgs()
 
     def parseMsgs(self): 
-        # Parse messages
-        bytesRead = self.radio.getRxBytes()
-        
-        #if (len(bytesRead) > 0):
-            #print("Node " + str(self.nodeParams.config.nodeId) + " - Number of bytes read: " + str(len(bytesRead)))
+        # Parse messages directly from radio receive buffer
+        #if (self.radio.bytesInRxBuffer > 0):
+            #print("Node " + str(self.nodeParams.config.nodeId) + " - Number of bytes read: " + str(self.radio.bytesInRxBuffer))
         
-        self.msgParser.parseMsgs(bytesRead)
+        if not self.msgParser.msg and hasattr(self.radio, 'getRxDatagrams'): # no message format so messages are delimited by datagrams
+            for datagram in self.radio.getRxDatagrams():
+                self.msgParser.storeMsg(datagram)
+        else:
+            for start, end in self.radio.getRxRanges():
+                self.msgParser.parseMsgs(self.radio.rxBuffer, end, start)
         
         #print(str(self.nodeParams.config.nodeId) + " - " + str(self.radio.bytesInRxBuffer)) 
 
@@ -136,9 +139,8 @@ class SerialComm(object):
     def processMsgs(self, args=[]):
         """Read and process any received messages."""
         self.readMsgs()
-        if self.msgParser.parsedMsgs:
-            for i in range(len(self.msgParser.parsedMsgs)):
-                self.processMsg(self.msgParser.parsedMsgs.pop(0), args)
+        for msg in self.msgParser.getMsgs():
+            self.processMsg(msg, args)
     
     def processMsg(self, msg, args):
         """Processes parsed serial messages.
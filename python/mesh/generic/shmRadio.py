@@ -0,0 +1,252 @@
+import os, tempfile, time
+from struct import Struct
+from multiprocessing import shared_memory
+from mesh.generic.datagramRadio import DatagramRadio
+
+ShmHeaderStruct = Struct('<I') # ring header ready word and capacity
+ShmIndexStruct = Struct('<I') # ring read and write indices
+ShmMsgLengthStruct = Struct('<I') # length prefix of each message in ring
+ShmIndexMask = 0xFFFFFFFF
+ShmReadyWord = 0x474E4952 # 'RING'
+ShmReadyPos = 0
+ShmCapacityPos = 4
+ShmWriteIndexPos = 64
+ShmReadIndexPos = 128 # read and write indices kept on separate cache lines
+ShmDataPos = 192
+ShmDefaultSize = 65536
+ShmAttachTimeout = 1.0 # seconds to wait for creator to initialize ring
+ShmAttachRetryPeriod = 0.001
+
+class ShmRing(object):
+    """Single-producer/single-consumer message ring in a named shared memory block.
+
+    The creator of the ring stores its capacity and then a ready word in the ring header, and the other end of the link waits for the ready word before attaching.  The writer only updates the write index and the reader only updates the read index, so no lock is required.  Indices are free running 32-bit byte counts and the ring capacity is a power of two, so positions in the ring are found by masking.  Each message is stored with a length prefix and may wrap around the end of the ring.
+
+    Attributes:
+        shm: Shared memory block.
+        created: Flag indicating that this instance created the shared memory block.
+        capacity: Size of ring data area in bytes.
+        data: View of ring data area.
+    """
+
+    def __init__(self, name, size=ShmDefaultSize):
+        capacity = 1 << max(size-1, 1).bit_length() # round up to power of two
+        deadline = time.monotonic() + ShmAttachTimeout
+        while True:
+            try:
+                self.shm = shared_memory.SharedMemory(name=name, create=True, size=ShmDataPos + capacity)
+                self.created = True
+                ShmHeaderStruct.pack_into(self.shm.buf, ShmCapacityPos, capacity)
+                ShmHeaderStruct.pack_into(self.shm.buf, ShmReadyPos, ShmReadyWord) # publish ring to other end of link
+                break
+            except FileExistsError: # attach to ring created by other end of link
+                pass
+
+            attachCapacity = self.attach(name)
+            if attachCapacity:
+                capacity = attachCapacity
+                break
+            if time.monotonic() > deadline:
+                raise ValueError("Shared memory ring " + name + " was not initialized by its creator.")
+            time.sleep(ShmAttachRetryPeriod)
+
+        self.capacity = capacity
+        self.data = self.shm.buf[ShmDataPos:ShmDataPos + capacity]
+
+    def attach(self, name):
+        """Attach to ring created by other end of link.
+
+        Args:
+            name: Name of shared memory block.
+
+        Returns:
+            Ring capacity, or None if the ring has not yet been initialized by its creator.
+        """
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except (ValueError, FileNotFoundError): # block not yet sized by creator or already removed
+            return None
+
+        readyWord = ShmHeaderStruct.unpack_from(shm.buf, ShmReadyPos)[0]
+        capacity = ShmHeaderStruct.unpack_from(shm.buf, ShmCapacityPos)[0]
+        if readyWord != ShmReadyWord or shm.size < ShmDataPos + capacity: # creator has not finished initializing ring
+            shm.close()
+            return None
+
+        self.shm = shm
+        self.created = False
+        return capacity
+
+    def getIndex(self, indexPos):
+        return ShmIndexStruct.unpack_from(self.shm.buf, indexPos)[0]
+
+    def setIndex(self, indexPos, index):
+        ShmIndexStruct.pack_into(self.shm.buf, indexPos, index & ShmIndexMask)
+
+    def bytesUsed(self):
+        """Returns number of bytes in ring not yet read."""
+        return (self.getIndex(ShmWriteIndexPos) - self.getIndex(ShmReadIndexPos)) & ShmIndexMask
+
+    def getSpans(self, index, length):
+        """Returns views of ring data starting at provided index (two views if data wraps around end of ring)."""
+        pos = index & (self.capacity - 1)
+        if pos + length <= self.capacity:
+            return [self.data[pos:pos+length]]
+        else:
+            return [self.data[pos:], self.data[:pos+length-self.capacity]]
+
+    def copyIn(self, index, srcBytes):
+        """Copy provided bytes into ring starting at provided index."""
+        with memoryview(srcBytes) as source:
+            pos = 0
+            for span in self.getSpans(index, len(source)):
+                span[:] = source[pos:pos+len(span)]
+                pos += len(span)
+
+    def write(self, msgBytes):
+        """Write message to ring.
+
+        Args:
+            msgBytes: Message bytes.
+
+        Returns:
+            False if there is not enough free space in ring for message.
+        """
+        msgLength = len(msgBytes)
+        if ShmMsgLengthStruct.size + msgLength > self.capacity - self.bytesUsed():
+            return False
+
+        index = self.getIndex(ShmWriteIndexPos)
+        self.copyIn(index, ShmMsgLengthStruct.pack(msgLength))
+        self.copyIn(index + ShmMsgLengthStruct.size, msgBytes)
+        self.setIndex(ShmWriteIndexPos, index + ShmMsgLengthStruct.size + msgLength) # publish message to reader
+        return True
+
+    def peekMsg(self):
+        """Returns views of next unread message in ring (None if ring is empty).  The message remains in the ring until consumeMsg is called."""
+        if self.bytesUsed() == 0:
+            return None
+
+        index = self.getIndex(ShmReadIndexPos)
+        msgLength = ShmMsgLengthStruct.unpack(b''.join(self.getSpans(index, ShmMsgLengthStruct.size)))[0]
+        return self.getSpans(index + ShmMsgLengthStruct.size, msgLength)
+
+    def consumeMsg(self, msgLength):
+        """Remove message of provided length from front of ring."""
+        self.setIndex(ShmReadIndexPos, self.getIndex(ShmReadIndexPos) + ShmMsgLengthStruct.size + msgLength)
+
+    def close(self):
+        """Detach from shared memory block, removing it if created by this instance."""
+        self.data.release()
+        self.shm.close()
+        if self.created:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+class ShmRadio(DatagramRadio):
+    """Radio interface over a pair of shared memory rings for communicating between processes on the same host.
+
+    Messages are read from one ring and written to the other, so message boundaries are retained without any framing.  The first end of the link to be created creates the rings and the other end attaches to them.  Optionally, each write also signals a named pipe so that the reader can wait on fileno() instead of polling.
+
+    Attributes:
+        rxRing: Ring messages are received from.
+        txRing: Ring messages are transmitted to.
+        txDropCount: Number of messages discarded because the transmit ring was full.
+        wakeupPaths: Paths of named pipes used to signal new messages in (rx, tx) rings.
+        wakeupRead: File descriptor signaled when a message is written to the rx ring (None if wakeups disabled).
+        wakeupWrite: File descriptor used to signal reader of tx ring (None if not yet open).
+    """
+
+    def __init__(self, config):
+        DatagramRadio.__init__(self, [], config)
+
+        size = config.get('shmSize', ShmDefaultSize)
+        self.rxRing = ShmRing(config['readName'], size)
+        self.txRing = ShmRing(config['writeName'], size)
+        self.txDropCount = 0
+
+        # Wakeup signaling
+        self.wakeupRead = None
+        self.wakeupHold = None
+        self.wakeupWrite = None
+        self.wakeupPaths = []
+        if config.get('wakeup', False):
+            self.wakeupPaths = [os.path.join(tempfile.gettempdir(), name + '.wakeup') for name in [config['readName'], config['writeName']]]
+            for path in self.wakeupPaths:
+                try:
+                    os.mkfifo(path)
+                except FileExistsError:
+                    pass
+            self.wakeupRead = os.open(self.wakeupPaths[0], os.O_RDONLY | os.O_NONBLOCK)
+            self.wakeupHold = os.open(self.wakeupPaths[0], os.O_WRONLY | os.O_NONBLOCK) # keeps pipe from signaling end of file when other end closes
+
+    def fileno(self):
+        """Returns file descriptor that becomes readable when new messages are received."""
+        return self.wakeupRead
+
+    def readBytes(self, bufferFlag):
+        """Reads all available messages from rx ring.  Reading stops once the ring is empty or the receive buffer is full."""
+        if bufferFlag == False: # replace buffer contents with new bytes
+            self.clearRxBuffer()
+
+        # Clear wakeup signals
+        if self.wakeupRead is not None:
+            try:
+                while os.read(self.wakeupRead, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+        bytesRead = 0
+        while True:
+            msg = self.rxRing.peekMsg()
+            if msg is None: # no more messages
+                break
+            if not self.bufferDatagram(msg): # receive buffer full so leave message in ring
+                break
+            msgLength = sum(len(span) for span in msg)
+            self.rxRing.consumeMsg(msgLength)
+            bytesRead += msgLength
+
+        return bytesRead
+
+    def sendBytes(self, msgBytes):
+        """Write bytes to tx ring as a single message."""
+        if not self.txRing.write(msgBytes):
+            self.txDropCount += 1
+            return 0
+
+        self.signalWakeup()
+        return len(msgBytes)
+
+    def signalWakeup(self):
+        """Signal reader of tx ring that a new message is available."""
+        if not self.wakeupPaths:
+            return
+
+        if self.wakeupWrite is None:
+            try:
+                self.wakeupWrite = os.open(self.wakeupPaths[1], os.O_WRONLY | os.O_NONBLOCK)
+            except OSError: # no reader yet
+                return
+
+        try:
+            os.write(self.wakeupWrite, b'\x00')
+        except BlockingIOError: # pipe full so reader already signaled
+            pass
+        except OSError: # reader closed
+            os.close(self.wakeupWrite)
+            self.wakeupWrite = None
+
+    def close(self):
+        """Close shared memory rings and wakeup pipes."""
+        for fd in [self.wakeupRead, self.wakeupHold, self.wakeupWrite]:
+            if fd is not None:
+                os.close(fd)
+        self.wakeupRead = None
+        self.wakeupHold = None
+        self.wakeupWrite = None
+        self.rxRing.close()
+        self.txRing.close()
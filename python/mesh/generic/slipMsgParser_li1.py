@@ -1,4 +1,4 @@
-import crcmod.predefined # crc
+from mesh.generic.crc import CRC16_ARC
 from mesh.generic.msgParser import MsgParser
 from mesh.generic.slipMsg_li1 import SLIPmsg_Li1
 from struct import pack
@@ -15,7 +15,7 @@ class SLIPMsgParser_Li1(MsgParser):
     def __init__(self, config):
         MsgParser.__init__(self, config)
 
-        self.crc16 = crcmod.predefined.mkCrcFun('crc16')
+        self.crc16 = CRC16_ARC # shared crc16
         self.slipMsg = SLIPmsg_Li1(256)
 
     def parseSerialMsg(self, msgBytes, msgStart):
@@ -0,0 +1,87 @@
+import re
+from mesh.generic.delimitedMsg import DelimitedMsg
+
+class StuffedMsg(DelimitedMsg):
+    """Table-driven byte-stuffing framing engine shared by the SLIP and HDLC message formats.
+
+    Messages are delimited by an END byte.  Any reserved bytes in the message contents are replaced by an ESC byte followed by a substitution code defined in the escape table.  Encoding is performed with bulk substitution passes over the whole message, and complete messages that contain no escape sequences are returned as memoryviews into the raw serial data rather than copies (see DelimitedMsg).
+
+    Attributes:
+        buffer: Partial escape sequence awaiting the remainder of its bytes.
+        escByte: Escape byte.
+        escTable: Dictionary of reserved bytes and their escape substitution codes.
+    """
+
+    def __init__(self, maxLength, endByte, escByte, escTable, crc=None, crcLength=0):
+        DelimitedMsg.__init__(self, maxLength, endByte, crc, crcLength)
+
+        # Escape tables
+        self.escByte = escByte
+        self.escTable = escTable
+
+        # Encode substitutions (ESC must be substituted first so that inserted ESC bytes are not escaped again)
+        self.encodeSubs = [(escByte, escByte + escTable[escByte])]
+        for rawByte, code in escTable.items():
+            if rawByte != escByte:
+                self.encodeSubs.append((rawByte, escByte + code))
+
+        # Decode substitutions (unrecognized escape codes decode to ESC)
+        self.decodeTable = dict()
+        for rawByte, code in escTable.items():
+            self.decodeTable[code] = rawByte
+        self.escPattern = re.compile(re.escape(escByte) + b'(.)', re.DOTALL)
+
+    def getMsgView(self, byteList, pos, end):
+        if (byteList.find(self.escByte, pos, end) == -1): # no escape sequences
+            return memoryview(byteList)[pos:end]
+        return None
+
+    def unstuffBytes(self, rawBytes, partial):
+        """Replace escape sequences in raw message bytes and append them to the decoded message.
+
+        Args:
+            rawBytes: Raw message bytes containing no END bytes.
+            partial: Flag indicating whether more message bytes are still to come.
+        """
+        if (self.buffer): # prepend partial escape sequence from previous bytes
+            rawBytes = self.buffer + rawBytes
+            self.buffer = b''
+
+        if (partial): # hold back escape sequence that is not completely available
+            numTrailingEsc = len(rawBytes) - len(rawBytes.rstrip(self.escByte))
+            if (numTrailingEsc % 2 == 1):
+                self.buffer = self.escByte
+                rawBytes = rawBytes[:-1]
+
+        if (self.escByte in rawBytes): # replace escape sequences
+            rawBytes = self.escPattern.sub(self.unescape, rawBytes)
+
+        self.appendMsgBytes(rawBytes)
+
+    def unescape(self, match):
+        return self.decodeTable.get(match.group(1), self.escByte)
+
+    def stuffBytes(self, msgBytes):
+        """Replace reserved bytes in provided message contents with escape sequences."""
+        for rawByte, escSeq in self.encodeSubs:
+            if rawByte in msgBytes:
+                msgBytes = msgBytes.replace(rawByte, escSeq)
+        return msgBytes
+
+    def maxEncodedLength(self, msgLength):
+        """Returns the worst case length of an encoded message including framing bytes.
+
+        Args:
+            msgLength: Length of message contents.
+        """
+        return 2*(msgLength + self.crcLength) + 2 # every byte escaped
+
+    def encodedLength(self, msgBytes, extraLength=0):
+        """Returns the length of provided message contents once encoded including framing bytes.  Escape expansion is counted exactly for the provided bytes, while any extra bytes not yet known (e.g. a header) and the CRC are assumed to be escaped.
+
+        Args:
+            msgBytes: Message contents.
+            extraLength: Number of additional message bytes.
+        """
+        numEscaped = sum(msgBytes.count(rawByte) for rawByte in self.escTable)
+        return len(msgBytes) + numEscaped + 2*(extraLength + self.crcLength) + 2
@@ -1,13 +1,14 @@
 from mesh.generic.serialComm import SerialComm
-from switch import switch
-import random, time, math
+import random, math
+from collections import deque
+from bisect import bisect_right
 from math import ceil
 from copy import deepcopy
 from mesh.generic.msgParser import MsgParser
 from mesh.generic.slipMsg import SLIPMsg
 from mesh.generic.radio import RadioMode
 from mesh.generic.cmds import TDMACmds, NodeCmds
-from mesh.generic.tdmaState import TDMAStatus, TDMAMode, TDMABlockTxStatus
+from mesh.generic.tdmaState import TDMAStatus, TDMAMode, TDMABlockTxStatus, TDMAFrameEvent
 from mesh.generic.cmdDict import CmdDict
 from mesh.generic.command import Command
 from mesh.generic.customExceptions import InvalidTDMASlotNumber
@@ -16,9 +17,20 @@ from mesh.generic.nodeCmdProcessor import NodeCmdProcessor
 from mesh.generic.dijkstra import findShortestPaths
 from mesh.generic.nodeConfig import NodeConfig
 from mesh.generic.blockTx import BlockTx, BlockTxPacketStatus
+from mesh.generic.timingHistogram import TimingHistogram
+from mesh.generic.meshTxQueue import MeshTxQueue
+from mesh.generic.meshHeader import packCompactHeader, unpackCompactHeader, compactHeaderLength, isCompactHeader, relayCompactHeader
 import struct
 
 BLOCK_TX_MSG = 1
+AGGREGATED_MSG = 2 # packet payload contains multiple messages
+
+# TDMA timing statistics
+TDMATimingStats = ['modeChangeLateness', # time between schedule boundary and execution of new mode
+                   'txStartLateness', # time between beginTxTime and first bytes sent to radio
+                   'rxReadDuration', # duration of each radio read
+                   'sleepProcessingDuration', # duration of processing in sleep period
+                   'sleepRemaining'] # time remaining in frame after sleep period processing
 
 class TDMAComm(SerialComm):
     def __init__(self, msgProcessors, radio, msgParser, nodeParams):
@@ -26,6 +38,10 @@ class TDMAComm(SerialComm):
             msgProcessors = [NodeCmdProcessor, TDMACmdProcessor]
 
         super().__init__(msgProcessors, nodeParams, radio, parser=msgParser)
+        self.msgParser.msgViews = True # mesh packets are processed directly from the radio receive buffer
+        self.radio.clockSource = nodeParams.clockSource # pace radio transmissions against node clock
+        self.blockingSleep = True # sleep until end of frame (disabled when sleep is scheduled externally)
+        self.timingStats = {name: TimingHistogram() for name in TDMATimingStats} # retained through reinitialization
 
         self.reinit(nodeParams)
     
@@ -89,6 +105,10 @@ class TDMAComm(SerialComm):
         # Mesh header information
         self.meshPacketHeaderFormat = '<BBHHHB'
         self.meshHeaderLen = struct.calcsize(self.meshPacketHeaderFormat)
+        self.meshSeqNum = random.randrange(1 << 12) # sequence number of packets sent with compact header
+        self.meshSeqHistory = dict() # recent sequence numbers from each originating node (compact header)
+        self.meshSubMsgLengthFormat = '<H' # length of each message in aggregated packets
+        self.meshSubMsgLengthLen = struct.calcsize(self.meshSubMsgLengthFormat)
 
         # Block Tx information
         self.blockTx = None
@@ -100,8 +120,7 @@ class TDMAComm(SerialComm):
         self.enabled = True
 
         # Mesh data in/out buffers
-        #self.meshQueueIn = [b''] * (self.maxNumSlots + 1)
-        self.meshQueueIn = []
+        self.meshQueueIn = MeshTxQueue(nodeParams.config.commConfig['txQueueMaxDepth'])
         self.hostBuffer = bytearray()
         self.blockTxOut = dict()
 
@@ -111,17 +130,24 @@ class TDMAComm(SerialComm):
         self.meshPaths = [[]*self.maxNumSlots] * self.maxNumSlots
         self.neighbors = []
 
+        # TDMA frame schedule
+        self.buildFrameSchedule()
+        self.lastFrameEvent = None
+        self.txStartPending = False
+        self.modeHandlers = {TDMAMode.admin: self.executeAdminMode, TDMAMode.sleep: self.executeSleepMode, TDMAMode.init: self.executeInitMode, TDMAMode.receive: self.executeReceiveMode, TDMAMode.transmit: self.executeTransmitMode, TDMAMode.failsafe: self.executeFailsafeMode}
+
         # Delay init (for full network restart)
         if (initDelay):
-            time.sleep(initDelay)
+            self.nodeParams.clockSource.sleep(initDelay)
 
         # Network metrics
         self.bytesSent = 0
         self.bytesRcvd = 0
+        self.txDiscardedBytes = 0 # paced bytes not sent by end of transmit period
 
     def execute(self):
         """Execute communication functions."""
-        currentTime = time.time()
+        currentTime = self.nodeParams.clockSource.getTime()
 
         # Initialize mesh network
         if self.inited == False:
@@ -172,49 +198,41 @@ class TDMAComm(SerialComm):
 
     
         # Perform mode specific behavior
-        for case in switch(self.tdmaMode):
-            if case(TDMAMode.admin):
-                self.admin()
-                break
-            if case(TDMAMode.sleep):
-                # Set radio to sleep mode
+        self.modeHandlers[self.tdmaMode]()
+
+    def executeAdminMode(self):
+        self.admin()
+
+    def executeSleepMode(self):
+        # Set radio to sleep mode
+        self.radio.setMode(RadioMode.sleep)
+
+    def executeInitMode(self):
+        # Prepare radio to receive or transmit
+        self.radio.setMode(self.frameEvent.radioMode)
+
+    def executeReceiveMode(self):
+        # Read data if TDMA message end not yet found
+        if self.receiveComplete == False and self.slotTime >= self.rxReadTime:
+            self.radio.setMode(RadioMode.receive) # set radio mode
+            self.receiveComplete = self.readMsgs()
+            if self.receiveComplete == True:
+                #print("Node " + str(self.nodeParams.config.nodeId) + " - End of receive slot " + str(self.slotNum)) 
+                # Set radio to sleep
                 self.radio.setMode(RadioMode.sleep)
-                break
-            if case(TDMAMode.init):
-                # Prepare radio to receive or transmit
-                if self.slotNum == self.transmitSlot:
-                    # Set radio to transmit mode
-                    self.radio.setMode(RadioMode.transmit)
-                else: 
-                    # Set radio to receive mode
-                    self.radio.setMode(RadioMode.receive)
-                break
-            if case(TDMAMode.receive):
-                # Read data if TDMA message end not yet found
-                if self.receiveComplete == False and self.slotTime >= self.rxReadTime:
-                    self.radio.setMode(RadioMode.receive) # set radio mode
-                    # Delay so we aren't hammering the radio
-                    #remainingRxTime = self.rxLength - (self.slotTime - self.enableLength)
-                    #time.sleep(remainingRxTime*0.2)                        
-                    self.receiveComplete = self.readMsgs()
-                    if self.receiveComplete == True:
-                        #print("Node " + str(self.nodeParams.config.nodeId) + " - End of receive slot " + str(self.slotNum)) 
-                        # Set radio to sleep
-                        self.radio.setMode(RadioMode.sleep)
-                break
-            if case(TDMAMode.transmit):
-                # Send data
-                if self.transmitComplete == False:
-                    self.radio.setMode(RadioMode.transmit) # set radio mode
-                    self.sendMsgs()
-                else: # Set radio to sleep
-                    self.radio.setMode(RadioMode.sleep)
-                break
-            if case(TDMAMode.failsafe): # Read only failsafe mode
-                # Enable radio in receive mode and read data
-                self.radio.setMode(RadioMode.receive)
-                self.readMsgs()
-                break
+
+    def executeTransmitMode(self):
+        # Send data
+        if self.transmitComplete == False:
+            self.radio.setMode(RadioMode.transmit) # set radio mode
+            self.sendMsgs()
+        else: # Set radio to sleep
+            self.radio.setMode(RadioMode.sleep)
+
+    def executeFailsafeMode(self): # Read only failsafe mode
+        # Enable radio in receive mode and read data
+        self.radio.setMode(RadioMode.receive)
+        self.readMsgs()
    
     def admin(self):
         # Disable radio upon admin completion
@@ -243,6 +261,8 @@ class TDMAComm(SerialComm):
             if (controlNode == self.nodeParams.config.nodeId): # This node is in control
                 if (self.transmitComplete == True):
                     self.radio.setMode(RadioMode.sleep)
+                elif (self.radio.getTxPendingBytes() > 0): # continue paced transmission
+                    self.sendAdminBytes()
                 elif (adminTime >= self.beginTxTime): # Execute admin transmission 
                     self.radio.setMode(RadioMode.transmit) # set radio mode
                     adminBytes = self.packageAdminData(adminLength)
@@ -251,9 +271,7 @@ class TDMAComm(SerialComm):
                         self.bufferTxMsg(packetBytes)
                     
                     #self.radio.bufferTxMsg(HDLC_END_TDMA) # append end of message byte
-                    self.bytesSent += self.sendBuffer() 
-
-                    self.transmitComplete = True
+                    self.sendAdminBytes()
                     #print("Node " + str(self.nodeParams.config.nodeId) + " - Admin transmit complete")
                     
             else: # other nodes in control this admin period
@@ -266,6 +284,12 @@ class TDMAComm(SerialComm):
                         #print("Node " + str(self.nodeParams.config.nodeId) + " - Admin receive complete")
                         self.radio.setMode(RadioMode.sleep)
 
+    def sendAdminBytes(self):
+        """Send buffered bytes during admin period.  Transmission is complete once all bytes have been sent to radio."""
+        self.bytesSent += self.sendBuffer()
+        if self.radio.getTxPendingBytes() == 0:
+            self.transmitComplete = True
+
     def executeBlockTx(self, adminTime):
         if (adminTime < self.enableLength): # Initialize radio
             if (self.blockTx.srcId == self.nodeParams.config.nodeId): # This node is transmiting
@@ -278,6 +302,8 @@ class TDMAComm(SerialComm):
             if (self.blockTx.srcId == self.nodeParams.config.nodeId): # This node is sending
                 if (self.transmitComplete == True):
                     self.radio.setMode(RadioMode.sleep)
+                elif (self.radio.getTxPendingBytes() > 0): # continue paced transmission
+                    self.sendAdminBytes()
                 elif (adminTime >= self.beginTxTime): # Execute transmission 
                     self.radio.setMode(RadioMode.transmit) # set radio mode
                     
@@ -286,9 +312,7 @@ class TDMAComm(SerialComm):
                         self.bufferTxMsg(packetBytes)
                     
                     #self.radio.bufferTxMsg(HDLC_END_TDMA) # append end of message byte
-                    self.bytesSent += self.sendBuffer() 
-
-                    self.transmitComplete = True
+                    self.sendAdminBytes()
                 else:
                     self.radio.setMode(RadioMode.sleep)
                     
@@ -309,10 +333,13 @@ class TDMAComm(SerialComm):
             self.initComm(currentTime)
             return
         else: # Join existing mesh
-            self.initMesh()
+            self.initMesh(currentTime)
  
-    def initMesh(self, currentTime=time.time()):
+    def initMesh(self, currentTime=None):
         """Initialize node mesh networks."""
+        if currentTime == None:
+            currentTime = self.nodeParams.clockSource.getTime()
+
         # Create tdma comm messages
         flooredStartTime = math.floor(self.commStartTime)
         self.tdmaCmds[TDMACmds['MeshStatus']] = Command(TDMACmds['MeshStatus'], {'commStartTimeSec': int(flooredStartTime), 'status': self.tdmaStatus, 'configHash': self.nodeParams.config.calculateHash()}, [TDMACmds['MeshStatus'], self.nodeParams.config.nodeId], self.nodeParams.config.commConfig['statusTxInterval'])
@@ -344,7 +371,7 @@ class TDMAComm(SerialComm):
             # Assume no existing mesh and initialize network
             self.commStartTime = math.ceil(currentTime)
             print("Node " + str(self.nodeParams.config.nodeId) + " - Initializing new mesh network")
-            self.initMesh()
+            self.initMesh(currentTime)
         else: # Wait for initialization timer to lapse
             # Turn on radios and check for comm messages
             self.checkForInit()
@@ -364,8 +391,10 @@ class TDMAComm(SerialComm):
             #        print("Mesh status received")
             #        self.processMsg(msg, {'nodeStatus': self.nodeParams.nodeStatus, 'comm': self, 'clock': self.nodeParams.clock})  
     
-    def syncTDMAFrame(self, currentTime=time.time()):
+    def syncTDMAFrame(self, currentTime=None):
         """Determine where in frame mesh network currently is to ensure time sync."""
+        if currentTime == None:
+            currentTime = self.nodeParams.clockSource.getTime()
         self.frameTime = (currentTime - self.commStartTime)%self.frameLength
         self.frameStartTime = currentTime - self.frameTime
         self.frameCount = math.floor(currentTime - self.commStartTime) / self.frameLength
@@ -387,6 +416,7 @@ class TDMAComm(SerialComm):
     def sleep(self):
         """Sleep until end of frame."""
         #print("Node " + str(self.nodeParams.config.nodeId) + " - In sleep method.")
+        sleepStartTime = self.nodeParams.clockSource.getTime()
     
         # Update mesh paths
         if ((self.nodeParams.clock.getTime() - self.lastGraphUpdate) > self.nodeParams.config.commConfig['linksTxInterval']):
@@ -405,14 +435,63 @@ class TDMAComm(SerialComm):
 
 
         # Sleep until next frame to save CPU usage
-        remainingFrameTime = (self.frameLength - (self.nodeParams.clock.getTime() - self.frameStartTime))
-        if (remainingFrameTime > 0.010):
+        currentTime = self.nodeParams.clockSource.getTime()
+        remainingFrameTime = (self.frameLength - (currentTime - self.frameStartTime))
+        self.timingStats['sleepProcessingDuration'].record(currentTime - sleepStartTime)
+        self.timingStats['sleepRemaining'].record(remainingFrameTime)
+        if (remainingFrameTime > 0.010 and self.blockingSleep):
             # Sleep remaining frame length minus some delta to ensure waking in time
-            time.sleep(remainingFrameTime - 0.010) 
+            self.nodeParams.clockSource.sleep(remainingFrameTime - 0.010) 
         elif (remainingFrameTime < -0.010):
             print("WARNING: Frame length exceeded! Exceedance- " + str(abs(remainingFrameTime)))
             self.frameExceedanceCount += 1 
     
+    def getTimingSnapshot(self):
+        """Returns snapshot of each TDMA timing histogram (see TimingHistogram.getSnapshot)."""
+        return {name: histogram.getSnapshot() for name, histogram in self.timingStats.items()}
+
+    def resetTimingStats(self):
+        """Clear TDMA timing histograms."""
+        for histogram in self.timingStats.values():
+            histogram.reset()
+
+    def getNextEventTime(self, currentTime):
+        """Returns time of next TDMA schedule event (slot or period boundary).  The current time is returned if there is work pending that should not wait.
+
+        Args:
+            currentTime: Current time.
+        """
+        if self.inited == False: # wait for received messages or end of initialization period
+            if self.initStartTime == None:
+                return currentTime
+            return max(currentTime, self.initStartTime + self.initTimeToWait)
+
+        if self.tdmaMode == TDMAMode.transmit and self.transmitComplete == False: # data to send
+            if self.radio.txRate and self.radio.getTxPendingBytes() > 0: # paced transmission so wait for radio FIFO to drain
+                return max(currentTime, min(self.radio.getTxCompleteTime(), self.frameStartTime + self.slotStartTime + self.endTxTime))
+            return currentTime
+
+        # Next frame schedule boundary (ignoring boundaries already reached within rounding of frame time)
+        frameTime = currentTime - self.frameStartTime
+        if self.frameScheduleTxSlot != self.transmitSlot: # transmit slot changed
+            self.buildFrameSchedule()
+        index = bisect_right(self.frameScheduleTimes, frameTime + 1e-6)
+        if index < len(self.frameScheduleTimes):
+            return self.frameStartTime + self.frameScheduleTimes[index]
+        elif frameTime + 1e-6 < self.frameLength: # next frame
+            return self.frameStartTime + self.frameLength
+        return currentTime
+
+    def isReadPending(self):
+        """Returns whether received data is currently being read from the radio."""
+        if self.inited == False or self.tdmaMode == TDMAMode.failsafe:
+            return True
+        elif self.tdmaMode == TDMAMode.receive:
+            return self.receiveComplete == False and self.slotTime >= self.rxReadTime
+        elif self.tdmaMode == TDMAMode.admin:
+            return self.receiveComplete == False and (self.frameTime - self.cycleLength) >= self.rxReadTime
+        return False
+
     def updateShortestPaths(self):
         for node in range(self.maxNumSlots):
             self.meshPaths[node] = findShortestPaths(self.maxNumSlots, self.nodeParams.linkStatus, node+1)
@@ -427,73 +506,67 @@ class TDMAComm(SerialComm):
         #print("Node", self.nodeParams.config.nodeId, "- Direct neighbors:", str(self.neighbors)) 
         
 
+    def buildFrameSchedule(self):
+        """Compile TDMA frame layout into a table of schedule boundaries sorted by frame time.  Each entry gives the mode, slot number and radio mode that apply from its start time until the next entry."""
+        schedule = []
+        for slotNum in range(1, self.maxNumSlots+1):
+            slotStart = (slotNum-1)*self.slotLength
+            if slotNum == self.transmitSlot: # transmit slot
+                schedule.append(TDMAFrameEvent(slotStart, TDMAMode.init, slotNum, RadioMode.transmit))
+                schedule.append(TDMAFrameEvent(slotStart + self.beginTxTime, TDMAMode.transmit, slotNum, RadioMode.transmit))
+                schedule.append(TDMAFrameEvent(slotStart + self.endTxTime, TDMAMode.sleep, slotNum, RadioMode.sleep))
+            else: # receive slot
+                schedule.append(TDMAFrameEvent(slotStart, TDMAMode.init, slotNum, RadioMode.receive))
+                schedule.append(TDMAFrameEvent(slotStart + self.beginRxTime, TDMAMode.receive, slotNum, RadioMode.receive))
+                schedule.append(TDMAFrameEvent(slotStart + self.rxReadTime, TDMAMode.receive, slotNum, RadioMode.receive)) # start of reading
+                schedule.append(TDMAFrameEvent(slotStart + self.endRxTime, TDMAMode.sleep, slotNum, RadioMode.sleep))
+
+        # Post-cycle periods (radio mode during admin period depends on controlling node)
+        if self.adminEnabled:
+            for adminTime in [0.0, self.enableLength, self.beginTxTime, self.rxReadTime]:
+                schedule.append(TDMAFrameEvent(self.cycleLength + adminTime, TDMAMode.admin, self.maxNumSlots, None))
+            schedule.append(TDMAFrameEvent(self.cycleLength + self.adminLength, TDMAMode.sleep, self.maxNumSlots, RadioMode.sleep))
+        else:
+            schedule.append(TDMAFrameEvent(self.cycleLength, TDMAMode.sleep, self.maxNumSlots, RadioMode.sleep))
+
+        self.frameSchedule = sorted(schedule, key=lambda event: event.startTime) # stable so coincident boundaries keep layout order
+        self.frameScheduleTimes = [event.startTime for event in self.frameSchedule]
+        self.frameScheduleTxSlot = self.transmitSlot
+        self.frameEvent = self.frameSchedule[0]
+
+    def getFrameEvent(self, frameTime):
+        """Returns frame schedule entry in effect at provided frame time."""
+        if self.frameScheduleTxSlot != self.transmitSlot: # transmit slot changed
+            self.buildFrameSchedule()
+        return self.frameSchedule[max(bisect_right(self.frameScheduleTimes, frameTime) - 1, 0)]
+
     def updateMode(self, frameTime):
         # Update slot
         self.resetTDMASlot(frameTime)
 
+        if self.frameEvent is not self.lastFrameEvent: # schedule boundary crossed
+            self.timingStats['modeChangeLateness'].record(frameTime - self.frameEvent.startTime)
+            self.lastFrameEvent = self.frameEvent
+
         # Check for TDMA failsafe
         if (self.tdmaFailsafe == True):
             self.setTDMAMode(TDMAMode.failsafe)
             return
         
-        if (frameTime >= self.cycleLength): # Cycle complete
-            if (self.adminEnabled and frameTime < (self.cycleLength + self.adminLength)): # admin period
-                self.setTDMAMode(TDMAMode.admin)
-            else: # sleep period
-                self.setTDMAMode(TDMAMode.sleep)
-                #print str(frameTime) + " - Cycle complete, sleeping"
-            return
-
-        # Normal cycle sequence
-        if self.slotTime < self.enableLength: # Initialize comm at start of slot
-            self.setTDMAMode(TDMAMode.init)
-        else:
-            # Transmit slot
-            if self.slotNum == self.transmitSlot:
-                if self.slotTime >= self.beginTxTime: 
-                    if self.slotTime < self.endTxTime: # Begin transmitting
-                        self.setTDMAMode(TDMAMode.transmit)
-                    else: # Sleep
-                        self.setTDMAMode(TDMAMode.sleep)
+        self.setTDMAMode(self.frameEvent.mode)
                 
-            # Receive slot
-            else:
-                if self.slotTime >= self.beginRxTime: # begin receiviing
-                    if self.slotTime < self.endRxTime: # receive
-                        self.setTDMAMode(TDMAMode.receive)
-                    else: # Sleep
-                        self.setTDMAMode(TDMAMode.sleep)
-        
-                
-    #def resetTDMASlot(self, frameTime, currentTime=time.time(), slotNum=[]):
-    #def resetTDMASlot(self, frameTime, slotNum=None):
     def resetTDMASlot(self, frameTime):
-        
-        # Reset slot number
-        #if slotNum != None:
-        #    if slotNum >= 1 and slotNum <= self.maxNumSlots:
-        #        self.slotNum = int(slotNum)
-        #    else: # invalid number
-        #        raise InvalidTDMASlotNumber("Provided TDMA slot number is not valid")
-        #else:
-            #if self.slotStartTime:
-            #   if (currentTime - self.slotStartTime) >= self.slotLength and self.slotNum < self.maxNumSlots:
-            #       self.slotNum = int(frameTime/self.slotLength) + 1   
-            #else:
-            if frameTime < self.cycleLength: # during cycle
-                self.slotNum = int(frameTime/self.slotLength) + 1
-            else: # post-cycle
-                self.slotNum = self.maxNumSlots
-        #self.slotStartTime = currentTime - (frameTime - (self.slotNum-1)*self.slotLength) 
-        #self.slotTime = frameTime - self.slotStartTime
-            self.slotStartTime = (self.slotNum-1)*self.slotLength 
-            self.slotTime = frameTime - self.slotStartTime
-        #print("Updating slot number: " + str(self.slotNum))
-        
+        # Find current position in frame schedule
+        self.frameEvent = self.getFrameEvent(frameTime)
+        self.slotNum = self.frameEvent.slotNum
+        self.slotStartTime = (self.slotNum-1)*self.slotLength 
+        self.slotTime = frameTime - self.slotStartTime
 
     def setTDMAMode(self, mode):
         if self.tdmaMode != mode:
             #print("Setting mode:", mode)
+            if self.tdmaMode in [TDMAMode.transmit, TDMAMode.admin]: # end of transmit period
+                self.discardTxBytes()
             
             self.tdmaMode = mode    
             #print str(self.slotTime) + " - TDMA mode change: " + str(self.tdmaMode)
@@ -501,6 +574,7 @@ class TDMAComm(SerialComm):
                 self.receiveComplete = False 
             elif mode == TDMAMode.transmit:
                 self.transmitComplete = False 
+                self.txStartPending = True
             elif mode == TDMAMode.admin: 
                 self.receiveComplete = False 
                 self.transmitComplete = False 
@@ -511,52 +585,133 @@ class TDMAComm(SerialComm):
             return    
     
         # Send buffered and periodic commands
-        broadcastMsgSent = False
         if self.tdmaMode == TDMAMode.transmit:
+            if self.radio.getTxPendingBytes() > 0: # continue paced transmission of buffered bytes
+                self.sendPacedBytes()
+                return
+
             # Send periodic TDMA commands
             #self.sendTDMACmds()
 
-            # Check queue for waiting outgoing messages
-            bytesSent = 0
-            bytesSent += self.processBuffers() # process relay and command buffers
-            for msg in self.meshQueueIn:
-                packetBytes = b''
-
-                if (bytesSent + len(msg.msgBytes) > self.nodeParams.config.commConfig['maxTransferSize']): # maximum transmit size reached
-                    break 
+            # Send relay and command buffers
+            maxTransferSize = self.nodeParams.config.commConfig['maxTransferSize']
+            bytesSent = self.processBuffers() # process relay and command buffers
+            
+            # Package network admin data (sent in the first broadcast message or in its own broadcast packet)
+            adminMaxLength = min(self.nodeParams.config.commConfig['adminBytesMaxLength'], maxTransferSize - bytesSent - self.msgParser.encodedLength(b'', self.getMeshHeaderLength(self.nodeParams.config.commConfig['adminBytesMaxLength'], 0)))
+            adminBytes = self.packageAdminData(adminMaxLength)
+            if adminBytes:
+                bytesSent += self.msgParser.encodedLength(adminBytes, self.getMeshHeaderLength(len(adminBytes), 0))
+
+            # Select queued messages that fill the remainder of the transmit window
+            self.meshQueueIn.dropExpired(self.nodeParams.clock.getTime())
+            msgs = self.meshQueueIn.popFitting(maxTransferSize - bytesSent, self.getMeshMsgLength, maxTransferSize)
+
+            # Group messages into packets (all messages for a destination in one packet if aggregating)
+            packets = []
+            packetIndex = dict()
+            for msg in msgs:
+                if (msg.destId != 0 and not msg.msgBytes): # only send non-zero non-broadcast messages
+                    continue
+                if (self.nodeParams.config.commConfig['aggregateMsgs'] and msg.destId in packetIndex):
+                    packets[packetIndex[msg.destId]][1].append(msg.msgBytes)
+                else:
+                    packetIndex[msg.destId] = len(packets)
+                    packets.append((msg.destId, [msg.msgBytes]))
 
-                if (msg.destId == 0):
-                    packetBytes = self.packageMeshPacket(msg.destId, msg.msgBytes)
-                    broadcastMsgSent = True
-                elif (msg.destId != 0 and msg.msgBytes): # only send non-zero non-broadcast messages
-                    packetBytes = self.packageMeshPacket(msg.destId, msg.msgBytes)
-                    
-                if (packetBytes): # if packet is of non-zero length
-                    self.bufferTxMsg(packetBytes)
+            for destId, packetMsgs in packets:
+                if (destId == 0):
+                    self.bufferTxMsg(self.packageMeshMsgs(destId, packetMsgs, adminBytes))
+                    adminBytes = b'' # admin data only sent once
+                else:
+                    self.bufferTxMsg(self.packageMeshMsgs(destId, packetMsgs))
  
-            # Clear queue
-            self.meshQueueIn = []
-
-            # Send broadcast message
-            if (broadcastMsgSent == False): # send a broadcast message for network administration
-                if (bytesSent < self.nodeParams.config.commConfig['maxTransferSize']): # maximum transmit size not reached
-                    packetBytes = self.packageMeshPacket(0, b'')
-                
-                    if (packetBytes): # if packet is of non-zero length
-                        self.bufferTxMsg(packetBytes)
+            # Send network admin data if not included in a broadcast message
+            if (adminBytes):
+                self.bufferTxMsg(self.createMeshPacket(0, b'', adminBytes, self.nodeParams.config.nodeId))
 
             #self.radio.bufferTxMsg(HDLC_END_TDMA) # append end of message byte
         
             #print("Node " + str(self.nodeParams.config.nodeId) + " - Number of bytes sent: " + str(len(self.radio.txBuffer)))
-            self.bytesSent += self.sendBuffer() 
-
-            # End transmit period
-            self.transmitComplete = True
+            self.sendPacedBytes()
 
         else:
             pass
             #print "Slot " + str(self.slotNum) + " - Node " + str(self.nodeId) + " - Can't send. Wrong mode: " + str(self.tdmaMode)
 
+    def sendPacedBytes(self):
+        """Send buffered bytes.  Transmit period ends once all bytes have been sent to radio."""
+        if self.txStartPending and self.inited: # first bytes of transmit period
+            txTime = self.nodeParams.clockSource.getTime() - self.frameStartTime - self.slotStartTime
+            self.timingStats['txStartLateness'].record(txTime - self.beginTxTime)
+            self.txStartPending = False
+
+        self.bytesSent += self.sendBuffer()
+        if self.radio.getTxPendingBytes() == 0:
+            self.transmitComplete = True
+
+    def discardTxBytes(self):
+        """Discard bytes that were not sent by the end of the transmit period so that they are not sent ahead of new data in the next transmit period."""
+        pendingBytes = self.radio.getTxPendingBytes()
+        if pendingBytes > 0:
+            self.txDiscardedBytes += pendingBytes
+            self.radio.txQueue.clear()
+
+    def sendBuffer(self):
+        """Send data in transmission buffer.  If radio transmissions are paced, only bytes that the radio can transmit before the end of the current transmit period are sent and the remainder stay buffered."""
+        if not self.radio.txRate: # transmissions not paced
+            return self.radio.sendBuffer()
+
+        if self.tdmaMode == TDMAMode.admin:
+            txEndTime = self.frameStartTime + self.cycleLength + self.endTxTime
+        else:
+            txEndTime = self.frameStartTime + self.slotStartTime + self.endTxTime
+        return self.radio.sendBuffer(deadline=txEndTime)
+
+    def getMeshMsgLength(self, msg, msgs):
+        """Returns the number of bytes required to transmit a queued message, given the messages already selected for transmission.  When messages are aggregated, messages after the first to a destination only add their length and contents to the existing packet."""
+        if self.nodeParams.config.commConfig['aggregateMsgs']:
+            if any(selected.destId == msg.destId for selected in msgs): # added to existing packet
+                return self.msgParser.encodedLength(msg.msgBytes, self.meshSubMsgLengthLen) - self.msgParser.encodedLength(b'')
+            headerLength = self.getMeshHeaderLength(0, self.nodeParams.config.commConfig['maxTransferSize'], AGGREGATED_MSG) # allow for payload length and status of aggregated packet
+            return self.msgParser.encodedLength(msg.msgBytes, headerLength + self.meshSubMsgLengthLen)
+
+        return self.msgParser.encodedLength(msg.msgBytes, self.getMeshHeaderLength(0, len(msg.msgBytes)))
+
+    def getMeshHeaderLength(self, adminLength, payloadLength, statusByte=0):
+        """Returns length of mesh packet header created by this node for provided packet contents."""
+        if self.nodeParams.config.commConfig['meshHeader'] == 'compact':
+            return compactHeaderLength(adminLength, payloadLength, self.nodeParams.config.commConfig['meshSeqNumBits'], statusByte)
+        return self.meshHeaderLen
+
+    def packageMeshMsgs(self, destId, msgs, adminBytes=b''):
+        """Create mesh packet containing provided messages.  Multiple messages are aggregated into a single payload with each message preceded by its length."""
+        if (len(msgs) == 1):
+            return self.createMeshPacket(destId, msgs[0], adminBytes, self.nodeParams.config.nodeId)
+
+        payloadBytes = b''.join([struct.pack(self.meshSubMsgLengthFormat, len(msg)) + msg for msg in msgs])
+        return self.createMeshPacket(destId, payloadBytes, adminBytes, self.nodeParams.config.nodeId, AGGREGATED_MSG)
+
+    def splitMeshPayload(self, payloadBytes):
+        """Split aggregated mesh packet payload into individual messages.
+
+        Returns:
+            List of messages (empty if payload is malformed).
+        """
+        msgs = []
+        pos = 0
+        while (pos < len(payloadBytes)):
+            if (pos + self.meshSubMsgLengthLen > len(payloadBytes)): # incomplete length
+                return []
+            msgLength = struct.unpack_from(self.meshSubMsgLengthFormat, payloadBytes, pos)[0]
+            pos += self.meshSubMsgLengthLen
+            if (pos + msgLength > len(payloadBytes)): # incomplete message
+                return []
+            msgs.append(payloadBytes[pos:pos + msgLength])
+            pos += msgLength
+
+        return msgs
+
     def packageMeshPacket(self, destId, msgBytes):
         adminBytes = b''
         if (destId == 0): # package network admin messages into broadcast message
@@ -571,32 +726,75 @@ class TDMAComm(SerialComm):
             return bytearray()
 
         # Create mesh packet header
-        packetHeader = struct.pack(self.meshPacketHeaderFormat, sourceId, destId, len(adminBytes), len(msgBytes), self.nodeParams.get_cmdCounter(), statusByte)
+        if self.nodeParams.config.commConfig['meshHeader'] == 'compact':
+            seqNumBits = self.nodeParams.config.commConfig['meshSeqNumBits']
+            self.meshSeqNum = (self.meshSeqNum + 1) % (1 << seqNumBits)
+            self.getSeqHistory(sourceId, seqNumBits).append(self.meshSeqNum) # add to history so that relays of own packets are ignored
+            packetHeader = packCompactHeader(sourceId, destId, len(adminBytes), len(msgBytes), self.meshSeqNum, statusByte, seqNumBits=seqNumBits)
+        else:
+            packetHeader = struct.pack(self.meshPacketHeaderFormat, sourceId, destId, len(adminBytes), len(msgBytes), self.nodeParams.get_cmdCounter(), statusByte)
         
         # Return mesh packet
         return bytearray(packetHeader + adminBytes + msgBytes)
 
     def parseMeshPacket(self, packetBytes):
-        """Parse out a mesh packet."""
+        """Parse out a mesh packet.  Packets with either the standard or compact header are accepted.  The returned header includes a packetId that identifies the packet for duplicate rejection."""
                 
         # Parse mesh packet header
         packetHeader = dict()
-        packetHeaderContents = struct.unpack(self.meshPacketHeaderFormat, packetBytes[0:self.meshHeaderLen])
-        packetHeader = {'sourceId': packetHeaderContents[0], 'destId': packetHeaderContents[1], 'adminLength': packetHeaderContents[2], 'payloadLength': packetHeaderContents[3], 'cmdCounter': packetHeaderContents[4], 'statusByte': packetHeaderContents[5]}
+        if isCompactHeader(packetBytes):
+            packetHeader = unpackCompactHeader(packetBytes)
+            if (packetHeader == None): # invalid header
+                return False, dict(), [], []
+            headerLength = packetHeader['headerLength']
+            originId = packetHeader['originId'] if packetHeader['originId'] != None else packetHeader['sourceId']
+            packetHeader['packetId'] = (originId, packetHeader['seqNum'])
+        elif (len(packetBytes) >= self.meshHeaderLen):
+            packetHeaderContents = struct.unpack_from(self.meshPacketHeaderFormat, packetBytes)
+            packetHeader = {'sourceId': packetHeaderContents[0], 'destId': packetHeaderContents[1], 'adminLength': packetHeaderContents[2], 'payloadLength': packetHeaderContents[3], 'cmdCounter': packetHeaderContents[4], 'statusByte': packetHeaderContents[5]}
+            packetHeader['packetId'] = packetHeader['cmdCounter']
+            headerLength = self.meshHeaderLen
+        else: # incomplete header
+            return False, packetHeader, [], []
                 
         # Validate message length
-        if (len(packetBytes) == (self.meshHeaderLen + packetHeader['adminLength'] + packetHeader['payloadLength'])): # message length is valid
-            adminBytes = packetBytes[self.meshHeaderLen:self.meshHeaderLen + packetHeader['adminLength']]
-            messageBytes = packetBytes[self.meshHeaderLen + packetHeader['adminLength']:]
+        if (len(packetBytes) == (headerLength + packetHeader['adminLength'] + packetHeader['payloadLength'])): # message length is valid
+            adminBytes = packetBytes[headerLength:headerLength + packetHeader['adminLength']]
+            messageBytes = packetBytes[headerLength + packetHeader['adminLength']:]
             
             return True, packetHeader, adminBytes, messageBytes
         else:
             return False, packetHeader, [], []
         
 
+    def getSeqHistory(self, originId, seqNumBits):
+        """Returns recent sequence numbers of compact header packets from provided originating node.  The history is limited to a quarter of the sequence number space so that entries expire well before the sequence numbers wrap."""
+        windowSize = (1 << seqNumBits) // 4
+        history = self.meshSeqHistory.get(originId)
+        if (history == None or history.maxlen != windowSize):
+            history = deque(history or [], maxlen=windowSize)
+            self.meshSeqHistory[originId] = history
+        return history
+
+    def checkDuplicatePacket(self, packetHeader):
+        """Returns True if packet has already been received, otherwise records packet as received."""
+        if ('seqNum' in packetHeader): # compact header identified by originating node and sequence number
+            history = self.getSeqHistory(packetHeader['packetId'][0], packetHeader['seqNumBits'])
+            packetId = packetHeader['seqNum']
+        else:
+            history = self.nodeParams.cmdHistory
+            packetId = packetHeader['packetId']
+
+        if (packetId in history):
+            return True
+        history.append(packetId) # update command history
+        return False
+
     def readMsgs(self):
         """Read from serial connection and look for end of message value."""
+        readStartTime = self.nodeParams.clockSource.getTime()
         self.bytesRcvd += self.radio.readBytes(True)
+        self.timingStats['rxReadDuration'].record(self.nodeParams.clockSource.getTime() - readStartTime)
        
         # Look for TDMA message end indicator 
         #for i in range(self.rxBufferReadPos, self.radio.bytesInRxBuffer):
@@ -611,7 +809,11 @@ class TDMAComm(SerialComm):
         return False # end of transmission not found
    
     def relayMsg(self, msgBytes):
-        """Relay received message. Existing mesh header is maintained with only the source updated."""
+        """Relay received message. Existing mesh header is maintained with only the source updated (the compact header also records the originating node)."""
+        if isCompactHeader(msgBytes):
+            self.cmdRelayBuffer += self.msgParser.encodeMsg(relayCompactHeader(msgBytes, self.nodeParams.config.nodeId))
+            return
+
         packetHeader = struct.unpack(self.meshPacketHeaderFormat, msgBytes[0:self.meshHeaderLen])
         sourceId = packetHeader[0]
         destId = packetHeader[1]
@@ -634,50 +836,49 @@ class TDMAComm(SerialComm):
         self.parseMsgs()
 
         # Process any received messages
-        if (self.msgParser.parsedMsgs):
-            for i in range(len(self.msgParser.parsedMsgs)):
-                msg = self.msgParser.parsedMsgs.pop(0)
-                
-                # Parse mesh packet header
-                packetValid, packetHeader, adminBytes, messageBytes = self.parseMeshPacket(msg)
-                if (packetValid == False): # packet invalid
-                    continue                
-
-                # Ignore stale commands
-                if (packetHeader['cmdCounter'] in self.nodeParams.cmdHistory):
-                    continue
-                else:
-                    self.nodeParams.cmdHistory.append(packetHeader['cmdCounter']) # update command history
+        for msg in self.msgParser.getMsgs():
+            # Parse mesh packet header
+            packetValid, packetHeader, adminBytes, messageBytes = self.parseMeshPacket(msg)
+            if (packetValid == False): # packet invalid
+                continue                
+
+            # Ignore stale commands
+            if (self.checkDuplicatePacket(packetHeader)):
+                continue
 
-                # Update information on direct mesh links based on sourceId
-                self.nodeParams.nodeStatus[packetHeader['sourceId']-1].present = True
-                self.nodeParams.nodeStatus[packetHeader['sourceId']-1].lastMsgRcvdTime = self.nodeParams.clock.getTime()
+            # Update information on direct mesh links based on sourceId
+            self.nodeParams.nodeStatus[packetHeader['sourceId']-1].present = True
+            self.nodeParams.nodeStatus[packetHeader['sourceId']-1].lastMsgRcvdTime = self.nodeParams.clock.getTime()
 
-                # Extract any mesh messages and process
-                if (packetHeader['adminLength'] > 0):
-                    self.processMeshMsgs(adminBytes)
+            # Extract any mesh messages and process
+            if (packetHeader['adminLength'] > 0):
+                self.processMeshMsgs(adminBytes)
    
-                # Place raw message bytes in buffer to send to host
-                if (packetHeader['payloadLength'] > 0):
-                    if (packetHeader['destId'] == self.nodeParams.config.nodeId or self.nodeParams.config.commConfig['recvAllMsgs']):
-                        #print("Placing in hostBuffer: " + str(msg[self.meshHeaderLen + adminLength:]))
+            # Place raw message bytes in buffer to send to host
+            if (packetHeader['payloadLength'] > 0):
+                if (packetHeader['destId'] == self.nodeParams.config.nodeId or self.nodeParams.config.commConfig['recvAllMsgs']):
+                    #print("Placing in hostBuffer: " + str(msg[self.meshHeaderLen + adminLength:]))
+                    if (packetHeader['statusByte'] == AGGREGATED_MSG): # separate aggregated messages
+                        for msgBytes in self.splitMeshPayload(messageBytes):
+                            self.hostBuffer += msgBytes
+                    else:
                         self.hostBuffer += messageBytes
        
-                # Check for relay
-                if (self.inited == False): # don't process for relaying if mesh not inited
-                    continue
+            # Check for relay
+            if (self.inited == False): # don't process for relaying if mesh not inited
+                continue
  
-                if (packetHeader['destId'] == 0):
-                    if (packetHeader['statusByte'] != BLOCK_TX_MSG): # broadcast message (don't relay block tx packets)
-                        # All broadcast messages are relayed
-                        self.relayMsg(bytearray(msg))
-
-                elif (packetHeader['destId'] != self.nodeParams.config.nodeId): # message for another node
-                    # Only relay if on the shortest path
-                    if (self.checkForRelay(self.nodeParams.config.nodeId, packetHeader['destId'], packetHeader['sourceId']) == True): # message should be relayed
-                        self.relayMsg(bytearray(msg))
-                else:
-                    pass
+            if (packetHeader['destId'] == 0):
+                if (packetHeader['statusByte'] != BLOCK_TX_MSG): # broadcast message (don't relay block tx packets)
+                    # All broadcast messages are relayed
+                    self.relayMsg(bytearray(msg))
+
+            elif (packetHeader['destId'] != self.nodeParams.config.nodeId): # message for another node
+                # Only relay if on the shortest path
+                if (self.checkForRelay(self.nodeParams.config.nodeId, packetHeader['destId'], packetHeader['sourceId']) == True): # message should be relayed
+                    self.relayMsg(bytearray(msg))
+            else:
+                pass
        
     def checkForRelay(self, currentNode, destId, sourceId):
         """This method checks if a message should be relayed based on the current mesh graph."""
@@ -705,9 +906,9 @@ class TDMAComm(SerialComm):
         # Process any mesh commands
         if (len(meshMsgs) > 0):
             # Parse and process individual commands
-            self.tdmaCmdParser.parseMsgs(meshMsgs)
-            for i in range(len(self.tdmaCmdParser.parsedMsgs)):
-                self.processMsg(self.tdmaCmdParser.parsedMsgs.pop(0), {'nodeStatus': self.nodeParams.nodeStatus, 'comm': self, 'clock': self.nodeParams.clock})  
+            self.tdmaCmdParser.parseMsgs(bytes(meshMsgs))
+            for msg in self.tdmaCmdParser.getMsgs():
+                self.processMsg(msg, {'nodeStatus': self.nodeParams.nodeStatus, 'comm': self, 'clock': self.nodeParams.clock})  
 
     def packageAdminData(self, maxLength):
         adminBytes = b''
@@ -1,4 +1,5 @@
 from enum import IntEnum, Enum
+from collections import namedtuple
 
 class TDMAMode(IntEnum):
     sleep = 0
@@ -17,3 +18,5 @@ class TDMABlockTxStatus(Enum):
 class TDMAStatus(IntEnum):
     nominal = 1
     blockTx = 2
+
+TDMAFrameEvent = namedtuple('TDMAFrameEvent', ['startTime', 'mode', 'slotNum', 'radioMode']) # TDMA frame schedule boundary (radioMode is None if radio mode is not fixed by schedule)
@@ -0,0 +1,86 @@
+import math
+
+class TimingHistogram(object):
+    """Fixed-size histogram of time durations with logarithmic buckets.
+
+    Each power of two above minValue is split into subBuckets linearly spaced buckets, so every recorded value is resolved to within 1/subBuckets of its value (similar to an HDR histogram).  Values below minValue (including negative values) are counted in the first bucket and values above maxValue in the last, but the exact minimum and maximum values are retained.  Recording a value does not allocate memory.
+
+    Attributes:
+        minValue: Upper bound of first bucket.
+        subBuckets: Number of buckets per power of two.
+        counts: Number of values recorded in each bucket.
+        count: Total number of values recorded.
+        total: Sum of recorded values.
+        minRecorded: Minimum value recorded (None if no values recorded).
+        maxRecorded: Maximum value recorded (None if no values recorded).
+    """
+
+    def __init__(self, minValue=1e-6, maxValue=10.0, subBuckets=4):
+        self.minValue = minValue
+        self.subBuckets = subBuckets
+        numBuckets = self.getBucket(maxValue) + 2 # include first bucket and overflow bucket
+        self.counts = [0] * numBuckets
+        self.reset()
+
+    def reset(self):
+        """Clear all recorded values."""
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.count = 0
+        self.total = 0.0
+        self.minRecorded = None
+        self.maxRecorded = None
+
+    def getBucket(self, value):
+        """Returns index of bucket for provided value (without bounds checking)."""
+        if value < self.minValue:
+            return 0
+        mantissa, exponent = math.frexp(value / self.minValue) # value/minValue = mantissa * 2**exponent, 0.5 <= mantissa < 1
+        return 1 + (exponent-1)*self.subBuckets + int((2*mantissa - 1)*self.subBuckets)
+
+    def getBucketBounds(self, bucket):
+        """Returns (lower, upper) bounds of values in provided bucket."""
+        if bucket == 0:
+            return (-math.inf, self.minValue)
+        elif bucket == len(self.counts) - 1:
+            return (self.getBucketBounds(bucket-1)[1], math.inf)
+        exponent, subBucket = divmod(bucket - 1, self.subBuckets)
+        scale = self.minValue * 2**exponent
+        return (scale * (1 + subBucket/self.subBuckets), scale * (1 + (subBucket+1)/self.subBuckets))
+
+    def record(self, value):
+        """Record duration."""
+        self.counts[min(self.getBucket(value), len(self.counts) - 1)] += 1
+        self.count += 1
+        self.total += value
+        if self.minRecorded == None or value < self.minRecorded:
+            self.minRecorded = value
+        if self.maxRecorded == None or value > self.maxRecorded:
+            self.maxRecorded = value
+
+    def getPercentile(self, percentile, counts=None):
+        """Returns upper bound of bucket containing provided percentile of recorded values (None if no values recorded).
+
+        Args:
+            percentile: Percentile (0-100).
+            counts: Optional bucket counts to use instead of current counts (e.g. from a snapshot).
+        """
+        if counts == None:
+            counts = self.counts
+        numValues = sum(counts)
+        if numValues == 0:
+            return None
+
+        threshold = percentile / 100.0 * numValues
+        cumulative = 0
+        for bucket, bucketCount in enumerate(counts):
+            cumulative += bucketCount
+            if bucketCount and cumulative >= threshold:
+                break
+        if bucket == len(counts) - 1: # overflow bucket
+            return self.maxRecorded
+        return self.getBucketBounds(bucket)[1]
+
+    def getSnapshot(self):
+        """Returns copy of current histogram statistics."""
+        return {'count': self.count, 'mean': self.total / self.count if self.count else None, 'min': self.minRecorded, 'max': self.maxRecorded, 'counts': self.counts[:]}
@@ -0,0 +1,89 @@
+from collections import deque
+
+class TxQueue(object):
+    """Queue of encoded frames awaiting transmission.
+
+    Frames are stored as provided (so must not be modified once queued) and a send cursor tracks how much of the first frame has been sent, so partial sends do not copy the remaining bytes.
+
+    Attributes:
+        frames: Queued frames.
+        cursor: Number of bytes of first queued frame already sent.
+        pendingBytes: Number of queued bytes not yet sent.
+    """
+
+    def __init__(self):
+        self.frames = deque()
+        self.cursor = 0
+        self.pendingBytes = 0
+
+    def __len__(self):
+        return self.pendingBytes
+
+    def __eq__(self, other):
+        return self.getBytes() == other
+
+    def append(self, frame):
+        """Add frame to end of queue.
+
+        Args:
+            frame: Encoded frame bytes.
+        """
+        if frame:
+            self.frames.append(frame)
+            self.pendingBytes += len(frame)
+
+    def clear(self):
+        """Remove all queued frames."""
+        self.frames.clear()
+        self.cursor = 0
+        self.pendingBytes = 0
+
+    def getSpans(self, maxBytes=0):
+        """Returns memoryviews of pending bytes in the order queued.
+
+        Args:
+            maxBytes: Maximum number of bytes to return (0 for all pending bytes).
+        """
+        if maxBytes <= 0 or maxBytes > self.pendingBytes:
+            maxBytes = self.pendingBytes
+
+        spans = []
+        start = self.cursor
+        for frame in self.frames:
+            if maxBytes <= 0:
+                break
+            span = memoryview(frame)[start:start+maxBytes]
+            spans.append(span)
+            maxBytes -= len(span)
+            start = 0
+
+        return spans
+
+    def getBytes(self, maxBytes=0):
+        """Returns pending bytes as a single contiguous buffer (only copied if spanning multiple frames).
+
+        Args:
+            maxBytes: Maximum number of bytes to return (0 for all pending bytes).
+        """
+        spans = self.getSpans(maxBytes)
+        if len(spans) == 1:
+            return spans[0]
+        return b''.join(spans)
+
+    def consume(self, numBytes):
+        """Advance send cursor past sent bytes, removing completely sent frames.
+
+        Args:
+            numBytes: Number of bytes sent.
+        """
+        numBytes = min(numBytes, self.pendingBytes)
+        self.pendingBytes -= numBytes
+        while numBytes > 0:
+            remaining = len(self.frames[0]) - self.cursor
+            if numBytes >= remaining: # frame completely sent
+                self.frames.popleft()
+                self.cursor = 0
+                numBytes -= remaining
+            else: # frame partially sent
+                self.cursor += numBytes
+                numBytes = 0
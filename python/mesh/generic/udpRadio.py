@@ -1,58 +1,74 @@
 import socket
-from mesh.generic.radio import Radio
+from mesh.generic.datagramRadio import DatagramRadio
 from mesh.generic.customExceptions import NoSocket
 
-class UDPRadio(Radio):
+UDPMaxDatagramSize = 65507 # maximum UDP payload length
+
+class UDPRadio(DatagramRadio):
+    """Radio interface over a UDP socket.
+
+    Each datagram is received into a preallocated datagram buffer and then added to the receive buffer.
+
+    Attributes:
+        datagramBuffer: Preallocated buffer for received datagrams.
+        pendingDatagramLength: Length of datagram in datagramBuffer that did not yet fit in the receive buffer.
+    """
 
     def __init__(self, config):
-        Radio.__init__(self, [], config)	
+        DatagramRadio.__init__(self, [], config)
 
         # Read port
         self.sockRead = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sockRead.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         self.sockRead.bind((config['ipAddr'], config['readPort']))
         self.sockRead.setblocking(0) # non-blocking to prevent hanging thread
+        self.datagramBuffer = bytearray(UDPMaxDatagramSize)
+        self.pendingDatagramLength = 0
 
         # Write port
         self.sockWrite = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sockWrite.setblocking(0)
         self.sockWriteIp = config['ipAddr']
         self.sockWritePort = config['writePort']
-        
+
+    def fileno(self):
+        """Returns file descriptor of read socket."""
+        return self.sockRead.fileno()
+
     def readBytes(self, bufferFlag):
-        """Reads raw bytes from udp connection"""
+        """Reads all available datagrams from udp connection.  Reading stops once the socket is empty or the receive buffer is full."""
         if not self.sockRead:
             raise NoSocket("No read socket connection available")
             return 0
-        
-        # Read from socket
-        newBytes = []
-        try:
-            readAttempts = 0
-            newBytes = bytearray()
-            while readAttempts < 10: # Check for multiple messages
-                newData, source = self.sockRead.recvfrom(4096)
-                newBytes = newBytes + newData
-                readAttempts = readAttempts + 1
-                
-        except Exception as e:
-            pass
-            #print("UDP socket read error.")
-
-        # Process rx bytes
-        if newBytes:
-            self.processRxBytes(newBytes, bufferFlag)
-            return len(newBytes)
-        else:
-            return 0
-        
+
+        if bufferFlag == False: # replace buffer contents with new bytes
+            self.clearRxBuffer()
+
+        # Read from socket until no datagrams remain
+        bytesRead = 0
+        with memoryview(self.datagramBuffer) as datagram:
+            while True:
+                if self.pendingDatagramLength == 0:
+                    try:
+                        self.pendingDatagramLength = self.sockRead.recv_into(datagram)
+                    except BlockingIOError: # no more datagrams available
+                        break
+                    except OSError:
+                        break
+
+                if not self.bufferDatagram(datagram[:self.pendingDatagramLength]): # receive buffer full so retain datagram for next read
+                    break
+                bytesRead += self.pendingDatagramLength
+                self.pendingDatagramLength = 0
+
+        return bytesRead
 
     def sendBytes(self, msgBytes):
         """Send bytes over udp connection."""
         if not self.sockWrite:
             raise NoSocket("No write socket connection available")
-            return 0 
-        
+            return 0
+
         try:
             self.sockWrite.sendto(msgBytes, (self.sockWriteIp, self.sockWritePort))
             return len(msgBytes)
@@ -0,0 +1,208 @@
+import random, math
+from collections import deque
+from mesh.generic.clockSource import SystemClock
+
+class VirtualTransmission(object):
+    """Bytes in transit from one node to another through a VirtualMedium.
+
+    Attributes:
+        sourceId: Node id of transmitting node.
+        startTime: Time first bit arrives at receiver.
+        endTime: Time last bit arrives at receiver.
+        msgBytes: Transmitted bytes.
+        collided: Flag indicating that transmission overlapped another transmission at the receiver.
+    """
+
+    def __init__(self, sourceId, startTime, endTime, msgBytes):
+        self.sourceId = sourceId
+        self.startTime = startTime
+        self.endTime = endTime
+        self.msgBytes = msgBytes
+        self.collided = False
+
+class VirtualPort(object):
+    """Serial port-like connection of a node to a VirtualMedium, for use in place of a serial port by a Radio.
+
+    Attributes:
+        medium: Medium port is connected to.
+        nodeId: Node id of port.
+        rxBytes: Received bytes not yet read.
+        txStartTime: Time latest transmission from this port started.
+        txEndTime: Time latest transmission from this port ends.
+    """
+
+    def __init__(self, medium, nodeId):
+        self.medium = medium
+        self.nodeId = nodeId
+        self.rxBytes = bytearray()
+        self.txStartTime = 0.0
+        self.txEndTime = 0.0
+
+    def write(self, msgBytes):
+        return self.medium.transmit(self, msgBytes)
+
+    def read(self, numBytes):
+        self.medium.deliver(self)
+        msgBytes = bytes(self.rxBytes[:numBytes])
+        del self.rxBytes[:numBytes]
+        return msgBytes
+
+    def readinto(self, buffer):
+        self.medium.deliver(self)
+        numBytes = min(len(buffer), len(self.rxBytes))
+        buffer[:numBytes] = self.rxBytes[:numBytes]
+        del self.rxBytes[:numBytes]
+        return numBytes
+
+class VirtualMedium(object):
+    """Simulated radio medium connecting any number of nodes in one process.
+
+    Bytes written to a node's port are delivered to the ports of all nodes linked to it once the transmission has been received in full.  Transmissions take the airtime of the bytes at the medium baudrate plus the propagation delay.  Transmissions from different nodes that overlap at a receiver (including the receiver's own transmissions) collide and are lost, and each delivery is subject to random loss and bit errors.
+
+    Attributes:
+        numNodes: Number of nodes.
+        linkGraph: Matrix of links between nodes (linkGraph[i][j] is nonzero if node i+1 can hear node j+1).
+        baudrate: Medium data rate in bits per second.
+        bitsPerByte: Number of bits sent per byte (including any start and stop bits).
+        propagationDelay: Delay between transmission and reception in seconds.
+        bitErrorRate: Probability of each received bit being in error.
+        lossRate: Probability of each transmission not being received by each receiver.
+        clockSource: Source of time for the medium (must be the clock source of the simulated nodes).
+        ports: Port of each node.
+        inTransit: Transmissions not yet delivered to each node.
+        txBytes: Number of bytes transmitted by each node.
+        rxBytes: Number of bytes delivered to each node.
+        collisionCount: Number of transmissions lost to collisions.
+        lossCount: Number of transmissions lost to random loss.
+        bitErrorCount: Number of bits received in error.
+        rxCallback: Optional function called with the receiving node id and arrival time of each transmission (used to schedule reads in simulations).
+    """
+
+    def __init__(self, numNodes, linkGraph=None, baudrate=57600, bitsPerByte=10, propagationDelay=0.0, bitErrorRate=0.0, lossRate=0.0, clockSource=None, seed=None):
+        self.numNodes = numNodes
+        self.linkGraph = linkGraph if linkGraph else fullGraph(numNodes)
+        self.baudrate = baudrate
+        self.bitsPerByte = bitsPerByte
+        self.propagationDelay = propagationDelay
+        self.bitErrorRate = bitErrorRate
+        self.lossRate = lossRate
+        self.clockSource = clockSource if clockSource else SystemClock()
+        self.random = random.Random(seed)
+
+        self.ports = [VirtualPort(self, nodeId) for nodeId in range(1, numNodes+1)]
+        self.inTransit = [deque() for node in range(numNodes)]
+
+        # Statistics
+        self.txBytes = [0] * numNodes
+        self.rxBytes = [0] * numNodes
+        self.collisionCount = 0
+        self.lossCount = 0
+        self.bitErrorCount = 0
+
+        self.rxCallback = None
+
+    def getPort(self, nodeId):
+        """Returns port of provided node."""
+        return self.ports[nodeId-1]
+
+    def transmit(self, port, msgBytes):
+        """Start transmission of bytes from provided port to all linked nodes.
+
+        Returns:
+            Number of bytes transmitted.
+        """
+        if not msgBytes:
+            return 0
+
+        # Transmission starts once any previous transmission from this port completes
+        startTime = max(self.clockSource.getTime(), port.txEndTime)
+        endTime = startTime + len(msgBytes) * self.bitsPerByte / self.baudrate
+        if startTime > port.txEndTime: # new transmission (rather than continuation of current one)
+            port.txStartTime = startTime
+        port.txEndTime = endTime
+        self.txBytes[port.nodeId-1] += len(msgBytes)
+
+        # Own transmission collides with any reception in progress
+        ownTx = VirtualTransmission(port.nodeId, startTime, endTime, None)
+        self.checkCollisions(port.nodeId, ownTx)
+
+        msgBytes = bytes(msgBytes)
+        for node in range(self.numNodes):
+            if node == port.nodeId-1 or not self.linkGraph[node][port.nodeId-1]: # not linked to transmitting node
+                continue
+            transmission = VirtualTransmission(port.nodeId, startTime + self.propagationDelay, endTime + self.propagationDelay, msgBytes)
+            self.checkCollisions(node+1, transmission)
+            self.inTransit[node].append(transmission)
+            if self.rxCallback:
+                self.rxCallback(node+1, transmission.endTime)
+
+        return len(msgBytes)
+
+    def checkCollisions(self, nodeId, transmission):
+        """Mark transmissions that overlap provided transmission at provided node as collided."""
+        port = self.ports[nodeId-1]
+        for other in self.inTransit[nodeId-1]:
+            if other.sourceId != transmission.sourceId and other.startTime < transmission.endTime and transmission.startTime < other.endTime:
+                other.collided = True
+                transmission.collided = True
+        if transmission.sourceId != nodeId and port.txStartTime < transmission.endTime and transmission.startTime < port.txEndTime: # receiver transmitting
+            transmission.collided = True
+
+    def deliver(self, port):
+        """Deliver transmissions that have been completely received by provided port."""
+        inTransit = self.inTransit[port.nodeId-1]
+        currentTime = self.clockSource.getTime()
+        while inTransit and inTransit[0].endTime <= currentTime:
+            transmission = inTransit.popleft()
+            if transmission.collided:
+                self.collisionCount += 1
+            elif self.lossRate > 0.0 and self.random.random() < self.lossRate:
+                self.lossCount += 1
+            else:
+                msgBytes = self.applyBitErrors(transmission.msgBytes)
+                port.rxBytes += msgBytes
+                self.rxBytes[port.nodeId-1] += len(msgBytes)
+
+    def applyBitErrors(self, msgBytes):
+        """Returns copy of provided bytes with random bit errors applied."""
+        if self.bitErrorRate <= 0.0:
+            return msgBytes
+
+        msgBytes = bytearray(msgBytes)
+        numBits = len(msgBytes) * 8
+        bit = -1
+        logNoError = math.log(1.0 - self.bitErrorRate)
+        while True:
+            # Number of error free bits before next error is geometrically distributed
+            bit += 1 + int(math.log(1.0 - self.random.random()) / logNoError)
+            if bit >= numBits:
+                break
+            msgBytes[bit // 8] ^= 1 << (bit % 8)
+            self.bitErrorCount += 1
+
+        return bytes(msgBytes)
+
+def fullGraph(numNodes):
+    """Returns link graph with all nodes linked to each other."""
+    return [[1 if i != j else 0 for j in range(numNodes)] for i in range(numNodes)]
+
+def ringGraph(numNodes):
+    """Returns link graph with each node linked to the previous and next node in a ring."""
+    graph = [[0] * numNodes for i in range(numNodes)]
+    for i in range(numNodes):
+        graph[i][(i+1) % numNodes] = 1
+        graph[(i+1) % numNodes][i] = 1
+    return graph
+
+def gridGraph(numRows, numCols):
+    """Returns link graph with nodes in a grid (numbered by row) linked to their horizontal and vertical neighbors."""
+    numNodes = numRows * numCols
+    graph = [[0] * numNodes for i in range(numNodes)]
+    for i in range(numNodes):
+        row, col = divmod(i, numCols)
+        for neighborRow, neighborCol in [(row+1, col), (row, col+1)]:
+            if neighborRow < numRows and neighborCol < numCols:
+                j = neighborRow * numCols + neighborCol
+                graph[i][j] = 1
+                graph[j][i] = 1
+    return graph
@@ -3,6 +3,7 @@ import serial, time, random
 from mesh.generic.nodeParams import NodeParams
 from mesh.generic.radio import Radio
 from mesh.generic.udpRadio import UDPRadio
+from mesh.generic.shmRadio import ShmRadio
 #from mesh.generic.slipMsgParser import SLIPMsgParser
 from mesh.generic.slipMsg import SLIPMsg
 from mesh.generic.msgParser import MsgParser
@@ -22,15 +23,21 @@ class NodeControlProcess(Process):
         # Create radios
         radios = []
         radioConfig = {'uartNumBytesToRead': nodeParams.config.uartNumBytesToRead, 'rxBufferSize': nodeParams.config.rxBufferSize, 'ipAddr': nodeParams.config.interface['nodeCommIntIP'], 'readPort': nodeParams.config.interface['commWrPort'], 'writePort': nodeParams.config.interface['commRdPort']}
+        interface = nodeParams.config.interface
         for i in range(nodeParams.config.numMeshNetworks):
-            radios.append(UDPRadio(radioConfig)) # connection to communication processes
+            if interface['type'] == "shm":
+                interfaceConfig = {'uartNumBytesToRead': nodeParams.config.uartNumBytesToRead, 'rxBufferSize': nodeParams.config.rxBufferSize, 'readName': interface['shmName'] + str(i) + 'Wr', 'writeName': interface['shmName'] + str(i) + 'Rd', 'shmSize': interface['shmSize'], 'wakeup': interface['shmWakeup']}
+                radios.append(ShmRadio(interfaceConfig)) # connection to communication processes
+            else:
+                radios.append(UDPRadio(radioConfig)) # connection to communication processes
 
         # Create message parsers
         msgParsers = []
         parserConfig = {'parseMsgMax': nodeParams.config.parseMsgMax}
         for i in range(nodeParams.config.numMeshNetworks):
             #if nodeParams.config.msgParsers[i] == "SLIP":
-                msgParsers.append(MsgParser(parserConfig, SLIPMsg(256)))
+            #    msgParsers.append(MsgParser(parserConfig, SLIPMsg(256)))
+                msgParsers.append(MsgParser(parserConfig)) # messages delimited by datagrams
             #elif nodeParams.config.msgParsers[i] == "standard":
             #    msgParsers.append(MsgParser(parserConfig))
     
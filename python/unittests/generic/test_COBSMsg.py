@@ -0,0 +1,89 @@
+from struct import pack
+from mesh.generic.cobsMsg import COBSMsg, COBS_END
+
+testMsg = pack('BBB',1,2,3) + COBS_END + COBS_END + pack('BBB',4,5,6)
+
+class TestCOBSMsg:
+    
+    def setup_method(self, method):
+        self.cobsMsg = COBSMsg(2048)
+        self.truthCRC = self.cobsMsg.crc.pack(self.cobsMsg.crc(testMsg))
+    
+    def test_encodeMsg(self):
+        """Test encodeMsg method of COBSMsg."""
+        self.cobsMsg.encodeMsg(testMsg)
+        assert(self.cobsMsg.encoded[0:1] == COBS_END and self.cobsMsg.encoded[-1:] == COBS_END)
+        assert(COBS_END not in self.cobsMsg.encoded[1:-1]) # zero bytes removed
+        assert(self.cobsMsg.encoded[1:5] == pack('B',4) + pack('BBB',1,2,3))
+        assert(len(self.cobsMsg.encoded) <= self.cobsMsg.maxEncodedLength(len(testMsg)))
+
+        # Test long message with no zero bytes
+        longMsg = b'1' * 1000
+        self.cobsMsg.encodeMsg(longMsg)
+        assert(len(self.cobsMsg.encoded) <= self.cobsMsg.maxEncodedLength(len(longMsg)))
+
+    def test_encodedLength(self):
+        """Test encodedLength method of COBSMsg."""
+        for msg in [testMsg, b'1' * 1000]:
+            self.cobsMsg.encodeMsg(msg)
+            assert(len(self.cobsMsg.encoded) <= self.cobsMsg.encodedLength(msg))
+        assert(self.cobsMsg.encodedLength(testMsg, 10) == self.cobsMsg.maxEncodedLength(len(testMsg) + 10))
+
+    def test_unstuffBytes(self):
+        """Test unstuffBytes method of COBSMsg."""
+        for msg in [testMsg, b'1' * 254, b'1' * 254 + COBS_END + b'1', COBS_END * 3, b'1' * 600]:
+            self.cobsMsg.encodeMsg(msg)
+            truthDecoded = msg + self.cobsMsg.crc.pack(self.cobsMsg.crc(msg))
+            self.cobsMsg.resetMsg()
+            self.cobsMsg.unstuffBytes(self.cobsMsg.encoded[1:-1], False)
+            assert(self.cobsMsg.msg == truthDecoded)
+
+            # Test decoding one byte at a time
+            self.cobsMsg.resetMsg()
+            for i in range(1, len(self.cobsMsg.encoded) - 1):
+                self.cobsMsg.unstuffBytes(self.cobsMsg.encoded[i:i+1], True)
+            self.cobsMsg.unstuffBytes(b'', False)
+            assert(self.cobsMsg.msg == truthDecoded)
+            assert(self.cobsMsg.getMsgCrc() == self.cobsMsg.crc(msg)) # running CRC computed while decoding
+
+        # Test invalid encoding
+        self.cobsMsg.resetMsg()
+        self.cobsMsg.unstuffBytes(pack('B', 10) + b'123', False)
+        assert(self.cobsMsg.crc.checkMsg(self.cobsMsg.msg) == False)
+
+    def test_decodeMsgView(self):
+        """Test that messages with no zero bytes are returned as views into the raw data."""
+        self.cobsMsg.encodeMsg(b'12345') # CRC of message contains no zero bytes
+        rawBytes = bytearray(self.cobsMsg.encoded + b'678')
+        self.cobsMsg.decodeMsg(rawBytes, 0)
+        assert(isinstance(self.cobsMsg.msg, memoryview))
+        assert(self.cobsMsg.msg[:-self.cobsMsg.crcLength] == b'12345')
+
+    def test_parseMsg(self):
+        """Test parseMsg method of COBSMsg."""
+        self.cobsMsg.encodeMsg(testMsg)
+        
+        # Parse message with surrounding bytes
+        inputMsg = b'9876' + self.cobsMsg.encoded + b'1234'
+        parsedMsg = self.cobsMsg.parseMsg(inputMsg, 0)
+        assert(parsedMsg == testMsg)
+        assert(self.cobsMsg.msgEnd == len(inputMsg) - 5)
+
+        # Parse message one byte at a time
+        self.cobsMsg = COBSMsg(2048)
+        self.cobsMsg.encodeMsg(testMsg)
+        for i in range(len(self.cobsMsg.encoded)):
+            parsedMsg = self.cobsMsg.parseMsg(self.cobsMsg.encoded[i:i+1], 0)
+        assert(parsedMsg == testMsg)
+
+        # Test rejection of corrupted message
+        encoded = self.cobsMsg.encoded
+        assert(self.cobsMsg.parseMsg(encoded[:-2] + b'1' + encoded[-1:], 0) == [])
+
+    def test_parseMsgs(self):
+        """Test parseMsgs method of COBSMsg."""
+        self.cobsMsg.encodeMsg(testMsg)
+        encoded = self.cobsMsg.encoded
+        validMsgs, numCorrupt = self.cobsMsg.parseMsgs(encoded + encoded[:-2] + b'1' + encoded[-1:] + encoded[1:])
+        assert(validMsgs == [testMsg, testMsg])
+        assert(numCorrupt == 1)
@@ -0,0 +1,97 @@
+import asyncio, socket, time, serial
+import pytest
+from mesh.generic.asyncComm import AsyncRadio, AsyncUDPRadio, AsyncMeshController, runTDMAComm
+from mesh.generic.nodeParams import NodeParams
+from mesh.generic.radio import Radio
+from mesh.generic.msgParser import MsgParser
+from mesh.generic.hdlcMsg import HDLCMsg
+from mesh.generic.tdmaCmdProcessor import TDMACmdProcessor
+from mesh.generic.tdmaComm import TDMAComm
+from mesh.generic.meshController import MeshController, MeshMsgType
+from mesh.generic.meshTxQueue import MeshMsgPriority
+from unittests.testConfig import configFilePath, testSerialPort
+
+class TestAsyncComm:
+    def setup_method(self, method):
+        self.nodeParams = NodeParams(configFile=configFilePath)
+        self.nodeParams.config.commConfig['transmitSlot'] = 1
+        self.radioConfig = {'uartNumBytesToRead': self.nodeParams.config.uartNumBytesToRead, 'rxBufferSize': 2000}
+        self.radio = Radio(None, self.radioConfig)
+        msgParser = MsgParser({'parseMsgMax': self.nodeParams.config.parseMsgMax}, HDLCMsg(256))
+        self.tdmaComm = TDMAComm([TDMACmdProcessor], self.radio, msgParser, self.nodeParams)
+        self.meshController = MeshController(self.nodeParams, self.tdmaComm)
+
+    def test_waitForData(self):
+        """Test waitForData method of AsyncRadio."""
+        sockets = socket.socketpair()
+        self.radio.serial = sockets[0]
+        asyncRadio = AsyncRadio(self.radio)
+
+        async def wait():
+            assert(await asyncRadio.waitForData(0.01) == False)
+            sockets[1].send(b'123')
+            assert(await asyncRadio.waitForData(1.0) == True)
+        asyncio.run(wait())
+
+        for sock in sockets:
+            sock.close()
+
+    def test_asyncUDPRadio(self):
+        """Test sending and receiving datagrams with AsyncUDPRadio."""
+        async def sendAndReceive():
+            config = dict(self.radioConfig, ipAddr="127.0.0.1", readPort=5010, writePort=5010)
+            radio = await AsyncUDPRadio.create(config)
+            msgs = [b'12345', b'6789']
+            for msg in msgs:
+                radio.sendMsg(msg)
+            assert(await radio.waitForData(1.0) == True)
+            await asyncio.sleep(0.05)
+            assert(radio.readBytes(False) == 9)
+            assert([bytes(datagram) for datagram in radio.getRxDatagrams()] == msgs)
+            radio.close()
+        asyncio.run(sendAndReceive())
+
+    def test_asyncMeshController(self):
+        """Test message queues of AsyncMeshController."""
+        async def sendMsgs():
+            meshController = AsyncMeshController(self.meshController)
+            assert(await meshController.sendMsg(2, b'1234') == True)
+            assert(await meshController.sendMsg(2, b'1'*(self.nodeParams.config.commConfig['msgPayloadMaxLength']+1)) == False)
+
+            # Priority and lifetime passed to transmit queue
+            assert(await meshController.sendMsg(3, b'abc', MeshMsgPriority.control, 5.0) == True)
+            controlMsg = self.tdmaComm.meshQueueIn.peek()
+            assert(controlMsg.msgBytes == b'abc' and controlMsg.priority == MeshMsgPriority.control)
+            assert(controlMsg.expiryTime == pytest.approx(self.nodeParams.clock.getTime() + 5.0, abs=0.5))
+            self.tdmaComm.meshQueueIn.pop()
+
+            # Rejection by full transmit queue reported
+            self.tdmaComm.meshQueueIn.maxDepth = 1
+            assert(await meshController.sendMsg(2, b'9') == False)
+            self.tdmaComm.hostBuffer = bytearray(b'5678')
+            meshController.execute()
+
+            # Message passed to comm for transmission
+            assert(len(self.tdmaComm.meshQueueIn) == 1)
+            assert(self.tdmaComm.meshQueueIn[0].msgBytes == b'1234')
+
+            # Received data
+            msg = await meshController.getMsg()
+            assert(msg.msgType == MeshMsgType.MsgBytes)
+            assert(msg.msgBytes == b'5678')
+        asyncio.run(sendMsgs())
+
+    def test_runTDMAComm(self):
+        """Test that TDMA frame loop runs without blocking the event loop."""
+        self.radio.serial = serial.Serial(port=testSerialPort, baudrate=57600, timeout=0)
+        async def run():
+            task = asyncio.create_task(runTDMAComm(self.tdmaComm))
+            await asyncio.sleep(0.05) # other tasks still run
+            task.cancel()
+            await asyncio.wait([task], timeout=1.0)
+            assert(task.cancelled())
+        asyncio.run(run())
+
+        assert(self.tdmaComm.blockingSleep == False)
+        assert(self.tdmaComm.initStartTime != None) # initialization started
+        self.radio.serial.close()
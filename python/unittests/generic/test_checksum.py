@@ -0,0 +1,32 @@
+from mesh.generic.checksum import FletcherChecksum, calc8bitFletcherChecksum, compareChecksum
+from struct import pack
+
+testMsg = b'1234567890' * 30
+
+def truthChecksum(msgBytes):
+    ck_A = 0
+    ck_B = 0
+    for msgByte in msgBytes:
+        ck_A += msgByte
+        ck_B += ck_A
+    return [ck_A & 0xFF, ck_B & 0xFF]
+
+class TestChecksum:
+
+    def test_calc8bitFletcherChecksum(self):
+        """Test calc8bitFletcherChecksum method."""
+        assert(calc8bitFletcherChecksum(testMsg) == truthChecksum(testMsg))
+        assert(calc8bitFletcherChecksum(b'') == [0, 0])
+
+    def test_compareChecksum(self):
+        """Test compareChecksum method."""
+        assert(compareChecksum(testMsg, pack('BB', *truthChecksum(testMsg))) == True)
+        assert(compareChecksum(testMsg[1:], pack('BB', *truthChecksum(testMsg))) == False)
+
+    def test_update(self):
+        """Test incremental update of FletcherChecksum."""
+        checksum = FletcherChecksum(testMsg[:7])
+        checksum.update(memoryview(testMsg)[7:100])
+        checksum.update(testMsg[100:])
+        assert(checksum.checksum() == truthChecksum(testMsg))
+        assert(checksum.pack() == pack('BB', *truthChecksum(testMsg)))
@@ -0,0 +1,31 @@
+from mesh.generic.clockSource import SystemClock, SimClock
+import time
+
+class TestSystemClock:
+    def setup_method(self, method):
+        self.clock = SystemClock()
+
+    def test_getTime(self):
+        """Test system time returned."""
+        startTime = time.time()
+        clockTime = self.clock.getTime()
+        assert(clockTime >= startTime and clockTime <= time.time())
+
+class TestSimClock:
+    def setup_method(self, method):
+        self.clock = SimClock(10.0)
+
+    def test_sleep(self):
+        """Test sleep advancing simulated time."""
+        assert(self.clock.getTime() == 10.0)
+        self.clock.sleep(2.5)
+        assert(self.clock.getTime() == 12.5)
+        self.clock.sleep(-1.0) # negative durations ignored
+        assert(self.clock.getTime() == 12.5)
+
+    def test_advanceTo(self):
+        """Test advancing simulated time to new time."""
+        self.clock.advanceTo(20.0)
+        assert(self.clock.getTime() == 20.0)
+        self.clock.advanceTo(15.0) # time does not move backwards
+        assert(self.clock.getTime() == 20.0)
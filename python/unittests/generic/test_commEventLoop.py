@@ -0,0 +1,59 @@
+import socket, time
+from mesh.generic.commEventLoop import CommEventLoop
+from mesh.generic.clockSource import SimClock
+
+class TestLink:
+    def __init__(self, fd):
+        self.fd = fd
+
+    def fileno(self):
+        return self.fd
+
+class TestCommEventLoop:
+    def setup_method(self, method):
+        self.eventLoop = CommEventLoop()
+        self.sockets = socket.socketpair()
+        self.link = TestLink(self.sockets[0].fileno())
+        self.eventLoop.register(self.link)
+
+    def teardown_method(self, method):
+        self.eventLoop.close()
+        for sock in self.sockets:
+            sock.close()
+
+    def test_wait(self):
+        """Test wait method of CommEventLoop."""
+        # Wait until event time
+        startTime = time.time()
+        assert(self.eventLoop.wait(startTime + 0.05) == [])
+        assert(time.time() - startTime >= 0.04)
+
+        # Wake on received data
+        self.sockets[1].send(b'123')
+        startTime = time.time()
+        assert(self.eventLoop.wait(startTime + 1.0) == [self.link])
+        assert(time.time() - startTime < 0.5)
+
+    def test_wait_clockSource(self):
+        """Test that wait measures event times with the clock source."""
+        eventLoop = CommEventLoop(clockSource=SimClock(1000.0))
+        startTime = time.time()
+        assert(eventLoop.wait(1000.05) == [])
+        assert(time.time() - startTime >= 0.04)
+        eventLoop.close()
+
+    def test_setMonitored(self):
+        """Test setMonitored method of CommEventLoop."""
+        self.sockets[1].send(b'123')
+        self.eventLoop.setMonitored(self.link, False)
+        assert(self.link not in self.eventLoop.monitored)
+        assert(self.eventLoop.wait(time.time() + 0.01) == [])
+        self.eventLoop.setMonitored(self.link, True)
+        assert(self.eventLoop.wait(time.time() + 0.01) == [self.link])
+
+    def test_pollInterval(self):
+        """Test that links without a file descriptor limit wait time."""
+        self.eventLoop.register(TestLink(None))
+        startTime = time.time()
+        self.eventLoop.wait(startTime + 1.0)
+        assert(time.time() - startTime < 0.5)
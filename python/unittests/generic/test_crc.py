@@ -0,0 +1,39 @@
+import crcmod
+from mesh.generic.crc import CrcCalc, getCrcCalc, CRC8, CRC16
+
+testMsg = b'1234567890'
+
+class TestCrc:
+    
+    def setup_method(self, method):
+        self.crc = CRC16
+
+    def test_getCrcCalc(self):
+        """Test that CRC calculators are shared."""
+        assert(getCrcCalc(0x11021, 0xFFFF, 2) is CRC16)
+        assert(getCrcCalc(0x107, 0x0, 1) is CRC8)
+        assert(getCrcCalc(0x11021, 0x0, 2) is not CRC16)
+
+    def test_call(self):
+        """Test CRC calculation."""
+        crcFun = crcmod.mkCrcFun(0x11021, initCrc=0xFFFF, xorOut=0, rev=False)
+        assert(self.crc(testMsg) == crcFun(testMsg))
+
+        # Test running CRC calculation
+        assert(self.crc(testMsg[5:], self.crc(testMsg[:5])) == crcFun(testMsg))
+
+    def test_checkMsg(self):
+        """Test checkMsg method of CrcCalc."""
+        msg = testMsg + self.crc.pack(self.crc(testMsg))
+        assert(self.crc.checkMsg(msg) == True)
+        assert(self.crc.checkMsg(msg, self.crc(testMsg)) == True) # precomputed CRC
+        assert(self.crc.checkMsg(b'0' + msg[1:]) == False) # corrupt message
+        assert(self.crc.checkMsg(msg[-2:]) == False) # no message contents
+
+    def test_checkMsgs(self):
+        """Test checkMsgs method of CrcCalc."""
+        msg = testMsg + self.crc.pack(self.crc(testMsg))
+        msgs = [(msg, None), (b'0' + msg[1:], None), (msg, self.crc(testMsg))]
+        validMsgs, numCorrupt = self.crc.checkMsgs(msgs)
+        assert(validMsgs == [testMsg, testMsg])
+        assert(numCorrupt == 1)
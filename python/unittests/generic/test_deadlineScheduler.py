@@ -0,0 +1,45 @@
+from mesh.generic.deadlineScheduler import DeadlineScheduler
+from mesh.generic.clockSource import SimClock
+import time
+
+class TestComm:
+    def __init__(self, eventTime, readPending=False):
+        self.eventTime = eventTime
+        self.readPending = readPending
+
+    def getNextEventTime(self, currentTime):
+        return self.eventTime
+
+    def isReadPending(self):
+        return self.readPending
+
+class TestDeadlineScheduler:
+    def setup_method(self, method):
+        self.scheduler = DeadlineScheduler(spinTime=0.002)
+
+    def test_waitUntil(self):
+        """Test waiting until deadline."""
+        deadline = time.time() + 0.02
+        lateness = self.scheduler.waitUntil(deadline)
+        assert(time.time() >= deadline)
+        assert(lateness >= 0.0 and lateness < 0.002)
+
+        # Deadline already passed
+        deadline = time.time() - 0.01
+        assert(self.scheduler.waitUntil(deadline) >= 0.01)
+
+    def test_waitUntilSimClock(self):
+        """Test waiting with simulated clock."""
+        scheduler = DeadlineScheduler(SimClock(10.0))
+        assert(scheduler.waitUntil(12.5) == 0.0)
+        assert(scheduler.clockSource.getTime() == 12.5)
+
+    def test_waitForNextEvent(self):
+        """Test waiting for next comm event."""
+        scheduler = DeadlineScheduler(SimClock(10.0), pollInterval=0.001)
+        scheduler.waitForNextEvent(TestComm(10.1))
+        assert(scheduler.clockSource.getTime() == 10.1)
+
+        # Received data polled before event
+        scheduler.waitForNextEvent(TestComm(10.2, True))
+        assert(abs(scheduler.clockSource.getTime() - 10.101) < 1e-9)
@@ -0,0 +1,66 @@
+from mesh.generic.eventRunner import DiscreteEventRunner
+from mesh.generic.clockSource import SimClock
+from mesh.generic.virtualMedium import VirtualMedium
+from mesh.generic.tdmaComm import TDMAComm
+from mesh.generic.tdmaCmdProcessor import TDMACmdProcessor
+from mesh.generic.meshController import MeshController
+from mesh.generic.msgParser import MsgParser
+from mesh.generic.hdlcMsg import HDLCMsg
+from mesh.generic.radio import Radio
+from mesh.generic.nodeParams import NodeParams
+from unittests.testConfig import configFilePath
+
+class TestDiscreteEventRunner:
+    def setup_method(self, method):
+        self.clock = SimClock(1000.0)
+        self.runner = DiscreteEventRunner(self.clock)
+
+    def test_addEvent(self):
+        """Test execution of scheduled events in time order."""
+        executed = []
+        self.runner.addEvent(1002.0, lambda: executed.append((2, self.clock.getTime())))
+        self.runner.addEvent(1001.0, lambda: executed.append((1, self.clock.getTime())))
+        self.runner.addEvent(1001.0, lambda: executed.append((3, self.clock.getTime())))
+        self.runner.addEvent(1010.0, lambda: executed.append((4, self.clock.getTime())))
+
+        self.runner.run(1005.0)
+        assert(executed == [(1, 1001.0), (3, 1001.0), (2, 1002.0)])
+        assert(self.clock.getTime() == 1005.0)
+        assert(self.runner.eventCount == 3)
+
+    def test_meshNetwork(self):
+        """Test simulated operation of mesh network over virtual medium."""
+        numNodes = 3
+        medium = VirtualMedium(numNodes, clockSource=self.clock)
+        controllers = []
+        for nodeId in range(1, numNodes+1):
+            nodeParams = NodeParams(configFile=configFilePath, clockSource=self.clock)
+            nodeParams.config.nodeId = nodeId
+            nodeParams.config.commConfig['transmitSlot'] = nodeId
+            radio = Radio(medium.getPort(nodeId), {'uartNumBytesToRead': nodeParams.config.uartNumBytesToRead, 'rxBufferSize': 2000})
+            msgParser = MsgParser({'parseMsgMax': nodeParams.config.parseMsgMax}, HDLCMsg(256))
+            comm = TDMAComm([TDMACmdProcessor], radio, msgParser, nodeParams)
+            controllers.append(MeshController(nodeParams, comm))
+            self.runner.addNode(controllers[-1], medium.getPort(nodeId))
+
+        # Run through mesh initialization and several frames
+        initTimeToWait = controllers[0].nodeParams.config.commConfig['initTimeToWait']
+        self.runner.run(self.clock.getTime() + initTimeToWait + 10.0)
+
+        for controller in controllers:
+            comm = controller.comm
+            assert(comm.inited == True)
+            assert(comm.commStartTime == controllers[0].comm.commStartTime)
+
+            # Verify messages received from all other nodes
+            nodeId = controller.nodeParams.config.nodeId
+            for otherId in range(1, numNodes+1):
+                if otherId != nodeId:
+                    assert(controller.nodeParams.nodeStatus[otherId-1].present == True)
+        assert(medium.rxBytes[0] > 0 and medium.collisionCount == 0)
+
+        # Send message between nodes
+        self.runner.addEvent(self.clock.getTime() + 0.5, lambda: controllers[0].sendMsg(3, b'12345'))
+        self.runner.run(self.clock.getTime() + 2.0)
+        msgs = controllers[2].getMsgs()
+        assert(len(msgs) == 1 and msgs[0].msgBytes == b'12345')
@@ -1,4 +1,5 @@
 from mesh.generic.formationClock import FormationClock
+from mesh.generic.clockSource import SimClock
 import time
 
 class TestFormationClock:
@@ -31,3 +32,14 @@ class TestFormationClock:
         offset = self.clock.getOffset()
         assert(abs(offset) < 0.00001)
         
+
+    def test_clockSource(self):
+        """Test clock time from provided clock source."""
+        clock = FormationClock(clockSource=SimClock(100.0))
+        assert(clock.getTime() == 100.0)
+        clock.clockSource.sleep(5.0)
+        assert(clock.getTime() == 105.0)
+
+        # Referenced clock
+        clock = FormationClock(90.0, clockSource=SimClock(100.0))
+        assert(clock.getTime() == 10.0)
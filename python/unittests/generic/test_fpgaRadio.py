@@ -0,0 +1,44 @@
+import serial, time, struct
+from mesh.generic.fpgaRadio import FPGARadio, FPGAMsgOverhead
+from mesh.generic.slipMsg import SLIP_END
+from mesh.generic.cmds import FPGACmds
+from mesh.generic.crc import CRC16_ARC
+from mesh.generic.clockSource import SimClock
+from unittests.testConfig import testSerialPort
+
+class TestFPGARadio:
+    def setup_method(self, method):
+        self.serialPort = serial.Serial(port=testSerialPort, baudrate=57600, timeout=0)
+        self.radio = FPGARadio(self.serialPort, {'uartNumBytesToRead': 100, 'rxBufferSize': 2000})
+
+    def test_sendMsg(self):
+        """Test sendMsg method of FPGARadio."""
+        msgBytes = b'12345'
+        assert(self.radio.sendMsg(msgBytes) == len(msgBytes) + FPGAMsgOverhead)
+        time.sleep(0.1)
+        assert(self.serialPort.read(100) == SLIP_END + struct.pack('=BH', FPGACmds['FPGAMsgStart'], len(msgBytes)) + msgBytes + struct.pack('H', CRC16_ARC(msgBytes)))
+
+    def test_txPacing(self):
+        """Test that message framing is included in transmit pacing."""
+        radio = FPGARadio(self.serialPort, {'uartNumBytesToRead': 100, 'rxBufferSize': 2000, 'txRate': 100, 'txFifoSize': 50})
+        radio.clockSource = SimClock(10.0)
+        radio.txLevelTime = 10.0
+        radio.bufferTxMsg(b'1'*200)
+
+        assert(radio.sendBuffer() == 50) # framing written with message
+        assert(radio.txFifoLevel <= radio.txFifoSize)
+        assert(radio.getTxPendingBytes() == 200 - (50 - FPGAMsgOverhead))
+        assert(radio.sendBuffer() == 0) # FIFO full
+
+        # FIFO drains at transmit rate
+        radio.clockSource.advanceTo(10.0 + 0.3) # FIFO level drained to 20 bytes
+        assert(radio.sendBuffer() == 30)
+        assert(radio.txFifoLevel <= radio.txFifoSize)
+        assert(radio.getTxPendingBytes() == 200 - (80 - 2*FPGAMsgOverhead))
+        time.sleep(0.1)
+        self.serialPort.read(1000)
+
+    def test_getMsgBytesSent(self):
+        """Test that partially written messages remain queued."""
+        assert(self.radio.getMsgBytesSent(10, 10 + FPGAMsgOverhead) == 10)
+        assert(self.radio.getMsgBytesSent(10, 10) == 0)
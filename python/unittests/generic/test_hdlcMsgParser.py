@@ -1,4 +1,5 @@
 from mesh.generic.msgParser import MsgParser
+from mesh.generic.hdlcMsgParser import HDLCMsgParser
 from mesh.generic.hdlcMsg import HDLCMsg
 from test_HDLCMsg import truthHDLCMsg, testMsg
 from mesh.generic.utilities import packData
@@ -15,7 +16,7 @@ class TestHDLCMsgParser:
         self.msgParser.parseSerialMsg(truthHDLCMsg, 0)
         assert(self.msgParser.msg.msgFound == True) # hdlc msg found
         assert(self.msgParser.msg.msgEnd != 1) # message end found
-        assert(self.msgParser.parsedMsgs == []) # message rejected      
+        assert(len(self.msgParser.parsedMsgs) == 0) # message rejected      
 
         # Check acceptance of message with valid CRC    
         crc = self.msgParser.msg.crc(testMsg)
@@ -27,7 +28,7 @@ class TestHDLCMsgParser:
         assert(self.msgParser.parsedMsgs[0] == testMsg) # message accepted  
         
         # Check that proper message end position is returned
-        self.msgParser.parsedMsgs = []
+        self.msgParser.parsedMsgs.clear()
         paddedMsg = hdlcMsg.encoded + b'989898'
         msgEnd = self.msgParser.parseSerialMsg(paddedMsg, 0)
         assert(self.msgParser.parsedMsgs[0] == testMsg)
@@ -39,3 +40,11 @@ class TestHDLCMsgParser:
         hdlcMsg.encodeMsg(testMsg)
         encodedMsg = self.msgParser.encodeMsg(testMsg)
         assert(encodedMsg == hdlcMsg.encoded)
+
+    def test_HDLCMsgParser(self):
+        """Test that HDLCMsgParser encodes and parses messages using the HDLC message format."""
+        msgParser = HDLCMsgParser({'parseMsgMax': 10})
+        encodedMsg = msgParser.encodeMsg(testMsg)
+        assert(encodedMsg == self.msgParser.encodeMsg(testMsg))
+        msgParser.parseMsgs(encodedMsg)
+        assert(list(msgParser.parsedMsgs) == [testMsg])
@@ -1,9 +1,10 @@
 import serial, time
 from copy import deepcopy
-from mesh.generic.li1Radio import Li1Radio, Li1SyncBytes, Li1HeaderLength, checksumLen
+from mesh.generic.li1Radio import Li1Radio, Li1SyncBytes, Li1HeaderLength, Li1MaxPayload, checksumLen
 from mesh.generic.li1RadioCmds import Li1RadioCmds
 from mesh.generic.checksum import calc8bitFletcherChecksum
 from mesh.generic.nodeParams import NodeParams
+from mesh.generic.clockSource import SimClock
 from unittests.testConfig import configFilePath, testSerialPort
 from struct import pack
 
@@ -94,6 +95,19 @@ class TestLi1Radio:
         self.li1Radio.processRxBytes(msgBytes, False)
         assert(self.li1Radio.rxBuffer[0:self.li1Radio.bytesInRxBuffer] == testPayload) # payload parsed correctly
     
+    def test_processRxBytesPartial(self):
+        """Test processRxBytes method of Li1Radio with commands split across reads."""
+        payload = b'0'*16 + testPayload + b'00' # AX.25 wrapped payload
+        msgBytes = self.li1Radio.createCommand({'commandType': Li1RadioCmds['ReceivedData'], 'payloadSize': len(payload), 'payload': payload, 'msgBytes': bytearray()})
+        rxBytes = b'12H' + msgBytes + b'He' + msgBytes + b'H'
+        for i in range(1, len(rxBytes)):
+            self.li1Radio = Li1Radio(self.serialPort, {'uartNumBytesToRead': self.nodeParams.config.uartNumBytesToRead, 'rxBufferSize': 2000})
+            self.li1Radio.processRxBytes(rxBytes[:i], True)
+            self.li1Radio.processRxBytes(rxBytes[i:], True)
+            assert(len(self.li1Radio.cmdBuffer) == 2) # both commands parsed
+            assert(self.li1Radio.rxBuffer[0:self.li1Radio.bytesInRxBuffer] == testPayload + testPayload)
+            assert(self.li1Radio.cmdRxBuffer[self.li1Radio.cmdRxReadPos:] == b'H') # possible start of next command retained
+
     def test_sendMsg(self):
         """Test sendMsg method of Li1Radio."""
         # Send message smaller than max payload
@@ -110,6 +124,13 @@ class TestLi1Radio:
         readBytes = self.serialPort.read(1000)
         assert(len(readBytes) == 2*Li1HeaderLength + len(msgBytes) + 2*checksumLen) # check two messages sent
         
+    def test_packMsgs(self):
+        """Test packMsgs method of Li1Radio."""
+        msgBytes = pack(255*'B', *range(255)) + b'12345'
+        msgLength = self.li1Radio.packMsgs(msgBytes)
+        assert(msgLength == 2*(Li1HeaderLength + checksumLen) + len(msgBytes))
+        assert(self.li1Radio.txMsgBuffer[0:msgLength] == self.li1Radio.createMsg(msgBytes[:255]) + self.li1Radio.createMsg(msgBytes[255:])) # messages packed back-to-back
+        
     def test_sendBuffer(self):
         """Test sendBuffer method of Li1Radio."""
         msgBytes = b'12345'
@@ -124,3 +145,31 @@ class TestLi1Radio:
     def test_sendCommand(self): 
         """Test sendCommand method of Li1Radio."""
                         
+
+    def test_getMsgBytesSent(self):
+        """Test that message bytes are only counted as sent once their radio message is completely written."""
+        radioMsgLength = Li1HeaderLength + Li1MaxPayload + checksumLen
+        assert(self.li1Radio.getMsgBytesSent(600, self.li1Radio.encodedTxLength(600)) == 600)
+        assert(self.li1Radio.getMsgBytesSent(600, radioMsgLength + 10) == Li1MaxPayload)
+        assert(self.li1Radio.getMsgBytesSent(600, 10) == 0)
+
+    def test_txPacing(self):
+        """Test that radio message overhead is included in transmit pacing."""
+        radio = Li1Radio(self.serialPort, {'uartNumBytesToRead': 100, 'rxBufferSize': 2000, 'txRate': 100, 'txFifoSize': 50})
+        radio.clockSource = SimClock(10.0)
+        radio.txLevelTime = 10.0
+        radio.bufferTxMsg(b'1'*200)
+
+        msgOverhead = Li1HeaderLength + checksumLen
+        assert(radio.sendBuffer() == 50) # header and checksum written with payload
+        assert(radio.txFifoLevel <= radio.txFifoSize)
+        assert(radio.getTxPendingBytes() == 200 - (50 - msgOverhead))
+        assert(radio.sendBuffer() == 0) # FIFO full
+
+        # FIFO drains at transmit rate
+        radio.clockSource.advanceTo(10.0 + 0.3) # FIFO level drained to 20 bytes
+        assert(radio.sendBuffer() == 30)
+        assert(radio.txFifoLevel <= radio.txFifoSize)
+        assert(radio.getTxPendingBytes() == 200 - (80 - 2*msgOverhead))
+        time.sleep(0.1)
+        self.serialPort.read(1000)
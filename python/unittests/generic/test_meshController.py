@@ -5,6 +5,7 @@ from mesh.generic.hdlcMsg import HDLCMsg
 from mesh.generic.tdmaCmdProcessor import TDMACmdProcessor
 from mesh.generic.tdmaComm import TDMAComm
 from mesh.generic.meshController import MeshController, MeshMsg, MeshMsgType, NetworkPoll, VoteDecision, NetworkVote
+from mesh.generic.meshTxQueue import MeshMsgPriority
 from mesh.generic.cmds import TDMACmds, NodeCmds
 from unittests.testConfig import configFilePath, testSerialPort
 import pytest, time
@@ -75,6 +76,13 @@ class TestTDMAComm:
         assert(self.meshController.sendMsg(destId, msg) == False)
         assert(len(self.tdmaComm.meshQueueIn) == 1) # message not added to queue
 
+        # Test message priority and lifetime
+        assert(self.meshController.sendMsg(destId, b'3', MeshMsgPriority.control, lifetime=5.0) == True)
+        msg = self.tdmaComm.meshQueueIn[0]
+        assert(msg.msgBytes == b'3' and msg.priority == MeshMsgPriority.control)
+        assert(abs(msg.expiryTime - (self.nodeParams.clock.getTime() + 5.0)) < 0.1)
+        assert(self.tdmaComm.meshQueueIn[1].expiryTime == None) # no expiry by default
+
     def test_getMsgs(self):
         """Test getMsgs method of MeshController."""        
         meshTraffic = b'1234567890'
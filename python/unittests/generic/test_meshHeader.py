@@ -0,0 +1,65 @@
+from mesh.generic.meshHeader import packVarint, unpackVarint, isCompactHeader, compactHeaderLength, packCompactHeader, unpackCompactHeader, relayCompactHeader, MESH_HEADER_COMPACT_MIN
+import struct
+
+class TestMeshHeader:
+
+    def test_varint(self):
+        """Test packVarint and unpackVarint functions."""
+        for value, length in [(0, 1), (127, 1), (128, 2), (16383, 2), (16384, 3), (65535, 3)]:
+            varint = packVarint(value)
+            assert(len(varint) == length)
+            assert(unpackVarint(b'1' + varint, 1) == (value, length + 1))
+
+        # Test incomplete varint
+        assert(unpackVarint(packVarint(300)[:-1], 0)[0] == None)
+
+    def test_packCompactHeader(self):
+        """Test packing and unpacking of compact header."""
+        # Test minimal header
+        header = packCompactHeader(1, 2, 0, 0, 10)
+        assert(len(header) == 4)
+        assert(isCompactHeader(header) == True)
+        assert(unpackCompactHeader(header) == {'sourceId': 1, 'destId': 2, 'originId': None, 'statusByte': 0, 'adminLength': 0, 'payloadLength': 0, 'seqNum': 10, 'seqNumBits': 8, 'headerLength': 4})
+
+        # Test all fields
+        header = packCompactHeader(1, 0, 200, 20, 300, 2, originId=3, seqNumBits=12)
+        assert(len(header) == compactHeaderLength(200, 20, 12, 2, True))
+        contents = unpackCompactHeader(header)
+        assert(contents['originId'] == 3)
+        assert(contents['seqNum'] == 300 and contents['seqNumBits'] == 12)
+        assert(contents['statusByte'] == 2)
+        assert(contents['adminLength'] == 200 and contents['payloadLength'] == 20)
+        assert(contents['headerLength'] == len(header))
+
+        # Test status byte with 8-bit sequence number
+        header = packCompactHeader(1, 2, 0, 5, 300, 1)
+        assert(len(header) == compactHeaderLength(0, 5, 8, 1))
+        contents = unpackCompactHeader(header)
+        assert(contents['seqNum'] == 300 & 0xFF and contents['statusByte'] == 1)
+
+    def test_unpackCompactHeader(self):
+        """Test rejection of invalid compact headers."""
+        header = packCompactHeader(1, 2, 500, 5, 10)
+        assert(unpackCompactHeader(header[:-1]) == None) # incomplete length
+        assert(unpackCompactHeader(header[:3]) == None) # incomplete header
+        assert(unpackCompactHeader(b'\xff' + header[1:]) == None) # unsupported version
+
+        # Standard header not identified as compact
+        assert(isCompactHeader(struct.pack('<BBHHHB', MESH_HEADER_COMPACT_MIN - 1, 2, 0, 0, 1, 0)) == False)
+
+    def test_relayCompactHeader(self):
+        """Test relayCompactHeader function."""
+        packet = packCompactHeader(1, 2, 0, 3, 10) + b'123'
+
+        # Origin recorded on first relay
+        relayed = relayCompactHeader(packet, 4)
+        contents = unpackCompactHeader(relayed)
+        assert(contents['sourceId'] == 4 and contents['originId'] == 1)
+        assert(contents['seqNum'] == 10 and contents['payloadLength'] == 3)
+        assert(relayed[contents['headerLength']:] == b'123')
+
+        # Origin retained on later relays
+        relayed = relayCompactHeader(relayed, 5)
+        contents = unpackCompactHeader(relayed)
+        assert(contents['sourceId'] == 5 and contents['originId'] == 1)
+        assert(len(relayed) == len(packet) + 1)
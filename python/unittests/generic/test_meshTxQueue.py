@@ -0,0 +1,85 @@
+from mesh.generic.meshTxQueue import MeshTxQueue, MeshMsgPriority
+from mesh.generic.meshController import MeshTxMsg
+
+class TestMeshTxQueue:
+    def setup_method(self, method):
+        self.queue = MeshTxQueue(maxDepth=5)
+
+    def test_priority(self):
+        """Test messages sent in priority order."""
+        self.queue.append(MeshTxMsg(1, b'bulk', MeshMsgPriority.bulk))
+        self.queue.append(MeshTxMsg(1, b'state', MeshMsgPriority.state))
+        self.queue.append(MeshTxMsg(1, b'control', MeshMsgPriority.control))
+        assert(len(self.queue) == 3)
+        assert(self.queue[0].msgBytes == b'control')
+        assert(self.queue.peek().msgBytes == b'control')
+        assert([self.queue.pop().msgBytes for i in range(3)] == [b'control', b'state', b'bulk'])
+        assert(self.queue.pop() == None)
+        assert(len(self.queue) == 0)
+
+    def test_fairSharing(self):
+        """Test destinations served in turn within priority class."""
+        for i in range(3):
+            self.queue.append(MeshTxMsg(1, b'1'))
+        self.queue.append(MeshTxMsg(2, b'2'))
+        self.queue.append(MeshTxMsg(3, b'3'))
+        assert([msg.destId for msg in self.queue] == [1, 2, 3, 1, 1])
+        assert([self.queue.pop().destId for i in range(5)] == [1, 2, 3, 1, 1])
+
+    def test_full(self):
+        """Test handling of full queue."""
+        for i in range(5):
+            assert(self.queue.append(MeshTxMsg(i, b'bulk', MeshMsgPriority.bulk)) == True)
+
+        # Higher priority message displaces newest bulk message
+        assert(self.queue.append(MeshTxMsg(9, b'control', MeshMsgPriority.control)) == True)
+        assert(len(self.queue) == 5)
+        assert(4 not in [msg.destId for msg in self.queue])
+        assert(self.queue.dropCount[MeshMsgPriority.bulk] == 1)
+
+        # Message of equal priority dropped
+        assert(self.queue.append(MeshTxMsg(9, b'bulk', MeshMsgPriority.bulk)) == False)
+        assert(self.queue.dropCount[MeshMsgPriority.bulk] == 2)
+        assert(self.queue.getStatus()['depthByPriority'] == [1, 0, 4])
+
+    def test_dropExpired(self):
+        """Test removal of expired messages."""
+        self.queue.append(MeshTxMsg(1, b'1', expiryTime=10.0))
+        self.queue.append(MeshTxMsg(1, b'2', expiryTime=20.0))
+        self.queue.append(MeshTxMsg(2, b'3'))
+        self.queue.dropExpired(15.0)
+        assert([msg.msgBytes for msg in self.queue] == [b'2', b'3'])
+        assert(self.queue.expiredCount[MeshMsgPriority.state] == 1)
+        self.queue.dropExpired(25.0)
+        assert(len(self.queue) == 1 and self.queue.peek().destId == 2)
+
+    def test_popFitting(self):
+        """Test selection of messages that fit in available capacity."""
+        self.queue.maxDepth = 10
+        self.queue.append(MeshTxMsg(1, b'1'*50, MeshMsgPriority.control))
+        self.queue.append(MeshTxMsg(2, b'2'*80))
+        self.queue.append(MeshTxMsg(2, b'2'*10)) # held behind larger message to same destination
+        self.queue.append(MeshTxMsg(3, b'3'*30))
+        self.queue.append(MeshTxMsg(4, b'4'*20, MeshMsgPriority.bulk))
+        self.queue.append(MeshTxMsg(5, b'5'*500)) # too large to ever send
+
+        msgs = self.queue.popFitting(100, lambda msg, msgs: len(msg.msgBytes), 200)
+        assert([msg.destId for msg in msgs] == [1, 3, 4]) # smaller messages fill space left by message that did not fit
+        assert(self.queue.sentCount == 3)
+        assert(self.queue.dropCount[MeshMsgPriority.state] == 1)
+        assert([msg.destId for msg in self.queue] == [2, 2])
+
+        # Higher priority messages claim space first
+        self.queue.append(MeshTxMsg(4, b'4'*10, MeshMsgPriority.bulk))
+        msgs = self.queue.popFitting(85, lambda msg, msgs: len(msg.msgBytes))
+        assert([len(msg.msgBytes) for msg in msgs] == [80])
+        msgs = self.queue.popFitting(20, lambda msg, msgs: len(msg.msgBytes))
+        assert([msg.destId for msg in msgs] == [2, 4])
+        assert(len(self.queue) == 0)
+
+    def test_dropNext(self):
+        """Test dropping of unsendable message."""
+        self.queue.append(MeshTxMsg(1, b'1'))
+        self.queue.dropNext()
+        status = self.queue.getStatus()
+        assert(status['depth'] == 0 and status['sent'] == 0 and status['dropped'][MeshMsgPriority.state] == 1)
@@ -1,4 +1,5 @@
 from mesh.generic.msgParser import MsgParser
+from mesh.generic.slipMsg import SLIPMsg
 from struct import pack
 
 class TestMsgParser:
@@ -31,3 +32,28 @@ class TestMsgParser:
         assert(self.msgParser.parsedMsgs[0] == msg)
         assert(self.msgParser.parsedMsgs[1] == msg2)
         
+
+    def test_getMsgs(self):
+        """Test getMsgs method of MsgParser."""
+        msgs = [b'12345', b'6789', b'0']
+        for msg in msgs:
+            self.msgParser.parseMsgs(msg)
+        assert([msg for msg in self.msgParser.getMsgs()] == msgs) # messages returned in order received
+        assert(len(self.msgParser.parsedMsgs) == 0) # parsed messages removed
+
+    def test_msgViews(self):
+        """Test storage of parsed messages as copies or views of the parsed buffer."""
+        self.msgParser = MsgParser({'parseMsgMax': 10}, SLIPMsg(256))
+        rxBuffer = bytearray(self.msgParser.encodeMsg(b'12345') + b'000')
+        
+        # Parsed messages copied by default
+        self.msgParser.parseMsgs(rxBuffer, len(rxBuffer) - 3)
+        assert(isinstance(self.msgParser.parsedMsgs[0], bytes))
+        assert(self.msgParser.parsedMsgs[0] == b'12345')
+
+        # Views of parsed buffer
+        self.msgParser.parsedMsgs.clear()
+        self.msgParser.msgViews = True
+        self.msgParser.parseMsgs(rxBuffer, len(rxBuffer) - 3)
+        assert(isinstance(self.msgParser.parsedMsgs[0], memoryview))
+        assert(self.msgParser.parsedMsgs[0] == b'12345')
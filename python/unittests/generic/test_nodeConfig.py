@@ -95,6 +95,39 @@ class TestNodeConfig:
 
         assert(nodeConfig.calculateHash() == self.nodeConfig.calculateHash())
 
+    def test_calculateHashDefaults(self):
+        """Test that calculateHash only includes parameters that must match across the network."""
+        nodeConfig = NodeConfig(configFilePath)
+
+        # Verify that message aggregation is disabled by default and only included in hash when enabled
+        assert(nodeConfig.commConfig['aggregateMsgs'] == False)
+        nodeConfig.commConfig['aggregateMsgs'] = True
+        assert(nodeConfig.calculateHash() != self.nodeConfig.calculateHash())
+        nodeConfig.commConfig['aggregateMsgs'] = False
+
+        # Verify that mesh header parameters are only included in hash when compact header selected
+        nodeConfig.commConfig['meshSeqNumBits'] = 12
+        assert(nodeConfig.calculateHash() == self.nodeConfig.calculateHash())
+        nodeConfig.commConfig['meshHeader'] = 'compact'
+        assert(nodeConfig.calculateHash() != self.nodeConfig.calculateHash())
+        nodeConfig.commConfig.update({'meshHeader': 'standard', 'meshSeqNumBits': 8})
+
+        # Verify that node control interface link parameters are not included in hash
+        nodeConfig.interface.update({'type': "shm", 'shmName': "test", 'shmSize': 1024, 'shmWakeup': True})
+        assert(nodeConfig.calculateHash() == self.nodeConfig.calculateHash())
+
+        # Verify that node-local scheduling parameters are not included in hash
+        nodeConfig.commConfig.update({'eventLoop': True, 'deadlineScheduler': True, 'spinTime': 0.01})
+        assert(nodeConfig.calculateHash() == self.nodeConfig.calculateHash())
+
+        # Verify that radio pacing parameters are not included in hash
+        nodeConfig.commConfig.update({'txPacing': True, 'radioFifoSize': 128})
+        assert(nodeConfig.calculateHash() == self.nodeConfig.calculateHash())
+
+        # Verify that transmit queue parameters are not included in hash
+        nodeConfig.commConfig.update({'txQueueMaxDepth': 10, 'msgLifetime': 5.0})
+        assert(nodeConfig.calculateHash() == self.nodeConfig.calculateHash())
+
     def test_hashElem(self):
         """Test hashElem function to ensure proper handling of all data types."""
         
@@ -144,6 +177,11 @@ class TestNodeConfig:
 
         assert(self.nodeConfig.calculateHash() == nc_protobuf.calculateHash())
 
+        # Test conversion of wire format parameters
+        configData['tdmaConfig'].update({'aggregateMsgs': True, 'meshHeader': 'compact', 'meshSeqNumBits': 12})
+        fromProtobuf = NodeConfig.fromProtoBuf(NodeConfig.toProtoBuf(configData).SerializeToString())
+        assert(NodeConfig(configData=configData).calculateHash() == NodeConfig(configData=fromProtobuf).calculateHash())
+
     def checkConfigEntries(self, testEntries, testCondition, configEntries=None):
         if configEntries == None:
             configEntries = list(self.nodeConfig.__dict__.keys())
@@ -1,6 +1,7 @@
 import serial, time
 from mesh.generic.radio import Radio, RadioMode
 from mesh.generic.nodeParams import NodeParams
+from mesh.generic.clockSource import SimClock
 from unittests.testConfig import configFilePath, testSerialPort
 from mesh.generic.customExceptions import NoSerialConnection
 import pytest
@@ -61,6 +62,43 @@ class TestRadio:
         assert(self.radio.rxBuffer == testMsg)
         self.radio.bufferRxMsg(b'99999', True) # confirm that bytes are not buffered
         assert(self.radio.rxBuffer == testMsg)
+        assert(self.radio.rxOverflowCount == 5)
+
+        # Test wrapping around end of buffer
+        self.radio.consumeRxBytes(7)
+        self.radio.bufferRxMsg(b'ABCDE', True)
+        assert(self.radio.getRxBytes() == b'890ABCDE')
+        assert(self.radio.getRxRanges() == [(7, 10), (0, 5)])
+        assert([bytes(span) for span in self.radio.getRxSpans()] == [b'890', b'ABCDE'])
+
+    def test_consumeRxBytes(self):
+        """Test consumeRxBytes method of Radio."""
+        self.radio.bufferRxMsg(b'1234567890', True)
+        self.radio.consumeRxBytes(4)
+        assert(self.radio.rxReadPos == 4)
+        assert(self.radio.getRxBytes() == b'567890')
+        self.radio.consumeRxBytes(100) # consume all
+        assert(self.radio.bytesInRxBuffer == 0)
+        assert(self.radio.rxReadPos == 0)
+
+    def test_readIntoRxBuffer(self):
+        """Test readIntoRxBuffer method of Radio."""
+        self.radio.rxBufferSize = 10
+        self.radio.clearRxBuffer()
+        rxBuffer = self.radio.rxBuffer
+        self.radio.bufferRxMsg(b'12345678', True)
+        self.radio.consumeRxBytes(6)
+
+        # Fill remaining space in two spans
+        data = [b'ABCDEFGHIJ']
+        def readInto(span):
+            numBytes = min(len(span), len(data[0]))
+            span[0:numBytes] = data[0][0:numBytes]
+            data[0] = data[0][numBytes:]
+            return numBytes
+        assert(self.radio.readIntoRxBuffer(readInto, 100) == 8)
+        assert(self.radio.getRxBytes() == b'78ABCDEFGH')
+        assert(self.radio.rxBuffer is rxBuffer) # buffer not reallocated
 
     def test_getRxBytes(self):
         """Test getRxBytes method of Radio."""
@@ -159,5 +197,51 @@ class TestRadio:
         time.sleep(0.1)
         self.radio.readBytes(True)
         assert(len(self.radio.txBuffer) == 50)
+        assert(self.radio.getTxPendingBytes() == 50)
         assert(self.radio.bytesInRxBuffer == 50)
 
+        # Test sending remaining bytes spanning multiple frames
+        self.radio.clearRxBuffer()
+        self.radio.bufferTxMsg(b'2'*20)
+        assert(self.radio.sendBuffer() == 70)
+        assert(self.radio.getTxPendingBytes() == 0)
+        time.sleep(0.1)
+        self.radio.readBytes(True)
+        assert(self.radio.getRxBytes() == b'1'*50 + b'2'*20)
+
+        # Test bytes not written to radio remain queued
+        class PartialWriter:
+            def write(self, msgBytes):
+                return min(len(msgBytes), 30)
+        self.radio.serial = PartialWriter()
+        self.radio.bufferTxMsg(b'3'*50)
+        assert(self.radio.sendBuffer() == 30)
+        assert(self.radio.getTxPendingBytes() == 20)
+        assert(self.radio.txBuffer == b'3'*20)
+
+    def test_txPacing(self):
+        """Test pacing of transmitted bytes against transmit rate and FIFO size."""
+        assert(self.radio.getTxAllowance() == None) # not paced
+
+        radio = Radio(self.serialPort, {'uartNumBytesToRead': 100, 'rxBufferSize': 2000, 'txRate': 1000, 'txFifoSize': 100})
+        radio.clockSource = SimClock(10.0)
+        radio.txLevelTime = 10.0
+        assert(radio.getTxAllowance() == 100)
+
+        # Bytes sent limited to FIFO size
+        radio.bufferTxMsg(b'1'*250)
+        assert(radio.sendBuffer() == 100)
+        assert(radio.getTxPendingBytes() == 150)
+        assert(radio.sendBuffer() == 0) # FIFO full
+        assert(abs(radio.getTxCompleteTime() - 10.1) < 1e-9)
+
+        # FIFO drains at transmit rate
+        radio.clockSource.advanceTo(10.05)
+        assert(radio.getTxAllowance() == 50)
+        assert(radio.sendBuffer(deadline=10.1) == 0) # no bytes can be transmitted before deadline
+        assert(radio.sendBuffer(deadline=10.12) == 20)
+        assert(radio.sendBuffer(20) == 20) # limited by max bytes
+        assert(radio.sendBuffer() == 10)
+        assert(abs(radio.getTxCompleteTime() - 10.15) < 1e-9)
+        time.sleep(0.1)
+        self.serialPort.read(1000)
@@ -0,0 +1,114 @@
+import os, select, threading
+from multiprocessing import shared_memory
+from mesh.generic.shmRadio import ShmRadio, ShmRing, ShmHeaderStruct, ShmReadyPos, ShmCapacityPos, ShmReadyWord, ShmDataPos
+from mesh.generic.nodeParams import NodeParams
+from unittests.testConfig import configFilePath
+
+class TestShmRing:
+    def setup_method(self, method):
+        self.ring = ShmRing('meshTestRing' + str(os.getpid()), 64)
+
+    def teardown_method(self, method):
+        self.ring.close()
+
+    def test_init(self):
+        """Test that ring capacity is rounded to power of two and existing ring is attached."""
+        ring = ShmRing('meshTestRing' + str(os.getpid()), 50)
+        assert(self.ring.created == True)
+        assert(ring.created == False)
+        assert(ring.capacity == 64)
+        ring.close()
+
+    def test_attachUninitialized(self):
+        """Test that attaching waits for the creator to initialize the ring."""
+        name = 'meshTestRingAttach' + str(os.getpid())
+        shm = shared_memory.SharedMemory(name=name, create=True, size=ShmDataPos + 128) # ring header not yet initialized
+
+        def initRing():
+            ShmHeaderStruct.pack_into(shm.buf, ShmCapacityPos, 128)
+            ShmHeaderStruct.pack_into(shm.buf, ShmReadyPos, ShmReadyWord)
+        timer = threading.Timer(0.05, initRing)
+        timer.start()
+        ring = ShmRing(name, 64)
+        timer.join()
+        assert(ring.created == False)
+        assert(ring.capacity == 128) # capacity read from header
+
+        ring.close()
+        shm.close()
+        shm.unlink()
+
+    def test_writeRead(self):
+        """Test writing and reading messages in ring."""
+        assert(self.ring.peekMsg() == None)
+        msgs = [b'12345', b'', b'ABC']
+        for msg in msgs:
+            assert(self.ring.write(msg) == True)
+        for msg in msgs:
+            msgSpans = self.ring.peekMsg()
+            assert(b''.join(msgSpans) == msg)
+            self.ring.consumeMsg(len(msg))
+        assert(self.ring.bytesUsed() == 0)
+
+        # Message larger than free space
+        assert(self.ring.write(b'1'*61) == False)
+
+    def test_wrap(self):
+        """Test messages that wrap around end of ring."""
+        for i in range(10):
+            msg = bytes([i])*(20 + i)
+            assert(self.ring.write(msg) == True)
+            msgSpans = self.ring.peekMsg()
+            assert(b''.join(msgSpans) == msg)
+            self.ring.consumeMsg(len(msg))
+
+class TestShmRadio:
+    def setup_method(self, method):
+        self.nodeParams = NodeParams(configFile=configFilePath)
+        name = 'meshTestRadio' + str(os.getpid())
+        config = {'uartNumBytesToRead': self.nodeParams.config.uartNumBytesToRead, 'rxBufferSize': 2000, 'shmSize': 1024, 'wakeup': True}
+        self.radio = ShmRadio(dict(config, readName=name + 'Rd', writeName=name + 'Wr'))
+        self.radio2 = ShmRadio(dict(config, readName=name + 'Wr', writeName=name + 'Rd'))
+
+    def teardown_method(self, method):
+        self.radio2.close()
+        self.radio.close()
+        for path in self.radio.wakeupPaths:
+            os.remove(path)
+
+    def test_sendMsg(self):
+        """Test sending messages between radios."""
+        msgs = [b'12345', b'6789']
+        for msg in msgs:
+            assert(self.radio2.sendMsg(msg) == len(msg))
+        assert(self.radio.readBytes(False) == 9)
+        assert(self.radio.getRxBytes() == b'123456789')
+        assert([bytes(datagram) for datagram in self.radio.getRxDatagrams()] == msgs)
+
+        # Confirm other direction
+        self.radio.sendMsg(b'ABC')
+        self.radio2.readBytes(False)
+        assert(self.radio2.getRxBytes() == b'ABC')
+
+    def test_readBytesFullBuffer(self):
+        """Test that messages that do not fit in receive buffer remain in ring until the next read."""
+        self.radio.rxBufferSize = 10
+        self.radio.clearRxBuffer()
+        self.radio2.sendMsg(b'123456')
+        self.radio2.sendMsg(b'7890AB')
+        assert(self.radio.readBytes(False) == 6)
+        assert(self.radio.readBytes(False) == 6)
+        assert(self.radio.getRxBytes() == b'7890AB')
+
+    def test_txFull(self):
+        """Test that messages are dropped when tx ring is full."""
+        assert(self.radio2.sendMsg(b'1'*1100) == 0)
+        assert(self.radio2.txDropCount == 1)
+
+    def test_wakeup(self):
+        """Test that reader is signaled when messages are sent."""
+        assert(select.select([self.radio], [], [], 0)[0] == [])
+        self.radio2.sendMsg(b'12345')
+        assert(select.select([self.radio], [], [], 0)[0] == [self.radio])
+        self.radio.readBytes(False)
+        assert(select.select([self.radio], [], [], 0)[0] == [])
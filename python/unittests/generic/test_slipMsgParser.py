@@ -1,4 +1,5 @@
 from mesh.generic.msgParser import MsgParser
+from mesh.generic.slipMsgParser import SLIPMsgParser
 from mesh.generic.slipMsg import SLIPMsg
 from test_SLIPMsg import truthSLIPMsg, testMsg
 from mesh.generic.utilities import packData
@@ -15,7 +16,7 @@ class TestSLIPMsgParser:
         self.msgParser.parseSerialMsg(truthSLIPMsg, 0)
         assert(self.msgParser.msg.msgFound == True) # slip msg found
         assert(self.msgParser.msg.msgEnd != 1) # message end found
-        assert(self.msgParser.parsedMsgs == []) # message rejected      
+        assert(len(self.msgParser.parsedMsgs) == 0) # message rejected      
 
         # Check acceptance of message with valid CRC    
         crc = self.msgParser.msg.crc(testMsg)
@@ -27,7 +28,7 @@ class TestSLIPMsgParser:
         assert(self.msgParser.parsedMsgs[0] == testMsg) # message accepted  
         
         # Check that proper message end position is returned
-        self.msgParser.parsedMsgs = []
+        self.msgParser.parsedMsgs.clear()
         paddedMsg = slipMsg.encoded + b'989898'
         msgEnd = self.msgParser.parseSerialMsg(paddedMsg, 0)
         assert(self.msgParser.parsedMsgs[0] == testMsg)
@@ -39,3 +40,43 @@ class TestSLIPMsgParser:
         slipMsg.encodeMsg(testMsg)
         encodedMsg = self.msgParser.encodeMsg(testMsg)
         assert(encodedMsg == slipMsg.encoded)
+
+    def test_SLIPMsgParser(self):
+        """Test that SLIPMsgParser encodes and parses messages using the SLIP message format."""
+        msgParser = SLIPMsgParser({'parseMsgMax': 10})
+        encodedMsg = msgParser.encodeMsg(testMsg)
+        assert(encodedMsg == self.msgParser.encodeMsg(testMsg))
+        msgParser.parseMsgs(encodedMsg)
+        assert(list(msgParser.parsedMsgs) == [testMsg])
+
+    def test_parseMsgs(self):
+        """Test parseMsgs method of MsgParser with SLIPMsg."""
+        # Test parsing more messages than parseMsgMax
+        slipMsg = SLIPMsg(256)
+        msgs = []
+        rxBuffer = b''
+        for i in range(2*self.msgParser.parseMsgMax):
+            msgs.append(testMsg + bytes([i]))
+            slipMsg.encodeMsg(msgs[-1])
+            rxBuffer += slipMsg.encoded
+        self.msgParser.parseMsgs(rxBuffer)
+        assert(list(self.msgParser.parsedMsgs) == msgs)
+        self.msgParser.parsedMsgs.clear()
+
+        # Test parsing messages sharing END bytes and following a corrupted message
+        slipMsg.encodeMsg(testMsg)
+        rxBuffer = slipMsg.encoded[:-2] + slipMsg.encoded[-1:] + slipMsg.encoded[1:] + slipMsg.encoded[1:]
+        self.msgParser.validMsgCount = 0
+        self.msgParser.parseMsgs(rxBuffer)
+        assert(list(self.msgParser.parsedMsgs) == [testMsg, testMsg])
+        assert(self.msgParser.validMsgCount == 2)
+        assert(self.msgParser.corruptMsgCount == 1) # corrupt message counted
+        self.msgParser.parsedMsgs.clear()
+
+        # Test carry-over of partial message between buffers
+        rxBuffer = slipMsg.encoded + slipMsg.encoded
+        splitPos = len(slipMsg.encoded) + 3
+        self.msgParser.parseMsgs(rxBuffer[:splitPos])
+        assert(list(self.msgParser.parsedMsgs) == [testMsg])
+        self.msgParser.parseMsgs(rxBuffer[splitPos:])
+        assert(list(self.msgParser.parsedMsgs) == [testMsg, testMsg])
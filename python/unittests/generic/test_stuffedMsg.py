@@ -0,0 +1,99 @@
+from struct import pack
+from mesh.generic.stuffedMsg import StuffedMsg
+from mesh.generic.crc import CRC16
+
+END = pack('B', 192)
+ESC = pack('B', 219)
+ESC_END = pack('B', 220)
+ESC_ESC = pack('B', 221)
+escTable = {END: ESC_END, ESC: ESC_ESC}
+
+testMsg = b'123' + END + ESC + ESC_END + ESC + b'456'
+truthEncoded = END + b'123' + ESC + ESC_END + ESC + ESC_ESC + ESC_END + ESC + ESC_ESC + b'456' + END
+
+class TestStuffedMsg:
+
+    def setup_method(self, method):
+        self.stuffedMsg = StuffedMsg(256, END, ESC, escTable)
+
+    def test_encodeMsg(self):
+        """Test encodeMsg method of StuffedMsg."""
+        self.stuffedMsg.encodeMsg(testMsg)
+        assert(self.stuffedMsg.encoded == truthEncoded)
+
+        # Test empty message
+        self.stuffedMsg.encodeMsg(b'')
+        assert(self.stuffedMsg.encoded == truthEncoded) # unchanged
+
+    def test_encodedLength(self):
+        """Test encodedLength method of StuffedMsg."""
+        assert(self.stuffedMsg.encodedLength(testMsg) == len(truthEncoded))
+        assert(self.stuffedMsg.encodedLength(testMsg, 3) == len(truthEncoded) + 6) # extra bytes assumed escaped
+
+        # Test with CRC
+        self.stuffedMsg = StuffedMsg(256, END, ESC, escTable, CRC16, CRC16.length)
+        self.stuffedMsg.encodeMsg(testMsg)
+        assert(len(self.stuffedMsg.encoded) <= self.stuffedMsg.encodedLength(testMsg) <= self.stuffedMsg.maxEncodedLength(len(testMsg)))
+
+    def test_decodeMsg(self):
+        """Test decodeMsg method of StuffedMsg."""
+        # Test decoding with surrounding and repeated END bytes
+        inputMsg = b'987' + END + truthEncoded + b'654'
+        self.stuffedMsg.decodeMsg(inputMsg, 0)
+        assert(self.stuffedMsg.msgFound == True)
+        assert(self.stuffedMsg.msg == testMsg)
+        assert(self.stuffedMsg.msgLength == len(testMsg))
+        assert(self.stuffedMsg.msgEnd == len(inputMsg) - 4)
+
+        # Test decoding one byte at a time
+        self.stuffedMsg = StuffedMsg(256, END, ESC, escTable)
+        for i in range(len(truthEncoded)):
+            self.stuffedMsg.decodeMsg(truthEncoded[i:i+1], 0)
+        assert(self.stuffedMsg.msgEnd == 0)
+        assert(self.stuffedMsg.msg == testMsg)
+
+    def test_decodeMsgMaxLength(self):
+        """Test that messages exceeding maximum length are discarded."""
+        self.stuffedMsg = StuffedMsg(4, END, ESC, escTable)
+        self.stuffedMsg.encodeMsg(b'12345')
+        longMsg = self.stuffedMsg.encoded
+        self.stuffedMsg.encodeMsg(b'1234')
+        shortMsg = self.stuffedMsg.encoded
+
+        # Complete message too long
+        assert(self.stuffedMsg.parseMsg(longMsg + shortMsg, 0) == b'1234')
+        assert(self.stuffedMsg.msgEnd == len(longMsg + shortMsg) - 1)
+
+        # Partial message too long
+        self.stuffedMsg.resetMsg()
+        self.stuffedMsg.decodeMsg(longMsg[:-1], 0)
+        assert(self.stuffedMsg.msgFound == False)
+        assert(self.stuffedMsg.parseMsg(longMsg[-1:] + shortMsg, 0) == b'1234')
+
+    def test_decodeMsgView(self):
+        """Test that messages without escape sequences are returned as views into the raw data."""
+        self.stuffedMsg.encodeMsg(b'12345')
+        rawBytes = bytearray(self.stuffedMsg.encoded + b'678')
+        self.stuffedMsg.decodeMsg(rawBytes, 0)
+        assert(isinstance(self.stuffedMsg.msg, memoryview))
+        assert(self.stuffedMsg.msg == b'12345')
+
+        # Test that data beyond provided length is not parsed
+        self.stuffedMsg.resetMsg()
+        self.stuffedMsg.decodeMsg(rawBytes, 0, len(rawBytes) - 4)
+        assert(self.stuffedMsg.msgEnd == -1) # message end not within provided length
+        assert(self.stuffedMsg.msg == b'12345')
+
+    def test_decodeMsgCrc(self):
+        """Test CRC calculation while decoding partial messages."""
+        self.stuffedMsg = StuffedMsg(256, END, ESC, escTable, CRC16, 2)
+        self.stuffedMsg.encodeMsg(testMsg)
+        encoded = self.stuffedMsg.encoded
+        for i in range(len(encoded)):
+            self.stuffedMsg.decodeMsg(encoded[i:i+1], 0)
+        assert(self.stuffedMsg.getMsgCrc() == CRC16(testMsg)) # CRC computed during decoding
+
+        # Test batch parsing
+        validMsgs, numCorrupt = self.stuffedMsg.parseMsgs(encoded[:-3] + b'0' + encoded[-2:] + encoded)
+        assert(validMsgs == [testMsg])
+        assert(numCorrupt == 1)
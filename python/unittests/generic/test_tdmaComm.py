@@ -2,7 +2,8 @@ import serial, time, math, struct, copy
 from collections import deque
 from mesh.generic.command import Command
 from mesh.generic.meshController import MeshTxMsg
-from mesh.generic.tdmaComm import TDMAComm, TDMAMode, BLOCK_TX_MSG
+from mesh.generic.meshTxQueue import MeshMsgPriority
+from mesh.generic.tdmaComm import TDMAComm, TDMAMode, BLOCK_TX_MSG, AGGREGATED_MSG
 from mesh.generic.tdmaState import TDMABlockTxStatus, TDMAStatus
 from mesh.generic.tdmaCmdProcessor import TDMACmdProcessor
 from mesh.generic.blockTx import BlockTxPacketStatus
@@ -10,7 +11,9 @@ from mesh.generic.msgParser import MsgParser
 from mesh.generic.hdlcMsg import HDLCMsg
 from mesh.generic.radio import Radio, RadioMode
 from mesh.generic.nodeParams import NodeParams
+from mesh.generic.clockSource import SimClock
 from mesh.generic.nodeHeader import packHeader
+from mesh.generic.meshHeader import compactHeaderLength, packCompactHeader
 from mesh.generic.customExceptions import InvalidTDMASlotNumber
 from unittests.testConfig import configFilePath, testSerialPort
 from mesh.generic.cmds import TDMACmds
@@ -129,6 +132,153 @@ class TestTDMAComm:
         assert(len(packet) == packetHeaderLen + len(encodedCmd))
         assert(packet[packetHeaderLen:packetHeaderLen+len(encodedCmd)] == encodedCmd)
 
+    def test_packageMeshMsgs(self):
+        """Test packageMeshMsgs and splitMeshPayload methods of TDMAComm."""
+        packetHeaderLen = struct.calcsize(self.tdmaComm.meshPacketHeaderFormat)
+        destId = 5
+
+        # Test single message sent without aggregation
+        packet = self.tdmaComm.packageMeshMsgs(destId, [b'1234567890'])
+        packetHeader = struct.unpack(self.tdmaComm.meshPacketHeaderFormat, packet[0:packetHeaderLen])
+        assert(packetHeader[5] == 0)
+        assert(packet[packetHeaderLen:] == b'1234567890')
+
+        # Test multiple messages aggregated in single packet
+        msgs = [b'123', b'', b'4567890']
+        packet = self.tdmaComm.packageMeshMsgs(destId, msgs)
+        packetValid, packetHeader, adminBytes, messageBytes = self.tdmaComm.parseMeshPacket(packet)
+        assert(packetValid == True)
+        assert(packetHeader['statusByte'] == AGGREGATED_MSG)
+        assert(packetHeader['payloadLength'] == sum([len(msg) for msg in msgs]) + len(msgs)*self.tdmaComm.meshSubMsgLengthLen)
+        assert(self.tdmaComm.splitMeshPayload(messageBytes) == msgs)
+
+        # Test malformed payloads
+        assert(self.tdmaComm.splitMeshPayload(messageBytes[:-1]) == [])
+        assert(self.tdmaComm.splitMeshPayload(messageBytes + b'1') == [])
+
+        # Test aggregated messages separated on receipt
+        self.nodeParams.config.commConfig['recvAllMsgs'] = True
+        self.nodeParams.cmdHistory = deque(maxlen=100) # clear command history to prevent command rejection
+        self.tdmaComm.bufferTxMsg(packet)
+        self.tdmaComm.sendBuffer()
+        time.sleep(0.1)
+        self.tdmaComm.readMsgs()
+        self.tdmaComm.processMsgs()
+        assert(self.tdmaComm.hostBuffer == b''.join(msgs))
+
+    def test_compactMeshHeader(self):
+        """Test creation, parsing, and relay of mesh packets with compact header."""
+        self.nodeParams.config.commConfig['meshHeader'] = 'compact'
+        nodeId = self.nodeParams.config.nodeId
+        sourceId = nodeId + 1
+
+        # Test packet creation
+        packet = self.tdmaComm.createMeshPacket(3, b'12345', b'', sourceId)
+        assert(len(packet) == compactHeaderLength(0, 5) + 5)
+        assert(len(packet) < self.tdmaComm.meshHeaderLen + 5)
+        packetValid, packetHeader, adminBytes, messageBytes = self.tdmaComm.parseMeshPacket(packet)
+        assert(packetValid == True)
+        assert(packetHeader['sourceId'] == sourceId and packetHeader['destId'] == 3)
+        assert(packetHeader['packetId'] == (sourceId, self.tdmaComm.meshSeqNum))
+        assert(self.tdmaComm.meshSeqNum in self.tdmaComm.meshSeqHistory[sourceId])
+        assert(messageBytes == b'12345')
+
+        # Test 12-bit sequence numbers
+        self.nodeParams.config.commConfig['meshSeqNumBits'] = 12
+        packet = self.tdmaComm.createMeshPacket(0, b'12345', b'6789', sourceId, AGGREGATED_MSG)
+        packetValid, packetHeader, adminBytes, messageBytes = self.tdmaComm.parseMeshPacket(packet)
+        assert(packetValid == True)
+        assert(packetHeader['seqNum'] == self.tdmaComm.meshSeqNum)
+        assert(packetHeader['statusByte'] == AGGREGATED_MSG)
+        assert(adminBytes == b'6789' and messageBytes == b'12345')
+        assert(self.tdmaComm.parseMeshPacket(packet[:-1])[0] == False)
+
+        # Test relay records originating node
+        self.tdmaComm.cmdRelayBuffer = bytearray()
+        self.tdmaComm.relayMsg(bytearray(packet))
+        relayedPacket = bytes(self.tdmaComm.msgParser.msg.parseMsg(self.tdmaComm.cmdRelayBuffer, 0))
+        packetValid, relayedHeader, adminBytes, messageBytes = self.tdmaComm.parseMeshPacket(relayedPacket)
+        assert(packetValid == True)
+        assert(relayedHeader['sourceId'] == nodeId)
+        assert(relayedHeader['packetId'] == packetHeader['packetId'])
+        assert(messageBytes == b'12345')
+
+        # Test receipt of packets with both header formats
+        self.nodeParams.config.commConfig['recvAllMsgs'] = True
+        self.tdmaComm.bufferTxMsg(self.tdmaComm.createMeshPacket(3, b'123', b'', sourceId))
+        self.nodeParams.config.commConfig['meshHeader'] = 'standard'
+        self.tdmaComm.bufferTxMsg(self.tdmaComm.createMeshPacket(3, b'456', b'', sourceId))
+        self.tdmaComm.bufferTxMsg(relayedPacket) # duplicate of previously received packet
+        self.nodeParams.cmdHistory = deque(maxlen=100) # clear command history to prevent command rejection
+        self.tdmaComm.meshSeqHistory = {sourceId: deque([relayedHeader['seqNum']], maxlen=64)}
+        self.tdmaComm.sendBuffer()
+        time.sleep(0.1)
+        self.tdmaComm.readMsgs()
+        self.tdmaComm.processMsgs()
+        assert(self.tdmaComm.hostBuffer == b'123456')
+
+    def test_checkDuplicatePacket_seqWrap(self):
+        """Test duplicate rejection of compact header packets as sequence numbers wrap."""
+        self.nodeParams.config.commConfig['meshHeader'] = 'compact'
+        self.nodeParams.config.commConfig['meshSeqNumBits'] = 8
+        nodeId = self.nodeParams.config.nodeId
+
+        # Packets from multiple origins remain valid through several sequence wraps
+        for i in range(600):
+            for originId in [nodeId + 1, nodeId + 2]:
+                packet = packCompactHeader(originId, 0, 0, 0, i % 256)
+                packetValid, packetHeader, adminBytes, messageBytes = self.tdmaComm.parseMeshPacket(packet)
+                assert(packetValid == True)
+                assert(self.tdmaComm.checkDuplicatePacket(packetHeader) == False)
+                assert(self.tdmaComm.checkDuplicatePacket(packetHeader) == True) # repeat rejected
+
+        # Own packets ignored when relayed back after counter wraps
+        sourceId = nodeId + 3
+        for i in range(300):
+            packet = self.tdmaComm.createMeshPacket(0, b'123', b'', sourceId)
+            packetHeader = self.tdmaComm.parseMeshPacket(packet)[1]
+            assert(self.tdmaComm.checkDuplicatePacket(packetHeader) == True)
+        assert(len(self.tdmaComm.meshSeqHistory[sourceId]) == 64)
+
+    def test_sendMsgs_compactAggregated(self):
+        """Test filling transmit window exactly with aggregated messages using compact header with 8-bit sequence numbers."""
+        self.nodeParams.config.commConfig['meshHeader'] = 'compact'
+        self.nodeParams.config.commConfig['meshSeqNumBits'] = 8
+        self.nodeParams.config.commConfig['maxTransferSize'] = maxTransferSize = 200
+        self.nodeParams.config.commConfig['aggregateMsgs'] = True
+        self.tdmaComm.tdmaCmds = dict() # no admin data
+        self.tdmaComm.nodeParams.config.nodeId = 1
+        self.tdmaComm.meshSeqNum = 0
+        self.tdmaComm.setTDMAMode(TDMAMode.transmit)
+
+        # Status byte of aggregated packets included in header length
+        assert(self.tdmaComm.getMeshHeaderLength(0, 50, AGGREGATED_MSG) == self.tdmaComm.getMeshHeaderLength(0, 50) + 1)
+
+        # Size last message so that messages exactly fill transmit window
+        msgs = [MeshTxMsg(2, b'1'*20) for i in range(3)]
+        selected = []
+        totalLength = 0
+        for msg in msgs:
+            totalLength += self.tdmaComm.getMeshMsgLength(msg, selected)
+            selected.append(msg)
+        msgs[-1].msgBytes = b'1'*(20 + maxTransferSize - totalLength)
+        for msg in msgs:
+            self.tdmaComm.meshQueueIn.append(msg)
+        self.tdmaComm.sendMsgs()
+        assert(len(self.tdmaComm.meshQueueIn) == 0) # all messages sent
+
+        # Confirm single aggregated packet within transmit window
+        time.sleep(0.1)
+        self.tdmaComm.readBytes()
+        assert(self.tdmaComm.radio.bytesInRxBuffer <= maxTransferSize)
+        self.tdmaComm.parseMsgs()
+        packets = [self.tdmaComm.parseMeshPacket(msg) for msg in self.tdmaComm.msgParser.getMsgs()]
+        assert(len(packets) == 1)
+        packetValid, packetHeader, adminBytes, messageBytes = packets[0]
+        assert(packetHeader['statusByte'] == AGGREGATED_MSG)
+        assert(packetHeader['headerLength'] == self.tdmaComm.getMeshHeaderLength(0, len(messageBytes), AGGREGATED_MSG))
+        assert(self.tdmaComm.splitMeshPayload(messageBytes) == [msg.msgBytes for msg in msgs])
+
     def test_relayMsg(self):
         """Test relayMsg method of TDMAComm."""
         
@@ -402,6 +552,37 @@ class TestTDMAComm:
         self.tdmaComm.init(time.time())
         assert(self.tdmaComm.inited == True) # verify initMesh called
 
+    def test_buildFrameSchedule(self):
+        """Test buildFrameSchedule method of TDMAComm."""
+        comm = self.tdmaComm
+        schedule = comm.frameSchedule
+        assert(comm.frameScheduleTimes == sorted(comm.frameScheduleTimes))
+        assert(len(schedule) == 3 + 4*(comm.maxNumSlots-1) + 5) # transmit slot, receive slots, admin and sleep
+
+        # Transmit slot
+        assert(schedule[0] == (0.0, TDMAMode.init, 1, RadioMode.transmit))
+        assert(schedule[1] == (comm.beginTxTime, TDMAMode.transmit, 1, RadioMode.transmit))
+        assert(schedule[2] == (comm.endTxTime, TDMAMode.sleep, 1, RadioMode.sleep))
+
+        # Receive slot
+        assert(schedule[3] == (comm.slotLength, TDMAMode.init, 2, RadioMode.receive))
+        assert(schedule[4] == (comm.slotLength + comm.beginRxTime, TDMAMode.receive, 2, RadioMode.receive))
+        assert(schedule[6] == (comm.slotLength + comm.endRxTime, TDMAMode.sleep, 2, RadioMode.sleep))
+
+        # Admin and sleep periods
+        assert(schedule[-5] == (comm.cycleLength, TDMAMode.admin, comm.maxNumSlots, None))
+        assert(schedule[-1] == (comm.cycleLength + comm.adminLength, TDMAMode.sleep, comm.maxNumSlots, RadioMode.sleep))
+
+        # Lookup of schedule entries
+        assert(comm.getFrameEvent(0.5*comm.beginTxTime).mode == TDMAMode.init)
+        assert(comm.getFrameEvent(2.5*comm.slotLength).slotNum == 3)
+        assert(comm.getFrameEvent(comm.frameLength - 0.001).mode == TDMAMode.sleep)
+
+        # Schedule rebuilt when transmit slot changes
+        comm.transmitSlot = 2
+        assert(comm.getFrameEvent(comm.slotLength + comm.beginTxTime).mode == TDMAMode.transmit)
+        assert(comm.getFrameEvent(comm.beginTxTime).mode == TDMAMode.receive)
+
     def test_updateMode(self):
         """Test updateMode method of TDMAComm."""
         
@@ -442,6 +623,28 @@ class TestTDMAComm:
         self.tdmaComm.updateMode(self.tdmaComm.slotLength + self.tdmaComm.endRxTime + 0.001)
         assert(self.tdmaComm.tdmaMode == TDMAMode.sleep)    
     
+    def test_timingStats(self):
+        """Test TDMA timing instrumentation."""
+        # Mode change lateness recorded once per schedule boundary
+        self.tdmaComm.updateMode(self.tdmaComm.beginTxTime + 0.002)
+        self.tdmaComm.updateMode(self.tdmaComm.beginTxTime + 0.003)
+        stats = self.tdmaComm.timingStats['modeChangeLateness']
+        assert(stats.count == 1)
+        assert(abs(stats.maxRecorded - 0.002) < 1e-9)
+
+        # Sleep period statistics
+        self.tdmaComm.blockingSleep = False
+        self.tdmaComm.frameStartTime = time.time() - 0.9*self.tdmaComm.frameLength
+        self.tdmaComm.sleep()
+        snapshot = self.tdmaComm.getTimingSnapshot()
+        assert(snapshot['sleepProcessingDuration']['count'] == 1)
+        assert(snapshot['sleepRemaining']['count'] == 1)
+        assert(snapshot['sleepRemaining']['max'] < 0.1*self.tdmaComm.frameLength)
+
+        # Reset statistics
+        self.tdmaComm.resetTimingStats()
+        assert(all(stats['count'] == 0 for stats in self.tdmaComm.getTimingSnapshot().values()))
+
     def test_sleep(self):
         """Test sleep method of TDMAComm."""
         self.tdmaComm.maxNumSlots = 7
@@ -469,6 +672,51 @@ class TestTDMAComm:
         assert(meshPaths != self.tdmaComm.meshPaths) # meshPaths updated
          
 
+    def test_getNextEventTime(self):
+        """Test getNextEventTime method of TDMAComm."""
+        # Initialization
+        currentTime = 100.0
+        assert(self.tdmaComm.getNextEventTime(currentTime) == currentTime)
+        self.tdmaComm.initStartTime = currentTime
+        assert(self.tdmaComm.getNextEventTime(currentTime) == currentTime + self.tdmaComm.initTimeToWait)
+
+        # Slot events
+        self.tdmaComm.inited = True
+        self.tdmaComm.frameStartTime = currentTime
+        slotStart = currentTime + self.tdmaComm.slotLength
+        assert(self.tdmaComm.getNextEventTime(slotStart) == slotStart + self.tdmaComm.enableLength)
+        eventTime = slotStart + min(self.tdmaComm.rxReadTime, self.tdmaComm.beginTxTime)
+        assert(abs(self.tdmaComm.getNextEventTime(slotStart + self.tdmaComm.enableLength) - eventTime) < 1e-9)
+        assert(abs(self.tdmaComm.getNextEventTime(slotStart + self.tdmaComm.endRxTime) - (slotStart + self.tdmaComm.slotLength)) < 1e-9)
+
+        # Sleep period
+        sleepTime = currentTime + self.tdmaComm.cycleLength + self.tdmaComm.adminLength
+        assert(abs(self.tdmaComm.getNextEventTime(sleepTime) - (currentTime + self.tdmaComm.frameLength)) < 1e-9)
+
+        # Pending transmission
+        self.tdmaComm.tdmaMode = TDMAMode.transmit
+        self.tdmaComm.transmitComplete = False
+        assert(self.tdmaComm.getNextEventTime(slotStart) == slotStart)
+
+    def test_isReadPending(self):
+        """Test isReadPending method of TDMAComm."""
+        # Initialization
+        assert(self.tdmaComm.isReadPending() == True)
+
+        # Receive slot
+        self.tdmaComm.inited = True
+        self.tdmaComm.setTDMAMode(TDMAMode.receive)
+        self.tdmaComm.slotTime = self.tdmaComm.rxReadTime - 0.001
+        assert(self.tdmaComm.isReadPending() == False)
+        self.tdmaComm.slotTime = self.tdmaComm.rxReadTime
+        assert(self.tdmaComm.isReadPending() == True)
+        self.tdmaComm.receiveComplete = True
+        assert(self.tdmaComm.isReadPending() == False)
+
+        # Sleep
+        self.tdmaComm.setTDMAMode(TDMAMode.sleep)
+        assert(self.tdmaComm.isReadPending() == False)
+
     def test_sendTDMACmds(self):
         """Test sendTDMACmds method of TDMAComm."""
         maxLength = 1000
@@ -695,10 +943,10 @@ class TestTDMAComm:
         assert(len(self.tdmaComm.msgParser.parsedMsgs) == 1)
         packetHeader = struct.unpack('<BB', self.tdmaComm.msgParser.parsedMsgs[0][0:2])
         assert(packetHeader[1] == 0) # broadcast message
-        assert(encodedCmd in self.tdmaComm.msgParser.parsedMsgs[0]) # tdmaCmds included in message
+        assert(encodedCmd in bytes(self.tdmaComm.msgParser.parsedMsgs[0])) # tdmaCmds included in message
 
         # Test destination specific output
-        self.tdmaComm.msgParser.parsedMsgs = []
+        self.tdmaComm.msgParser.parsedMsgs.clear()
         self.nodeParams.config.commConfig['recvAllMsgs'] = True # receive all messages, regardless of dest
         msg1 = b'1234567890'
         msg1Dest = 3
@@ -720,6 +968,142 @@ class TestTDMAComm:
         assert(msg2Dest in destIds)
 
         # Test maximum transmit size limit
+        self.tdmaComm.msgParser.parsedMsgs.clear()
+        self.tdmaComm.radio.clearRxBuffer()
+        maxTransferSize = self.nodeParams.config.commConfig['maxTransferSize']
+        msgLength = 100
+        numMsgs = 2 * maxTransferSize // msgLength
+        for i in range(numMsgs):
+            self.tdmaComm.meshQueueIn.append(MeshTxMsg(2, b'1'*msgLength))
+        self.tdmaComm.sendMsgs()
+        numSent = self.tdmaComm.meshQueueIn.sentCount
+        assert(len(self.tdmaComm.meshQueueIn) > 0) # remaining messages retained for next transmit slot
+        assert(len(self.tdmaComm.meshQueueIn) + numSent == numMsgs + 2)
+        time.sleep(0.1)
+        self.tdmaComm.readBytes()
+        assert(self.tdmaComm.radio.bytesInRxBuffer <= maxTransferSize)
+
+        # Remaining messages sent in next transmit slot
+        self.tdmaComm.setTDMAMode(TDMAMode.sleep)
+        self.tdmaComm.setTDMAMode(TDMAMode.transmit)
+        while len(self.tdmaComm.meshQueueIn) > 0:
+            self.tdmaComm.sendMsgs()
+        assert(self.tdmaComm.meshQueueIn.sentCount == numMsgs + 2)
+
+        # Test message too large to ever be sent
+        self.tdmaComm.meshQueueIn.append(MeshTxMsg(2, b'1'*maxTransferSize))
+        self.tdmaComm.sendMsgs()
+        assert(len(self.tdmaComm.meshQueueIn) == 0)
+        assert(self.tdmaComm.meshQueueIn.getStatus()['dropped'][MeshMsgPriority.state] == 1)
+        time.sleep(0.1)
+        self.tdmaComm.radio.serial.read(5000)
+
+        # Test smaller messages sent in space left by message that does not fit
+        self.tdmaComm.setTDMAMode(TDMAMode.sleep)
+        self.tdmaComm.setTDMAMode(TDMAMode.transmit)
+        largeMsgLength = int(0.6 * maxTransferSize) # worst case encoded length exceeds transmit window
+        self.tdmaComm.meshQueueIn.append(MeshTxMsg(3, b'3'*largeMsgLength))
+        self.tdmaComm.meshQueueIn.append(MeshTxMsg(4, b'4'*largeMsgLength))
+        self.tdmaComm.meshQueueIn.append(MeshTxMsg(5, b'5'*10))
+        self.tdmaComm.sendMsgs()
+        assert([msg.destId for msg in self.tdmaComm.meshQueueIn] == [4])
+        time.sleep(0.1)
+        self.tdmaComm.radio.serial.read(5000)
+
+        # Test messages for same destination aggregated into single packet
+        self.nodeParams.config.commConfig['aggregateMsgs'] = True
+        self.tdmaComm.meshQueueIn.clear()
+        self.tdmaComm.tdmaCmds = dict() # no admin data
+        self.tdmaComm.setTDMAMode(TDMAMode.sleep)
+        self.tdmaComm.setTDMAMode(TDMAMode.transmit)
+        msgs = [b'123', b'456', b'789']
+        for msg in msgs:
+            self.tdmaComm.meshQueueIn.append(MeshTxMsg(2, msg))
+        self.tdmaComm.sendMsgs()
+        time.sleep(0.1)
+        self.tdmaComm.readBytes()
+        self.tdmaComm.parseMsgs()
+        packets = [self.tdmaComm.parseMeshPacket(msg) for msg in self.tdmaComm.msgParser.getMsgs()]
+        assert(len(packets) == 1)
+        assert(self.tdmaComm.splitMeshPayload(packets[0][3]) == msgs)
+
+        # Test aggregation disabled
+        self.nodeParams.config.commConfig['aggregateMsgs'] = False
+        self.tdmaComm.setTDMAMode(TDMAMode.sleep)
+        self.tdmaComm.setTDMAMode(TDMAMode.transmit)
+        self.tdmaComm.radio.clearRxBuffer()
+        for msg in msgs:
+            self.tdmaComm.meshQueueIn.append(MeshTxMsg(2, msg))
+        self.tdmaComm.sendMsgs()
+        time.sleep(0.1)
+        self.tdmaComm.readBytes()
+        self.tdmaComm.parseMsgs()
+        assert([bytes(self.tdmaComm.parseMeshPacket(msg)[3]) for msg in self.tdmaComm.msgParser.getMsgs()] == msgs)
+
+    def test_sendMsgs_paced(self):
+        """Test paced transmission of messages during transmit period."""
+        clock = SimClock(100.0)
+        self.nodeParams.clockSource = clock
+        self.radio.clockSource = clock
+        self.radio.txRate = 2000
+        self.radio.txFifoSize = 50
+        self.tdmaComm.inited = True
+        self.tdmaComm.frameStartTime = clock.getTime()
+        self.tdmaComm.slotStartTime = 0.0
+        self.tdmaComm.setTDMAMode(TDMAMode.transmit)
+
+        # Message sent in FIFO-sized pieces
+        self.tdmaComm.meshQueueIn.append(MeshTxMsg(2, b'1'*100))
+        self.tdmaComm.sendMsgs()
+        assert(self.tdmaComm.bytesSent == 50)
+        assert(self.tdmaComm.transmitComplete == False)
+        nextTime = self.tdmaComm.getNextEventTime(clock.getTime())
+        assert(abs(nextTime - (clock.getTime() + 0.025)) < 1e-9) # wait for FIFO to drain
+        while self.tdmaComm.transmitComplete == False and clock.getTime() < 100.0 + self.tdmaComm.endTxTime:
+            clock.advanceTo(self.tdmaComm.getNextEventTime(clock.getTime()))
+            self.tdmaComm.sendMsgs()
+        assert(self.tdmaComm.transmitComplete == True)
+        assert(self.radio.getTxCompleteTime() <= 100.0 + self.tdmaComm.endTxTime)
+        assert(self.tdmaComm.timingStats['txStartLateness'].count == 1) # recorded for first bytes only
+
+        # Verify complete packet received
+        time.sleep(0.1)
+        self.tdmaComm.readBytes()
+        self.tdmaComm.parseMsgs()
+        assert(len(self.tdmaComm.msgParser.parsedMsgs) == 1)
+        assert(bytes(self.tdmaComm.msgParser.parsedMsgs[0][-100:]) == b'1'*100)
+
+    def test_discardTxBytes(self):
+        """Test that paced bytes not sent by the end of a transmit period are discarded."""
+        clock = SimClock(100.0)
+        self.nodeParams.clockSource = clock
+        self.radio.clockSource = clock
+        self.radio.txRate = 2000
+        self.radio.txFifoSize = 50
+        self.tdmaComm.frameStartTime = clock.getTime()
+        self.tdmaComm.slotStartTime = 0.0
+
+        # Transmit slot
+        self.tdmaComm.setTDMAMode(TDMAMode.transmit)
+        self.tdmaComm.meshQueueIn.append(MeshTxMsg(2, b'1'*100))
+        self.tdmaComm.sendMsgs()
+        pendingBytes = self.radio.getTxPendingBytes()
+        assert(pendingBytes > 0)
+        self.tdmaComm.setTDMAMode(TDMAMode.sleep)
+        assert(self.radio.getTxPendingBytes() == 0)
+        assert(self.tdmaComm.txDiscardedBytes == pendingBytes)
+
+        # Admin period transmission continues until all bytes sent
+        clock.advanceTo(101.0)
+        self.tdmaComm.setTDMAMode(TDMAMode.admin)
+        self.tdmaComm.bufferTxMsg(b'2'*80)
+        self.tdmaComm.sendAdminBytes()
+        assert(self.tdmaComm.transmitComplete == False)
+        self.tdmaComm.setTDMAMode(TDMAMode.sleep)
+        assert(self.radio.getTxPendingBytes() == 0)
+        assert(self.tdmaComm.txDiscardedBytes > pendingBytes)
+        time.sleep(0.1)
+        self.radio.serial.read(5000)
 
     def test_sendMsgs_sendBroadcast(self):
         """Test that a broadcast message is sent if admin messages pending."""
@@ -0,0 +1,55 @@
+from mesh.generic.timingHistogram import TimingHistogram
+import math
+
+class TestTimingHistogram:
+    def setup_method(self, method):
+        self.histogram = TimingHistogram(minValue=1e-6, maxValue=1.0, subBuckets=4)
+
+    def test_getBucket(self):
+        """Test bucket selection for recorded values."""
+        for value in [1e-6, 1.3e-6, 3.7e-5, 0.0012, 0.5]:
+            lower, upper = self.histogram.getBucketBounds(self.histogram.getBucket(value))
+            assert(lower <= value < upper)
+            assert(upper / lower <= 1.25 + 1e-9) # bucket resolution
+        assert(self.histogram.getBucket(-0.1) == 0)
+        assert(self.histogram.getBucketBounds(0) == (-math.inf, 1e-6))
+
+    def test_record(self):
+        """Test recording of values."""
+        for value in [-0.001, 0.001, 0.002, 0.003, 5.0]:
+            self.histogram.record(value)
+        assert(self.histogram.count == 5)
+        assert(self.histogram.minRecorded == -0.001)
+        assert(self.histogram.maxRecorded == 5.0)
+        assert(self.histogram.counts[0] == 1) # below minimum value
+        assert(self.histogram.counts[-1] == 1) # above maximum value
+        assert(sum(self.histogram.counts) == 5)
+
+        # Reset
+        self.histogram.reset()
+        assert(self.histogram.count == 0 and sum(self.histogram.counts) == 0)
+        assert(self.histogram.minRecorded == None)
+
+    def test_getPercentile(self):
+        """Test percentile computation."""
+        assert(self.histogram.getPercentile(50) == None)
+        for i in range(1, 101):
+            self.histogram.record(i * 1e-4)
+        assert(abs(self.histogram.getPercentile(50) - 0.005) / 0.005 < 0.25)
+        assert(abs(self.histogram.getPercentile(99) - 0.0099) / 0.0099 < 0.25)
+        self.histogram.record(10.0)
+        assert(self.histogram.getPercentile(100) == 10.0) # overflow bucket returns maximum
+
+    def test_getSnapshot(self):
+        """Test snapshot of histogram statistics."""
+        self.histogram.record(0.001)
+        self.histogram.record(0.003)
+        snapshot = self.histogram.getSnapshot()
+        assert(snapshot['count'] == 2)
+        assert(abs(snapshot['mean'] - 0.002) < 1e-12)
+        assert(snapshot['min'] == 0.001 and snapshot['max'] == 0.003)
+
+        # Snapshot not affected by later values
+        self.histogram.record(0.005)
+        assert(sum(snapshot['counts']) == 2)
+        assert(self.histogram.getPercentile(100, snapshot['counts']) >= 0.003)
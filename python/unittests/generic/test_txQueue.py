@@ -0,0 +1,66 @@
+from mesh.generic.txQueue import TxQueue
+
+class TestTxQueue:
+    def setup_method(self, method):
+        self.txQueue = TxQueue()
+        self.frames = [b'12345', b'6789', b'ABCDEF']
+        for frame in self.frames:
+            self.txQueue.append(frame)
+
+    def test_append(self):
+        """Test append method of TxQueue."""
+        assert(len(self.txQueue) == 15)
+        assert(self.txQueue == b''.join(self.frames))
+
+        # Empty frames not queued
+        self.txQueue.append(b'')
+        assert(len(self.txQueue.frames) == 3)
+
+    def test_clear(self):
+        """Test clear method of TxQueue."""
+        self.txQueue.consume(2)
+        self.txQueue.clear()
+        assert(len(self.txQueue) == 0)
+        assert(self.txQueue.cursor == 0)
+        assert(not self.txQueue)
+
+    def test_getSpans(self):
+        """Test getSpans method of TxQueue."""
+        # All pending bytes
+        spans = self.txQueue.getSpans()
+        assert([bytes(span) for span in spans] == self.frames)
+
+        # Limited number of bytes
+        spans = self.txQueue.getSpans(7)
+        assert([bytes(span) for span in spans] == [b'12345', b'67'])
+
+        # Spans start at send cursor
+        self.txQueue.consume(3)
+        spans = self.txQueue.getSpans(4)
+        assert([bytes(span) for span in spans] == [b'45', b'67'])
+
+    def test_getBytes(self):
+        """Test getBytes method of TxQueue."""
+        assert(self.txQueue.getBytes() == b'123456789ABCDEF')
+        assert(self.txQueue.getBytes(3) == b'123')
+        assert(self.txQueue.getBytes(100) == b'123456789ABCDEF')
+
+    def test_consume(self):
+        """Test consume method of TxQueue."""
+        # Partial frame
+        self.txQueue.consume(2)
+        assert(self.txQueue.cursor == 2)
+        assert(len(self.txQueue) == 13)
+        assert(self.txQueue == b'3456789ABCDEF')
+
+        # Across frame boundary
+        self.txQueue.consume(5)
+        assert(len(self.txQueue.frames) == 2)
+        assert(self.txQueue.cursor == 2)
+        assert(self.txQueue == b'89ABCDEF')
+
+        # More than pending bytes
+        self.txQueue.consume(100)
+        assert(len(self.txQueue) == 0)
+        assert(len(self.txQueue.frames) == 0)
+        assert(self.txQueue.cursor == 0)
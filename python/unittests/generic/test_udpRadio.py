@@ -1,6 +1,7 @@
 import socket, time
 from mesh.generic.udpRadio import UDPRadio
 from mesh.generic.nodeParams import NodeParams
+from mesh.generic.clockSource import SimClock
 from unittests.testConfig import configFilePath
 from mesh.generic.customExceptions import NoSocket
 import pytest
@@ -22,11 +23,68 @@ class TestUDPRadio:
         serBytes = self.radio.getRxBytes()
         assert(serBytes == msgBytes)
         
+        # Write multiple datagrams and confirm all are read
+        datagrams = [b'1234', b'56', b'789']
+        for datagram in datagrams:
+            self.radio.sockWrite.sendto(datagram, (self.radio.sockWriteIp, self.radio.sockWritePort))
+        time.sleep(0.1)
+        assert(self.radio.readBytes(False) == 9)
+        assert(self.radio.getRxBytes() == b'123456789')
+        assert([bytes(datagram) for datagram in self.radio.getRxDatagrams()] == datagrams)
+
         # Test exception raising
         self.radio.sockRead = []
         with pytest.raises(NoSocket):
             self.radio.readBytes(False)
+
+    def test_readBytesFullBuffer(self):
+        """Test that datagrams that do not fit in receive buffer are retained until the next read."""
+        self.radio.rxBufferSize = 10
+        self.radio.clearRxBuffer()
+        for datagram in [b'123456', b'7890AB']:
+            self.radio.sockWrite.sendto(datagram, (self.radio.sockWriteIp, self.radio.sockWritePort))
+        time.sleep(0.1)
+        assert(self.radio.readBytes(False) == 6)
+        assert(self.radio.pendingDatagramLength == 6)
+        assert(self.radio.readBytes(False) == 6)
+        assert(self.radio.getRxBytes() == b'7890AB')
+
+    def test_consumeRxBytes(self):
+        """Test consumeRxBytes method of UDPRadio."""
+        for datagram in [b'1234', b'56', b'789']:
+            self.radio.bufferDatagram(datagram)
+        self.radio.consumeRxBytes(5)
+        assert([bytes(datagram) for datagram in self.radio.getRxDatagrams()] == [b'6', b'789'])
+        self.radio.consumeRxBytes(4)
+        assert(self.radio.getRxDatagrams() == [])
+
+    def test_sendBuffer(self):
+        """Test that sendBuffer method of UDPRadio sends each frame as a separate datagram."""
+        frames = [b'1234', b'56', b'789']
+        for frame in frames:
+            self.radio.bufferTxMsg(frame)
+        assert(self.radio.sendBuffer(7) == 6) # frames not split
+        assert(self.radio.getTxPendingBytes() == 3)
+        assert(self.radio.sendBuffer() == 3)
+        time.sleep(0.1)
+        self.radio.readBytes(False)
+        assert([bytes(datagram) for datagram in self.radio.getRxDatagrams()] == frames)
     
+    def test_sendBufferPaced(self):
+        """Test that paced frames larger than the transmit FIFO are dropped instead of stalling the transmit queue."""
+        self.radio.txRate = 100
+        self.radio.txFifoSize = 5
+        self.radio.clockSource = SimClock(10.0)
+        self.radio.txLevelTime = 10.0
+        for frame in [b'1234567', b'89']:
+            self.radio.bufferTxMsg(frame)
+        assert(self.radio.sendBuffer() == 2)
+        assert(self.radio.txDropCount == 1)
+        assert(self.radio.getTxPendingBytes() == 0)
+        time.sleep(0.1)
+        self.radio.readBytes(False)
+        assert([bytes(datagram) for datagram in self.radio.getRxDatagrams()] == [b'89'])
+
     def test_sendMsg(self):
         """Test sendMsg method of UDPRadio (using UDPRadio implementation of sendBytes)."""
         # Send test message
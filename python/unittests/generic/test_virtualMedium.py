@@ -0,0 +1,79 @@
+from mesh.generic.virtualMedium import VirtualMedium, fullGraph, ringGraph, gridGraph
+from mesh.generic.radio import Radio
+from mesh.generic.clockSource import SimClock
+
+class TestVirtualMedium:
+    def setup_method(self, method):
+        self.clock = SimClock()
+        self.medium = VirtualMedium(3, linkGraph=[[0, 1, 0], [1, 0, 1], [0, 1, 0]], baudrate=8000, bitsPerByte=8, propagationDelay=0.001, clockSource=self.clock)
+        self.radios = [Radio(self.medium.getPort(nodeId), {'uartNumBytesToRead': 2000, 'rxBufferSize': 2000}) for nodeId in range(1, 4)]
+
+    def test_transmit(self):
+        """Test delivery of transmitted bytes to linked nodes after airtime and propagation delay."""
+        msg = b'1234567890'
+        assert(self.radios[0].sendMsg(msg) == len(msg))
+
+        # Not received until transmission complete
+        self.clock.time = 0.010
+        assert(self.radios[1].readBytes(False) == 0)
+        self.clock.time = 0.011
+        assert(self.radios[1].readBytes(False) == len(msg))
+        assert(self.radios[1].getRxBytes() == msg)
+
+        # Not received by unlinked node or self
+        assert(self.radios[2].readBytes(False) == 0)
+        assert(self.radios[0].readBytes(False) == 0)
+        assert(self.medium.txBytes == [10, 0, 0])
+        assert(self.medium.rxBytes == [0, 10, 0])
+
+    def test_collision(self):
+        """Test that overlapping transmissions collide at receiver."""
+        self.radios[0].sendMsg(b'12345')
+        self.clock.time = 0.002
+        self.radios[2].sendMsg(b'67890')
+        self.clock.time = 1.0
+        assert(self.radios[1].readBytes(False) == 0)
+        assert(self.medium.collisionCount == 2)
+
+        # Non-overlapping transmissions received
+        self.radios[0].sendMsg(b'12345')
+        self.clock.time = 2.0
+        self.radios[2].sendMsg(b'67890')
+        self.clock.time = 3.0
+        self.radios[1].readBytes(False)
+        assert(self.radios[1].getRxBytes() == b'1234567890')
+
+    def test_halfDuplex(self):
+        """Test that node does not receive while transmitting."""
+        self.radios[0].sendMsg(b'12345')
+        self.radios[1].sendMsg(b'67890')
+        self.clock.time = 1.0
+        assert(self.radios[0].readBytes(False) == 0)
+        assert(self.radios[1].readBytes(False) == 0)
+
+    def test_lossRate(self):
+        """Test random loss of transmissions."""
+        self.medium.lossRate = 1.0
+        self.radios[0].sendMsg(b'12345')
+        self.clock.time = 1.0
+        assert(self.radios[1].readBytes(False) == 0)
+        assert(self.medium.lossCount == 1)
+
+    def test_bitErrorRate(self):
+        """Test random bit errors."""
+        self.medium.bitErrorRate = 0.01
+        msg = bytes(1000)
+        self.radios[0].sendMsg(msg)
+        self.clock.time = 10.0
+        self.radios[1].readBytes(False)
+        rxBytes = self.radios[1].getRxBytes()
+        numErrors = sum(bin(byte).count('1') for byte in rxBytes)
+        assert(numErrors == self.medium.bitErrorCount)
+        assert(20 < numErrors < 160) # expected 80 errors
+
+    def test_graphs(self):
+        """Test link graph generation."""
+        assert(fullGraph(3) == [[0, 1, 1], [1, 0, 1], [1, 1, 0]])
+        assert(ringGraph(4) == [[0, 1, 0, 1], [1, 0, 1, 0], [0, 1, 0, 1], [1, 0, 1, 0]])
+        grid = gridGraph(2, 2)
+        assert(grid == [[0, 1, 1, 0], [1, 0, 0, 1], [1, 0, 0, 1], [0, 1, 1, 0]])